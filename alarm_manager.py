@@ -1,21 +1,32 @@
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import os
-import pickle
+import time
+from alarm_store import AlarmStore, ONE_WEEK_MS
+from alarm_schedule import DAY_INDEX, alarm_fingerprint, diff_fingerprints, next_alarm_time, to_millis
+from platform_backend import get_platform, SimulatedPlatform
 
 class AlarmManager:
-    def __init__(self, app=None):
+    def __init__(self, app=None, platform=None, store=None):
         self.app = app
         self.alarms = {}  # class_id를 키로 사용
-        self.is_android = 'ANDROID_STORAGE' in os.environ
+        self._batch = None  # batch() 안에서 모아 둔 저장 작업
+        self.last_batch_stats = None
+        # 알람 예약/취소를 실제로 수행하는 플랫폼 (PC에서는 메모리 시뮬레이션)
+        self.platform = platform or get_platform()
+        self.is_android = self.platform.name == "android"
         
-        # 알람 파일 경로 설정
+        # 알람 저장소 (UI 프로세스와 서비스가 같은 DB 공유)
+        self.store = store or AlarmStore()
+        self.alarms_file = self.store.path
+        print(f"알람 저장소 경로: {self.alarms_file}")
+        
+        # 이전 버전의 pickle 알람 파일 경로 (1회 변환용)
         if self.is_android:
             android_data_dir = os.path.dirname(os.path.abspath(__file__))
-            self.alarms_file = os.path.join(android_data_dir, 'alarms.pkl')
-            print(f"Android 알람 파일 경로: {self.alarms_file}")
+            self.legacy_alarms_file = os.path.join(android_data_dir, 'alarms.pkl')
         else:
-            self.alarms_file = 'alarms.pkl'
-            print(f"PC 알람 파일 경로: {self.alarms_file}")
+            self.legacy_alarms_file = 'alarms.pkl'
         
         # Android 알람 관련 초기화
         if self.is_android:
@@ -25,59 +36,37 @@ class AlarmManager:
         self.load_alarms()
         
     def init_android_alarm(self):
-        """Android 알람 시스템 초기화"""
+        """Android 알람 시스템 초기화 - 실패하면 시뮬레이션 플랫폼으로 전환"""
         try:
-            from jnius import autoclass
-            
-            # Android 클래스들 미리 로드
-            self.Context = autoclass('android.content.Context')
-            self.PendingIntent = autoclass('android.app.PendingIntent')
-            self.Intent = autoclass('android.content.Intent')
-            self.ComponentName = autoclass('android.content.ComponentName')
-            self.Calendar = autoclass('java.util.Calendar')
-            self.AlarmManager = autoclass('android.app.AlarmManager')
-            self.PythonActivity = autoclass('org.kivy.android.PythonActivity')
-            
-            # 컨텍스트와 알람 매니저 가져오기
-            self.context = self.PythonActivity.mActivity.getApplicationContext()
-            self.alarm_service = self.context.getSystemService(self.Context.ALARM_SERVICE)
-            
-            # FLAG 값들
-            self.FLAG_IMMUTABLE = 67108864  # PendingIntent.FLAG_IMMUTABLE
-            self.FLAG_UPDATE_CURRENT = 134217728  # PendingIntent.FLAG_UPDATE_CURRENT
-            
+            # 알람 서비스를 미리 가져와서 사용 가능한지 확인
+            if self.platform.java.alarm_service() is None:
+                raise RuntimeError("AlarmManager 서비스를 가져올 수 없습니다")
             print("✅ Android 알람 시스템 초기화 완료")
             
         except Exception as e:
             print(f"❌ Android 알람 시스템 초기화 실패: {e}")
             import traceback
             traceback.print_exc()
+            self.platform = SimulatedPlatform(verbose=True)
             self.is_android = False
         
     def load_alarms(self):
         """저장된 알람 데이터 로드"""
         try:
-            if os.path.exists(self.alarms_file):
-                with open(self.alarms_file, 'rb') as f:
-                    self.alarms = pickle.load(f)
+            self.store.migrate_legacy_pickle(self.legacy_alarms_file)
+            self.alarms = self.store.load_all()
+            if self.alarms:
                 print(f"✅ 알람 {len(self.alarms)}개 로드됨")
             else:
                 print("📁 저장된 알람 데이터가 없습니다.")
-                self.alarms = {}
         except Exception as e:
             print(f"❌ 알람 로드 오류: {e}")
             self.alarms = {}
     
     def save_alarms(self):
-        """알람 데이터 저장"""
+        """알람 데이터 전체 저장 (개별 변경은 schedule/cancel에서 바로 기록됨)"""
         try:
-            # 디렉토리 생성 (필요한 경우)
-            alarm_dir = os.path.dirname(self.alarms_file)
-            if alarm_dir and not os.path.exists(alarm_dir):
-                os.makedirs(alarm_dir, exist_ok=True)
-            
-            with open(self.alarms_file, 'wb') as f:
-                pickle.dump(self.alarms, f)
+            self.store.replace_all(self.alarms)
             print(f"✅ 알람 {len(self.alarms)}개 저장됨")
             return True
         except Exception as e:
@@ -90,93 +79,29 @@ class AlarmManager:
             print("❌ 클래스 데이터가 없습니다.")
             return False
     
-        if not self.is_android:
-            print(f"💻 PC 환경: {class_data['name']} 알람 예약 시뮬레이션")
-            self.alarms[class_id] = {
-                'class_data': class_data,
-                'minutes_before': minutes_before,
-                'created_at': datetime.now().isoformat()
-            }
-            self.save_alarms()
-            return True
-    
         try:
-            # 요일 매핑
-            day_map = {
-                "Monday": self.Calendar.MONDAY,
-                "Tuesday": self.Calendar.TUESDAY,
-                "Wednesday": self.Calendar.WEDNESDAY,
-                "Thursday": self.Calendar.THURSDAY,
-                "Friday": self.Calendar.FRIDAY,
-                "월요일": self.Calendar.MONDAY,
-                "화요일": self.Calendar.TUESDAY,
-                "수요일": self.Calendar.WEDNESDAY,
-                "목요일": self.Calendar.THURSDAY,
-                "금요일": self.Calendar.FRIDAY
-            }
-    
             class_day = class_data['day']
-            if class_day not in day_map:
+            if class_day not in DAY_INDEX:
                 print(f"❌ 지원하지 않는 요일: {class_day}")
                 return False
-    
-            start_time = class_data['start_time']
-            hour, minute = map(int, start_time.split(':'))
-    
-            calendar = self.Calendar.getInstance()
-            current_time = int(datetime.now().timestamp() * 1000)
-            calendar.setTimeInMillis(current_time)
-    
-            calendar.set(self.Calendar.DAY_OF_WEEK, day_map[class_day])
-            calendar.set(self.Calendar.HOUR_OF_DAY, hour)
-            calendar.set(self.Calendar.MINUTE, minute - minutes_before)
-            calendar.set(self.Calendar.SECOND, 0)
-            calendar.set(self.Calendar.MILLISECOND, 0)
-    
-            alarm_time = calendar.getTimeInMillis()
-            
-            # 오직 지금보다 과거인 경우에만 다음 주로 넘김 (같은 시간은 허용)
-            if alarm_time < current_time:
-                calendar.add(self.Calendar.WEEK_OF_YEAR, 1)
-                alarm_time = calendar.getTimeInMillis()  # 다시 갱신
 
-    
-            # BroadcastReceiver를 정확히 지정
-            intent = self.Intent()
-            intent.setAction("org.kivy.skkutimetable.TIMETABLE_ALARM")
-            intent.setComponent(self.ComponentName(
-                "org.kivy.skkutimetable.doublecheck",
-                "org.kivy.skkutimetable.doublecheck.AlarmReceiver"
-            ))
-    
-            # 수업 정보 전달
-            intent.putExtra('class_id', str(class_id))
-            intent.putExtra('class_name', class_data['name'])
-            intent.putExtra('class_room', class_data['room'])
-            intent.putExtra('class_time', class_data['start_time'])
-            intent.putExtra('class_professor', class_data['professor'])
-            intent.putExtra('minutes_before', minutes_before)
+            # 앱/서비스와 같은 계산 사용 - 지금보다 과거인 경우에만 다음 주로 넘김 (같은 시간은 허용)
+            alarm_datetime = next_alarm_time(class_day, class_data['start_time'], minutes_before)
+            alarm_time = to_millis(alarm_datetime)
     
             alarm_id = int(class_id) if isinstance(class_id, (int, str)) else hash(str(class_id)) % 1000000
     
-            pending_intent = self.PendingIntent.getBroadcast(
-                self.context,
-                alarm_id,
-                intent,
-                self.FLAG_UPDATE_CURRENT | self.FLAG_IMMUTABLE
-            )
-    
-            alarm_time = calendar.getTimeInMillis()
-            one_week_millis = 7 * 24 * 60 * 60 * 1000
-    
-            self.alarm_service.setRepeating(
-                self.AlarmManager.RTC_WAKEUP,
-                alarm_time,
-                one_week_millis,
-                pending_intent
-            )
-    
-            alarm_datetime = datetime.fromtimestamp(alarm_time / 1000)
+            # 수업 정보를 담아 매주 반복 예약
+            self._count_platform_call()
+            self.platform.schedule_repeating(alarm_id, alarm_time, ONE_WEEK_MS, {
+                'class_id': str(class_id),
+                'class_name': class_data['name'],
+                'class_room': class_data['room'],
+                'class_time': class_data['start_time'],
+                'class_professor': class_data['professor'],
+                'minutes_before': minutes_before
+            })
+
             self.alarms[class_id] = {
                 'alarm_id': alarm_id,
                 'class_data': class_data,
@@ -185,11 +110,12 @@ class AlarmManager:
                 'next_alarm_datetime': alarm_datetime.isoformat(),
                 'created_at': datetime.now().isoformat()
             }
-            self.save_alarms()
-    
-            print(f"✅ 알람 예약 성공: {class_data['name']}")
-            print(f"📅 다음 알람 시간: {alarm_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"⏰ 수업 시작 {minutes_before}분 전 알림")
+            self._persist_put(class_id)
+
+            if self._batch is None:
+                print(f"✅ 알람 예약 성공: {class_data['name']}")
+                print(f"📅 다음 알람 시간: {alarm_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
+                print(f"⏰ 수업 시작 {minutes_before}분 전 알림")
             return True
     
         except Exception as e:
@@ -204,39 +130,24 @@ class AlarmManager:
         if class_id not in self.alarms:
             print(f"⚠️ 알람 ID {class_id}를 찾을 수 없습니다.")
             return False
-        
-        if not self.is_android:
-            print(f"💻 PC 환경: 클래스 {class_id} 알람 취소 시뮬레이션")
-            del self.alarms[class_id]
-            self.save_alarms()
-            return True
             
         try:
             # 알람 정보 가져오기
             alarm_info = self.alarms[class_id]
-            alarm_id = alarm_info['alarm_id']
-            
-            # 인텐트 생성 (취소용)
-            intent = self.Intent()
-            intent.setAction("org.kivy.skkutimetable.TIMETABLE_ALARM")
-            
-            # PendingIntent 생성 (취소용)
-            pending_intent = self.PendingIntent.getBroadcast(
-                self.context, 
-                alarm_id, 
-                intent, 
-                self.FLAG_UPDATE_CURRENT | self.FLAG_IMMUTABLE
-            )
-            
-            # 알람 취소
-            self.alarm_service.cancel(pending_intent)
+            alarm_id = alarm_info.get('alarm_id')
             
+            # 예약된 반복 알람 취소 (예약 시와 같은 인텐트로 찾음)
+            if alarm_id is not None:
+                self._count_platform_call()
+                self.platform.cancel_alarm(alarm_id)
+
             # 알람 정보 삭제
             class_name = alarm_info['class_data']['name']
             del self.alarms[class_id]
-            self.save_alarms()
-            
-            print(f"✅ 알람 취소 성공: {class_name} (ID: {alarm_id})")
+            self._persist_delete(class_id)
+
+            if self._batch is None:
+                print(f"✅ 알람 취소 성공: {class_name} (ID: {alarm_id})")
             return True
             
         except Exception as e:
@@ -245,6 +156,144 @@ class AlarmManager:
             traceback.print_exc()
             return False
     
+    # ---- 일괄 처리 ----
+
+    def _count_platform_call(self):
+        if self._batch is not None:
+            self._batch['platform_calls'] += 1
+
+    def _persist_put(self, class_id):
+        """알람 저장 - batch() 안이면 끝날 때 한 번에 저장"""
+        if self._batch is None:
+            self.store.put(class_id, self.alarms[class_id])
+            return
+        self._batch['deletes'].discard(class_id)
+        self._batch['puts'].add(class_id)
+        if class_id in self._batch['updating']:
+            # update_alarm의 취소 + 재예약은 갱신 한 번으로 집계
+            self._batch['updating'].discard(class_id)
+            self._batch['updated'] += 1
+        else:
+            self._batch['scheduled'] += 1
+
+    def _persist_delete(self, class_id):
+        """알람 삭제 - batch() 안이면 끝날 때 한 번에 저장"""
+        if self._batch is None:
+            self.store.delete(class_id)
+            return
+        self._batch['puts'].discard(class_id)
+        self._batch['deletes'].add(class_id)
+        if class_id not in self._batch['updating']:
+            self._batch['cancelled'] += 1
+
+    @contextmanager
+    def batch(self):
+        """여러 예약/취소를 모아 두었다가 저장소에는 끝날 때 한 번만 기록
+
+        with alarm_manager.batch():
+            alarm_manager.cancel_alarm(...)
+            alarm_manager.schedule_alarm(...)
+        """
+        if self._batch is not None:
+            # 중첩된 batch는 바깥 batch에 합침
+            yield self._batch
+            return
+
+        self._batch = {
+            'puts': set(),
+            'deletes': set(),
+            'updating': set(),
+            'scheduled': 0,
+            'updated': 0,
+            'cancelled': 0,
+            'platform_calls': 0,
+            'started': time.perf_counter()
+        }
+        try:
+            yield self._batch
+        finally:
+            batch, self._batch = self._batch, None
+            platform_ms = (time.perf_counter() - batch['started']) * 1000
+
+            # 예약/취소는 이미 플랫폼에 반영되었으므로 중간에 오류가 나도 저장은 진행
+            store_started = time.perf_counter()
+            store_writes = 0
+            try:
+                # 삭제와 추가/수정을 한 트랜잭션으로 기록 - 서비스가 중간 상태를 읽지 않고 신호도 한 번
+                puts = {class_id: self.alarms[class_id] for class_id in batch['puts'] if class_id in self.alarms}
+                if puts or batch['deletes']:
+                    self.store.apply(puts, batch['deletes'])
+                    store_writes = 1
+            except Exception as e:
+                print(f"❌ 알람 일괄 저장 오류: {e}")
+            store_ms = (time.perf_counter() - store_started) * 1000
+
+            self.last_batch_stats = {
+                'scheduled': batch['scheduled'],
+                'updated': batch['updated'],
+                'cancelled': batch['cancelled'],
+                'platform_calls': batch['platform_calls'],
+                'store_writes': store_writes,
+                'platform_ms': platform_ms,
+                'store_ms': store_ms
+            }
+            print(f"📦 알람 일괄 처리: 예약 {batch['scheduled']}개, 변경 {batch['updated']}개, "
+                  f"취소 {batch['cancelled']}개, "
+                  f"플랫폼 호출 {batch['platform_calls']}회 ({platform_ms:.1f}ms), "
+                  f"저장 {store_writes}회 ({store_ms:.1f}ms)")
+
+    def schedule_many(self, classes, minutes_before=5):
+        """여러 수업 알람을 한 번에 예약 (저장은 한 번)
+
+        classes는 {class_id: class_data} 또는 (class_id, class_data) 목록이며,
+        class_data에 notify_before가 있으면 minutes_before 대신 사용한다.
+        """
+        items = classes.items() if isinstance(classes, dict) else classes
+        scheduled_count = 0
+        with self.batch():
+            for class_id, class_data in items:
+                notify_before = class_data.get('notify_before', minutes_before)
+                if self.schedule_alarm(class_id, class_data, notify_before):
+                    scheduled_count += 1
+        return scheduled_count
+
+    def cancel_many(self, class_ids):
+        """여러 수업 알람을 한 번에 취소 (저장은 한 번, 없는 ID는 건너뜀)"""
+        cancelled_count = 0
+        with self.batch():
+            for class_id in list(class_ids):
+                if class_id in self.alarms and self.cancel_alarm(class_id):
+                    cancelled_count += 1
+        return cancelled_count
+
+    def reconcile(self, classes, minutes_before=5):
+        """시간표와 저장된 알람을 비교해 달라진 알람만 예약/갱신/취소
+
+        classes는 {class_id: class_data}이며, 알람 관련 필드(요일, 시작 시간, 알림 시간 등)의
+        해시가 같으면 건너뛴다. 결과 개수 dict 반환.
+        """
+        desired = {
+            class_id: alarm_fingerprint(class_data, class_data.get('notify_before', minutes_before))
+            for class_id, class_data in classes.items()
+        }
+        current = {
+            class_id: alarm_fingerprint(alarm_info.get('class_data', {}), alarm_info.get('minutes_before', 5))
+            for class_id, alarm_info in self.alarms.items()
+        }
+        added, changed, removed, unchanged = diff_fingerprints(desired, current)
+
+        if added or changed or removed:
+            with self.batch():
+                self.cancel_many(removed)
+                for class_id in added + changed:
+                    class_data = classes[class_id]
+                    self.update_alarm(class_id, class_data, class_data.get('notify_before', minutes_before))
+
+        result = {'added': len(added), 'updated': len(changed), 'removed': len(removed), 'unchanged': unchanged}
+        print(f"🔁 알람 동기화: 추가 {result['added']}개, 변경 {result['updated']}개, "
+              f"취소 {result['removed']}개, 유지 {result['unchanged']}개")
+        return result
+
     def schedule_class_alarm(self, class_id, name, day, start_time, room, professor, minutes_before):
         """편의 메서드: 클래스 정보로 알람 예약"""
         class_data = {
@@ -286,24 +335,28 @@ class AlarmManager:
             return True
         
         alarm_count = len(self.alarms)
-        cancelled_count = 0
-        
-        # 모든 알람 취소
-        for class_id in list(self.alarms.keys()):
-            if self.cancel_alarm(class_id):
-                cancelled_count += 1
-        
+
+        # 모든 알람 취소 (저장은 한 번만)
+        cancelled_count = self.cancel_many(list(self.alarms.keys()))
+
         print(f"✅ {cancelled_count}/{alarm_count}개 알람 취소 완료")
         return cancelled_count == alarm_count
     
     def update_alarm(self, class_id, class_data, minutes_before=5):
         """알람 업데이트 (기존 알람 취소 후 새로 생성)"""
-        # 기존 알람 취소
-        if class_id in self.alarms:
-            self.cancel_alarm(class_id)
-        
-        # 새 알람 생성
-        return self.schedule_alarm(class_id, class_data, minutes_before)
+        with self.batch() as batch:
+            # 기존 알람 취소
+            if class_id in self.alarms:
+                batch['updating'].add(class_id)
+                self.cancel_alarm(class_id)
+
+            # 새 알람 생성
+            scheduled = self.schedule_alarm(class_id, class_data, minutes_before)
+            if class_id in batch['updating']:
+                # 재예약에 실패했으면 취소로 집계
+                batch['updating'].discard(class_id)
+                batch['cancelled'] += 1
+            return scheduled
     
     def get_alarm_info(self, class_id):
         """특정 알람 정보 반환"""
@@ -0,0 +1,201 @@
+import hashlib
+import heapq
+import itertools
+from datetime import datetime, timedelta
+
+# 영어/한글 요일 이름 → weekday (월=0 ... 일=6)
+DAY_INDEX = {
+    "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
+    "Friday": 4, "Saturday": 5, "Sunday": 6,
+    "월요일": 0, "화요일": 1, "수요일": 2, "목요일": 3,
+    "금요일": 4, "토요일": 5, "일요일": 6,
+    "월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6,
+}
+
+
+def parse_hhmm(time_str):
+    """"HH:MM" → (hour, minute)"""
+    hour, minute = map(int, time_str.split(':'))
+    return hour, minute
+
+
+def next_class_time(day, start_time, now=None):
+    """now 이후(초과) 가장 가까운 수업 시작 시각 - 없으면 None
+
+    날짜 단위로 더한 뒤 시각을 붙이므로 서머타임 전환이 있어도 벽시계 시각이 유지된다.
+    """
+    weekday = DAY_INDEX.get(day)
+    if weekday is None or not start_time:
+        return None
+    now = now or datetime.now()
+    hour, minute = parse_hhmm(start_time)
+
+    days_ahead = (weekday - now.weekday()) % 7
+    target_date = now.date() + timedelta(days=days_ahead)
+    class_time = datetime.combine(target_date, datetime.min.time()).replace(hour=hour, minute=minute)
+    if class_time <= now:
+        class_time = datetime.combine(target_date + timedelta(days=7), class_time.time())
+    return class_time
+
+
+def next_alarm_time(day, start_time, notify_before=5, now=None):
+    """now 이후(같은 시각 포함) 가장 가까운 알람 시각 - 수업 시작 notify_before분 전
+
+    수업이 곧 시작해서 이번 주 알람 시각이 이미 지났다면 다음 주 알람을 돌려준다.
+    """
+    weekday = DAY_INDEX.get(day)
+    if weekday is None or not start_time:
+        return None
+    now = now or datetime.now()
+    hour, minute = parse_hhmm(start_time)
+    notify_before = int(notify_before or 0)
+
+    # 이번 주 수업 날짜부터 시작해 알람 시각이 now 이후가 될 때까지 주 단위로 이동
+    days_ahead = (weekday - now.weekday()) % 7
+    class_date = now.date() + timedelta(days=days_ahead) - timedelta(days=7)
+    for _ in range(3):
+        class_time = datetime.combine(class_date, datetime.min.time()).replace(hour=hour, minute=minute)
+        alarm_time = class_time - timedelta(minutes=notify_before)
+        if alarm_time >= now:
+            return alarm_time
+        class_date += timedelta(days=7)
+    return None
+
+
+def to_millis(dt):
+    """로컬 datetime → epoch 밀리초"""
+    return int(dt.timestamp() * 1000)
+
+
+# 알람 예약/알림 내용에 영향을 주는 수업 필드
+ALARM_FIELDS = ('day', 'start_time', 'name', 'room', 'professor')
+
+
+def alarm_fingerprint(class_data, notify_before=5):
+    """알람에 관련된 필드만으로 만든 해시 - 같으면 다시 예약할 필요 없음"""
+    values = [str(class_data.get(field) or '') for field in ALARM_FIELDS]
+    values.append(str(int(notify_before or 0)))
+    return hashlib.sha1('\x1f'.join(values).encode('utf-8')).hexdigest()
+
+
+def diff_fingerprints(desired, current):
+    """{id: fingerprint} 두 개를 비교해 (추가, 변경, 삭제, 그대로) ID 목록 반환"""
+    added = [alarm_id for alarm_id in desired if alarm_id not in current]
+    changed = [alarm_id for alarm_id in desired
+               if alarm_id in current and desired[alarm_id] != current[alarm_id]]
+    removed = [alarm_id for alarm_id in current if alarm_id not in desired]
+    unchanged = len(desired) - len(added) - len(changed)
+    return added, changed, removed, unchanged
+
+
+class RecurringAlarmQueue:
+    """매주 반복 알람의 우선순위 큐
+
+    add/remove/reschedule은 O(log n), next_due는 O(1) (삭제된 항목은 꺼낼 때 정리).
+    """
+
+    def __init__(self):
+        self._heap = []  # [fire_time, seq, alarm_id, active]
+        self._entries = {}  # alarm_id → entry dict
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, alarm_id):
+        return alarm_id in self._entries
+
+    def get(self, alarm_id):
+        """등록된 알람 정보 (day, start_time, notify_before, payload, fingerprint, fire_time)"""
+        return self._entries.get(alarm_id)
+
+    def add(self, alarm_id, day, start_time, notify_before=5, payload=None, now=None, fingerprint=None):
+        """알람 등록 (이미 있으면 교체) - 다음 알람 시각 반환"""
+        self._deactivate(alarm_id)
+        entry = {
+            'id': alarm_id,
+            'day': day,
+            'start_time': start_time,
+            'notify_before': notify_before,
+            'payload': payload,
+            'fingerprint': fingerprint,
+            'fire_time': None,
+            'heap_item': None
+        }
+        self._entries[alarm_id] = entry
+        return self.reschedule(alarm_id, now=now)
+
+    def remove(self, alarm_id):
+        """알람 삭제"""
+        if alarm_id not in self._entries:
+            return False
+        self._deactivate(alarm_id)
+        del self._entries[alarm_id]
+        return True
+
+    def clear(self):
+        self._heap = []
+        self._entries = {}
+
+    def fingerprints(self):
+        """{alarm_id: fingerprint} - 변경 비교용"""
+        return {alarm_id: entry['fingerprint'] for alarm_id, entry in self._entries.items()}
+
+    def reschedule(self, alarm_id, now=None, retry_at=None):
+        """다음 알람 시각으로 다시 예약 (retry_at을 주면 그 시각에 한 번 재시도)"""
+        entry = self._entries.get(alarm_id)
+        if entry is None:
+            return None
+        self._deactivate(alarm_id)
+
+        if retry_at is not None:
+            fire_time = retry_at
+        else:
+            now = now or datetime.now()
+            # 방금 울린 알람이 같은 시각으로 다시 잡히지 않도록 직전 시각 이후로 계산
+            if entry['fire_time'] is not None and entry['fire_time'] >= now:
+                now = entry['fire_time'] + timedelta(seconds=1)
+            fire_time = next_alarm_time(entry['day'], entry['start_time'], entry['notify_before'], now)
+        entry['fire_time'] = fire_time
+        if fire_time is None:
+            return None
+
+        item = [fire_time, next(self._counter), alarm_id, True]
+        entry['heap_item'] = item
+        heapq.heappush(self._heap, item)
+        return fire_time
+
+    def _deactivate(self, alarm_id):
+        entry = self._entries.get(alarm_id)
+        if entry is not None and entry['heap_item'] is not None:
+            entry['heap_item'][3] = False
+            entry['heap_item'] = None
+
+    def _discard_inactive(self):
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+    def next_due(self):
+        """가장 빨리 울릴 알람 (fire_time, alarm_id, payload) - 없으면 None"""
+        self._discard_inactive()
+        if not self._heap:
+            return None
+        fire_time, _, alarm_id, _ = self._heap[0]
+        return fire_time, alarm_id, self._entries[alarm_id]['payload']
+
+    def pop_due(self, now=None):
+        """now까지 울려야 하는 알람을 꺼내 [(alarm_id, fire_time, payload)] 반환
+
+        꺼낸 알람은 등록 상태로 남으며, reschedule(alarm_id)로 다음 주 알람을 예약한다.
+        """
+        now = now or datetime.now()
+        due = []
+        while True:
+            self._discard_inactive()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            fire_time, _, alarm_id, _ = heapq.heappop(self._heap)
+            entry = self._entries[alarm_id]
+            entry['heap_item'] = None
+            due.append((alarm_id, fire_time, entry['payload']))
+        return due
@@ -0,0 +1,252 @@
+import os
+import socket
+import sqlite3
+from datetime import datetime
+
+# UI 프로세스와 백그라운드 서비스가 함께 쓰는 알람 저장소
+# 두 프로세스 모두 이 모듈 위치(앱 디렉토리)를 기준으로 같은 파일을 사용한다.
+ALARM_DB_NAME = "alarms.db"
+LEGACY_PICKLE_NAME = "alarms.pkl"
+SCHEMA_VERSION = 1
+
+ONE_WEEK_MS = 7 * 24 * 60 * 60 * 1000
+
+# 알람이 바뀌었을 때 서비스를 깨우는 로컬 UDP 신호
+ALARM_SIGNAL_ADDR = ("127.0.0.1", 47291)
+
+# class_data 중 알람에 필요한 필드만 저장
+CLASS_FIELDS = ('name', 'day', 'start_time', 'end_time', 'room', 'professor')
+
+
+def get_alarm_store_path():
+    """공유 알람 DB 경로"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), ALARM_DB_NAME)
+
+
+class AlarmStore:
+    """스키마 버전이 있는 SQLite 알람 테이블
+
+    next_fire_ms 인덱스로 다음 알람만 조회할 수 있어서
+    서비스가 전체 알람을 역직렬화하지 않아도 된다.
+    """
+
+    def __init__(self, path=None, notify=True):
+        self.path = path or get_alarm_store_path()
+        self.notify = notify  # 쓰기 후 서비스에 변경 신호 전송 여부
+        self._signal_socket = None
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        # 다른 프로세스가 쓰는 중이면 잠시 기다림
+        self._conn = sqlite3.connect(self.path, timeout=5.0)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS alarms (
+                    class_id TEXT PRIMARY KEY,
+                    alarm_id INTEGER,
+                    name TEXT,
+                    day TEXT,
+                    start_time TEXT,
+                    end_time TEXT,
+                    room TEXT,
+                    professor TEXT,
+                    minutes_before INTEGER NOT NULL DEFAULT 5,
+                    next_fire_ms INTEGER,
+                    created_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_alarms_next_fire ON alarms(next_fire_ms);
+            """)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # ---- 변환 ----
+
+    @staticmethod
+    def _record_to_row(class_id, alarm_info):
+        class_data = alarm_info.get('class_data', {})
+        return (
+            str(class_id),
+            alarm_info.get('alarm_id'),
+            class_data.get('name'),
+            class_data.get('day'),
+            class_data.get('start_time'),
+            class_data.get('end_time'),
+            class_data.get('room'),
+            class_data.get('professor'),
+            alarm_info.get('minutes_before', 5),
+            alarm_info.get('next_alarm_time'),
+            alarm_info.get('created_at', datetime.now().isoformat())
+        )
+
+    @staticmethod
+    def _row_to_record(row):
+        """DB 행 → AlarmManager.alarms 형식의 dict"""
+        class_data = {field: row[field] for field in CLASS_FIELDS}
+        record = {
+            'class_data': class_data,
+            'minutes_before': row['minutes_before'],
+            'created_at': row['created_at']
+        }
+        if row['alarm_id'] is not None:
+            record['alarm_id'] = row['alarm_id']
+        if row['next_fire_ms'] is not None:
+            record['next_alarm_time'] = row['next_fire_ms']
+            record['next_alarm_datetime'] = datetime.fromtimestamp(row['next_fire_ms'] / 1000).isoformat()
+        return record
+
+    @staticmethod
+    def _restore_key(class_id):
+        """저장된 문자열 ID를 원래 정수 ID로 복원 (가능한 경우)"""
+        try:
+            return int(class_id)
+        except (TypeError, ValueError):
+            return class_id
+
+    # ---- 쓰기 ----
+
+    def put(self, class_id, alarm_info):
+        """알람 한 개 추가/수정"""
+        self.put_many({class_id: alarm_info})
+
+    def put_many(self, alarms):
+        """여러 알람을 한 트랜잭션으로 추가/수정"""
+        rows = [self._record_to_row(class_id, alarm_info) for class_id, alarm_info in alarms.items()]
+        if not rows:
+            return
+        with self._conn:
+            self._conn.executemany("""
+                INSERT OR REPLACE INTO alarms (class_id, alarm_id, name, day, start_time, end_time,
+                                               room, professor, minutes_before, next_fire_ms, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        self._notify_change()
+
+    def delete(self, class_id):
+        self.delete_many([class_id])
+
+    def delete_many(self, class_ids):
+        ids = [(str(class_id),) for class_id in class_ids]
+        if not ids:
+            return
+        with self._conn:
+            self._conn.executemany("DELETE FROM alarms WHERE class_id = ?", ids)
+        self._notify_change()
+
+    def apply(self, puts=None, deletes=()):
+        """추가/수정과 삭제를 한 트랜잭션으로 기록하고 변경 신호는 한 번만 보냄"""
+        rows = [self._record_to_row(class_id, alarm_info) for class_id, alarm_info in (puts or {}).items()]
+        ids = [(str(class_id),) for class_id in deletes]
+        if not rows and not ids:
+            return
+        with self._conn:
+            if ids:
+                self._conn.executemany("DELETE FROM alarms WHERE class_id = ?", ids)
+            if rows:
+                self._conn.executemany("""
+                    INSERT OR REPLACE INTO alarms (class_id, alarm_id, name, day, start_time, end_time,
+                                                   room, professor, minutes_before, next_fire_ms, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+        self._notify_change()
+
+    def replace_all(self, alarms):
+        """알람 전체를 주어진 dict로 교체"""
+        with self._conn:
+            self._conn.execute("DELETE FROM alarms")
+            self._conn.executemany("""
+                INSERT INTO alarms (class_id, alarm_id, name, day, start_time, end_time,
+                                    room, professor, minutes_before, next_fire_ms, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [self._record_to_row(class_id, alarm_info) for class_id, alarm_info in alarms.items()])
+        self._notify_change()
+
+    def set_next_fire(self, class_id, next_fire_ms):
+        """다음 알람 시간만 갱신"""
+        with self._conn:
+            self._conn.execute("UPDATE alarms SET next_fire_ms = ? WHERE class_id = ?",
+                               (next_fire_ms, str(class_id)))
+        self._notify_change()
+
+    def _notify_change(self):
+        """서비스에 알람 변경 신호 전송 (서비스가 없으면 조용히 무시)"""
+        if not self.notify:
+            return
+        try:
+            if self._signal_socket is None:
+                self._signal_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._signal_socket.setblocking(False)
+            self._signal_socket.sendto(b"alarms-changed", ALARM_SIGNAL_ADDR)
+        except OSError:
+            pass
+
+    # ---- 읽기 ----
+
+    def load_all(self):
+        """전체 알람을 AlarmManager.alarms 형식으로 반환"""
+        rows = self._conn.execute("SELECT * FROM alarms")
+        return {self._restore_key(row['class_id']): self._row_to_record(row) for row in rows}
+
+    def get(self, class_id):
+        row = self._conn.execute("SELECT * FROM alarms WHERE class_id = ?", (str(class_id),)).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM alarms").fetchone()[0]
+
+    def next_due(self):
+        """가장 빨리 울릴 알람 (class_id, record) - 없으면 None"""
+        row = self._conn.execute(
+            "SELECT * FROM alarms WHERE next_fire_ms IS NOT NULL ORDER BY next_fire_ms LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        return self._restore_key(row['class_id']), self._row_to_record(row)
+
+    def due(self, now_ms):
+        """now_ms 시점까지 울려야 하는 알람 목록"""
+        rows = self._conn.execute(
+            "SELECT * FROM alarms WHERE next_fire_ms IS NOT NULL AND next_fire_ms <= ? ORDER BY next_fire_ms",
+            (now_ms,)
+        )
+        return [(self._restore_key(row['class_id']), self._row_to_record(row)) for row in rows]
+
+    def data_version(self):
+        """다른 연결이 커밋하면 바뀌는 값 (변경 감지용)"""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    # ---- 이전 형식 ----
+
+    def migrate_legacy_pickle(self, pickle_path=None):
+        """이전 alarms.pkl이 있으면 한 번만 가져오고 파일 이름 변경"""
+        pickle_path = pickle_path or os.path.join(os.path.dirname(self.path), LEGACY_PICKLE_NAME)
+        if not os.path.exists(pickle_path):
+            return 0
+        try:
+            import pickle
+            with open(pickle_path, 'rb') as f:
+                legacy_alarms = pickle.load(f)
+            if isinstance(legacy_alarms, dict):
+                self.put_many({class_id: alarm_info for class_id, alarm_info in legacy_alarms.items()
+                               if isinstance(alarm_info, dict)})
+            os.replace(pickle_path, pickle_path + ".migrated")
+            print(f"📦 alarms.pkl → {ALARM_DB_NAME} 이전 완료: {len(legacy_alarms)}개")
+            return len(legacy_alarms)
+        except Exception as e:
+            print(f"❌ 이전 알람 파일 변환 실패: {e}")
+            return 0
+
+    def close(self):
+        if self._signal_socket is not None:
+            self._signal_socket.close()
+            self._signal_socket = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,147 @@
+import threading
+import time
+
+# 짧은 이름 → Java 클래스 전체 이름
+JAVA_CLASSES = {
+    'PythonActivity': 'org.kivy.android.PythonActivity',
+    'PythonService': 'org.kivy.android.PythonService',
+    'Context': 'android.content.Context',
+    'Intent': 'android.content.Intent',
+    'ComponentName': 'android.content.ComponentName',
+    'Uri': 'android.net.Uri',
+    'Settings': 'android.provider.Settings',
+    'PendingIntent': 'android.app.PendingIntent',
+    'AlarmManager': 'android.app.AlarmManager',
+    'Notification': 'android.app.Notification',
+    'NotificationManager': 'android.app.NotificationManager',
+    'NotificationChannel': 'android.app.NotificationChannel',
+    'Builder': 'android.app.Notification$Builder',
+    'BigTextStyle': 'android.app.Notification$BigTextStyle',
+    'Calendar': 'java.util.Calendar',
+}
+
+# PendingIntent 플래그 (API 레벨과 상관없이 같은 값)
+FLAG_IMMUTABLE = 67108864  # PendingIntent.FLAG_IMMUTABLE
+FLAG_UPDATE_CURRENT = 134217728  # PendingIntent.FLAG_UPDATE_CURRENT
+
+
+def _jnius_loader(class_name):
+    from jnius import autoclass
+    return autoclass(class_name)
+
+
+class JavaClassRegistry:
+    """프로세스 전체에서 공유하는 Android 클래스/시스템 서비스 캐시
+
+    autoclass 리플렉션은 이름마다 처음 한 번만 하고, 조회 횟수와 로딩 시간을 기록한다.
+    """
+
+    def __init__(self, loader=None):
+        self._loader = loader or _jnius_loader
+        self._classes = {}
+        self._services = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'lookups': 0,
+            'loads': 0,
+            'load_ms': 0.0,
+            'service_loads': 0
+        }
+
+    def get(self, name):
+        """클래스 가져오기 - 짧은 이름(JAVA_CLASSES)이나 전체 이름 모두 가능"""
+        class_name = JAVA_CLASSES.get(name, name)
+        with self._lock:
+            self.stats['lookups'] += 1
+            cls = self._classes.get(class_name)
+        if cls is not None:
+            return cls
+
+        started = time.perf_counter()
+        cls = self._loader(class_name)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._classes.setdefault(class_name, cls)
+            self.stats['loads'] += 1
+            self.stats['load_ms'] += elapsed_ms
+        return cls
+
+    def __getattr__(self, name):
+        # registry.Intent 처럼 짧은 이름으로 접근
+        if name in JAVA_CLASSES:
+            return self.get(name)
+        raise AttributeError(name)
+
+    def activity(self):
+        """현재 액티비티 (서비스 프로세스에서는 None)"""
+        return getattr(self.get('PythonActivity'), 'mActivity', None)
+
+    def context(self):
+        """액티비티가 있으면 액티비티, 없으면 서비스를 컨텍스트로 사용"""
+        activity = self.activity()
+        if activity is not None:
+            return activity
+        return getattr(self.get('PythonService'), 'mService', None)
+
+    def system_service(self, service_name):
+        """Context.getSystemService 결과 캐시 (예: 'NOTIFICATION_SERVICE')"""
+        service = self._services.get(service_name)
+        if service is not None:
+            return service
+        context = self.context()
+        if context is None:
+            return None
+        service = context.getSystemService(getattr(self.get('Context'), service_name))
+        with self._lock:
+            self._services[service_name] = service
+            self.stats['service_loads'] += 1
+        return service
+
+    def notification_manager(self):
+        return self.system_service('NOTIFICATION_SERVICE')
+
+    def alarm_service(self):
+        return self.system_service('ALARM_SERVICE')
+
+    def reset(self):
+        with self._lock:
+            self._classes.clear()
+            self._services.clear()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['cached_classes'] = len(self._classes)
+            stats['cached_services'] = len(self._services)
+        return stats
+
+    def print_stats(self):
+        stats = self.get_stats()
+        print(f"☕ Java 클래스 조회 {stats['lookups']}회, 로딩 {stats['loads']}회 "
+              f"({stats['load_ms']:.1f}ms), 시스템 서비스 {stats['service_loads']}개")
+
+
+class FakeJavaClassRegistry(JavaClassRegistry):
+    """jnius가 없는 PC용 - 요청한 클래스마다 호출을 기록하는 가짜 객체 반환"""
+
+    def __init__(self):
+        from unittest import mock
+        super().__init__(loader=lambda class_name: mock.MagicMock(name=class_name))
+
+
+_registry = None
+
+
+def get_registry():
+    """공유 레지스트리 (처음 사용할 때 생성)"""
+    global _registry
+    if _registry is None:
+        _registry = JavaClassRegistry()
+    return _registry
+
+
+def set_registry(registry):
+    """레지스트리 교체 (PC에서 FakeJavaClassRegistry 사용 등)"""
+    global _registry
+    _registry = registry
+    return registry
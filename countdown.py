@@ -0,0 +1,157 @@
+import math
+import time
+from datetime import datetime
+
+from android_bridge import get_registry
+from platform_backend import is_android
+
+# 포어그라운드 알림과 같은 ID/채널을 사용해 "앱 작동중" 알림 내용을 카운트다운으로 바꿈
+COUNTDOWN_NOTIFICATION_ID = 1001
+COUNTDOWN_CHANNEL_ID = "foreground_service_channel"
+
+
+def format_remaining_time(target_time, now=None):
+    """남은 시간을 분 단위로 표시 - 표시가 분마다 한 번만 바뀌도록 올림"""
+    now = now or datetime.now()
+    seconds = (target_time - now).total_seconds()
+    if seconds <= 0:
+        return "수업 시작됨!"
+    minutes = int(math.ceil(seconds / 60))
+    h, m = divmod(minutes, 60)
+    return f"{h:02d}:{m:02d} 남음"
+
+
+class AndroidCountdownNotifier:
+    """카운트다운 알림 - jnius 클래스와 Builder를 한 번만 만들고 텍스트만 바꿔서 다시 표시"""
+
+    def __init__(self, title="📚 수업 카운트다운"):
+        self.title = title
+        self._builder = None
+        self._manager = None
+
+    def _prepare(self):
+        java = get_registry()
+        context = java.activity()
+        builder = java.Builder(context, COUNTDOWN_CHANNEL_ID)
+        builder.setSmallIcon(context.getApplicationInfo().icon)
+        builder.setContentTitle(self.title)
+        builder.setOngoing(True)
+        builder.setOnlyAlertOnce(True)  # 내용이 바뀔 때마다 소리/진동이 나지 않게
+        builder.setPriority(java.Notification.PRIORITY_LOW)
+
+        self._manager = java.notification_manager()
+        self._builder = builder
+
+    def show(self, text):
+        if self._builder is None:
+            self._prepare()
+        self._builder.setContentText(text)
+        self._manager.notify(COUNTDOWN_NOTIFICATION_ID, self._builder.build())
+
+    def close(self):
+        """캐시한 Builder 해제 (알림 자체는 stop_foreground_service에서 제거)"""
+        self._builder = None
+        self._manager = None
+
+
+class DesktopCountdownNotifier:
+    """PC용 카운트다운 알림 - 콘솔 출력만 하고 표시 횟수를 기록"""
+
+    def __init__(self, title="📚 수업 카운트다운", verbose=True):
+        self.title = title
+        self.verbose = verbose
+        self.shown = []
+
+    def show(self, text):
+        self.shown.append(text)
+        if self.verbose:
+            print(f"{self.title}: {text}")
+
+    def close(self):
+        pass
+
+
+def create_countdown_notifier():
+    """실행 환경에 맞는 카운트다운 알림 생성"""
+    if is_android():
+        return AndroidCountdownNotifier()
+    return DesktopCountdownNotifier()
+
+
+class CountdownNotification:
+    """수업 시작까지 카운트다운 - 표시되는 분이 바뀔 때만 알림 갱신
+
+    Clock 이벤트는 다음 분 경계에 맞춰 한 번씩만 예약하고,
+    tick 통계(호출 수, 실제 갱신 수, 평균 처리 시간)를 기록한다.
+    """
+
+    def __init__(self, notifier, target_time, on_finish=None):
+        self.notifier = notifier
+        self.target_time = target_time
+        self.on_finish = on_finish
+        self._event = None
+        self._last_text = None
+        self.ticks = 0
+        self.updates = 0
+        self.total_tick_ms = 0.0
+
+    @property
+    def running(self):
+        return self._event is not None
+
+    def start(self):
+        if self.tick():
+            self._schedule_next()
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        self.notifier.close()
+
+    def tick(self, now=None):
+        """한 번 갱신 - 표시 텍스트가 바뀐 경우에만 알림을 다시 표시. 끝났으면 False"""
+        started = time.perf_counter()
+        now = now or datetime.now()
+        self.ticks += 1
+
+        if (self.target_time - now).total_seconds() <= 0:
+            self._finish()
+            self._record_tick(started)
+            return False
+
+        text = format_remaining_time(self.target_time, now)
+        if text != self._last_text:
+            self.notifier.show(text)
+            self._last_text = text
+            self.updates += 1
+        self._record_tick(started)
+        return True
+
+    def _record_tick(self, started):
+        self.total_tick_ms += (time.perf_counter() - started) * 1000
+
+    def _finish(self):
+        self.stop()
+        self._last_text = None
+        if self.on_finish:
+            self.on_finish()
+
+    def _schedule_next(self):
+        """남은 시간이 다음 분 경계를 지나는 순간(또는 수업 시작)에 맞춰 예약"""
+        from kivy.clock import Clock
+        seconds = (self.target_time - datetime.now()).total_seconds()
+        delay = seconds % 60 or 60
+        self._event = Clock.schedule_once(self._on_clock, min(delay, max(seconds, 0)) + 0.01)
+
+    def _on_clock(self, dt):
+        self._event = None
+        if self.tick():
+            self._schedule_next()
+
+    def get_stats(self):
+        return {
+            'ticks': self.ticks,
+            'updates': self.updates,
+            'avg_tick_ms': self.total_tick_ms / self.ticks if self.ticks else 0.0
+        }
@@ -1,11 +1,18 @@
 import json
 import os
+import threading
 from datetime import datetime
+from persistence import atomic_write, flush_pending, run_later
+from platform_backend import is_android
 
 class TimeTableStorage:
-    def __init__(self):
+    # 저널 압축 기준 (레코드 수 / 파일 크기)
+    JOURNAL_MAX_RECORDS = 200
+    JOURNAL_MAX_BYTES = 64 * 1024
+
+    def __init__(self, journal=False):
         # Android 환경 감지 및 적절한 경로 설정
-        if 'ANDROID_STORAGE' in os.environ:
+        if is_android():
             # Android 앱 전용 데이터 디렉토리 사용
             android_data_dir = os.path.dirname(os.path.abspath(__file__))
             self.data_dir = os.path.join(android_data_dir, 'timetable_data')
@@ -34,27 +41,55 @@ class TimeTableStorage:
             self.data_dir = "."
             self.data_file = "timetable_data.json"
             print(f"🆘 최후 대체 경로: {self.data_dir}")
+        
+        # 🔥 저널 모드: 변경분만 추가 기록하고 일정 크기를 넘으면 스냅샷으로 압축
+        self.journal = journal
+        self.journal_file = os.path.join(self.data_dir, "timetable_journal.jsonl")
+        self._journal_state = None  # 마지막으로 기록된 과목 상태 (class_id → 직렬화된 dict)
+        self._journal_records = 0
+        self._journal_lock = threading.RLock()
+    
+    def _serialize_class(self, class_data):
+        """과목 데이터를 JSON 저장용 dict로 변환"""
+        # 데이터 복사 (원본 보호)
+        class_copy = class_data.copy()
+        
+        # 색상값 처리 (튜플 → 문자열)
+        if isinstance(class_copy['color'], tuple):
+            class_copy['color'] = ','.join(map(str, class_copy['color']))
+        
+        return class_copy
     
     def save_classes(self, classes_data):
+        """시간표 데이터 저장 (저널 모드면 변경분만 추가 기록)"""
+        if self.journal and self._journal_state is not None:
+            return self._save_journal(classes_data)
+        
+        success = self._write_snapshot(classes_data)
+        if success and self.journal:
+            self._reset_journal(classes_data)
+        return success
+    
+    def save_classes_later(self, classes_data):
+        """연속 편집을 모아서 저장 - 잠시 뒤 마지막 상태만 기록 (flush_pending()으로 즉시 기록)
+
+        저장은 타이머 스레드에서 실행되므로 지금 상태를 복사해 둔다.
+        """
+        snapshot = {class_id: dict(class_data) for class_id, class_data in classes_data.items()}
+        run_later(self.data_file, lambda: self.save_classes(snapshot))
+        return True
+
+    def _write_snapshot(self, classes_data):
         """시간표 데이터를 JSON 파일로 저장"""
         try:
             # 리스트로 변환
-            serializable_data = []
-            for class_id, class_data in classes_data.items():
-                # 데이터 복사 (원본 보호)
-                class_copy = class_data.copy()
-                
-                # 색상값 처리 (튜플 → 문자열)
-                if isinstance(class_copy['color'], tuple):
-                    class_copy['color'] = ','.join(map(str, class_copy['color']))
-                
-                serializable_data.append(class_copy)
+            serializable_data = [self._serialize_class(class_data) for class_data in classes_data.values()]
             
             # 저장 시간 추가
             metadata = {
                 "last_saved": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "version": "1.0",
-                "platform": "android" if 'ANDROID_STORAGE' in os.environ else "pc"
+                "platform": "android" if is_android() else "pc"
             }
             
             # 최종 저장 데이터
@@ -63,9 +98,8 @@ class TimeTableStorage:
                 "classes": serializable_data
             }
             
-            # JSON 파일로 저장
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            # JSON 파일로 저장 (임시 파일 + rename으로 원자적 교체)
+            atomic_write(self.data_file, json.dumps(save_data, ensure_ascii=False, indent=2))
             
             print(f"✅ 시간표 데이터 저장 완료: {self.data_file}")
             print(f"📊 저장된 과목 수: {len(serializable_data)}")
@@ -80,27 +114,157 @@ class TimeTableStorage:
             traceback.print_exc()
             return False
     
+    def _save_journal(self, classes_data):
+        """이전 상태와 비교해 추가/수정/삭제 레코드만 저널에 추가"""
+        with self._journal_lock:
+            try:
+                records = []
+                new_state = {}
+                for class_id, class_data in classes_data.items():
+                    serialized = self._serialize_class(class_data)
+                    new_state[class_id] = serialized
+                    if self._journal_state.get(class_id) != serialized:
+                        records.append({"op": "put", "class": serialized})
+                for class_id in self._journal_state:
+                    if class_id not in new_state:
+                        records.append({"op": "del", "id": class_id})
+                
+                if not records:
+                    print("📭 변경 사항 없음 - 저장 생략")
+                    return True
+                
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write("".join(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+                                    for record in records))
+                    f.flush()
+                    os.fsync(f.fileno())  # 스냅샷과 같이 디스크 반영까지 기다림
+                
+                self._journal_state = new_state
+                self._journal_records += len(records)
+                print(f"✅ 저널 기록 완료: {len(records)}개 변경")
+                
+                if self._journal_needs_compaction():
+                    self.compact()
+                return True
+                
+            except Exception as e:
+                print(f"❌ 저널 기록 오류: {e}")
+                import traceback
+                traceback.print_exc()
+                return False
+    
+    def _journal_needs_compaction(self):
+        """저널이 압축 기준을 넘었는지 확인"""
+        if self._journal_records >= self.JOURNAL_MAX_RECORDS:
+            return True
+        try:
+            return os.path.getsize(self.journal_file) >= self.JOURNAL_MAX_BYTES
+        except OSError:
+            return False
+    
+    def _reset_journal(self, classes_data):
+        """스냅샷 저장 직후 저널을 비우고 기준 상태 갱신"""
+        with self._journal_lock:
+            self._journal_state = {class_id: self._serialize_class(class_data)
+                                   for class_id, class_data in classes_data.items()}
+            self._journal_records = 0
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+    
+    def compact(self):
+        """저널 내용을 스냅샷에 합치고 저널 삭제"""
+        with self._journal_lock:
+            if self._journal_state is None:
+                return False
+            classes_data = dict(self._journal_state)
+            print(f"🗜️ 저널 압축 시작: {self._journal_records}개 레코드")
+            if not self._write_snapshot(classes_data):
+                return False
+            self._reset_journal(classes_data)
+            return True
+    
+    def compact_in_background(self):
+        """백그라운드 스레드에서 저널 압축"""
+        thread = threading.Thread(target=self.compact, name="timetable-journal-compact", daemon=True)
+        thread.start()
+        return thread
+    
+    def _replay_journal(self, classes_list):
+        """스냅샷 목록 위에 저널 레코드를 순서대로 적용"""
+        classes_by_id = {}
+        for class_data in classes_list:
+            if isinstance(class_data, dict) and 'id' in class_data:
+                classes_by_id[class_data['id']] = class_data
+        
+        if not os.path.exists(self.journal_file):
+            return list(classes_by_id.values()), 0
+        
+        replayed = 0
+        offset = 0
+        valid_end = 0  # 마지막으로 온전히 읽은 줄의 끝 위치 (바이트)
+        with open(self.journal_file, 'rb') as f:
+            for raw_line in f:
+                offset += len(raw_line)
+                line = raw_line.strip()
+                if not line:
+                    valid_end = offset
+                    continue
+                try:
+                    # 줄바꿈 없이 끝난 줄은 기록 도중 중단된 것
+                    if not raw_line.endswith(b"\n"):
+                        raise ValueError("incomplete record")
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    print("⚠️ 손상된 저널 레코드 무시")
+                    continue
+                if record.get("op") == "put":
+                    classes_by_id[record["class"]["id"]] = record["class"]
+                elif record.get("op") == "del":
+                    classes_by_id.pop(record.get("id"), None)
+                replayed += 1
+                valid_end = offset
+        
+        # 끝부분이 깨져 있으면 잘라냄 - 그대로 두면 다음 추가 기록이 깨진 줄 뒤에 붙어서 함께 유실됨
+        if valid_end < offset:
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(valid_end)
+            print(f"✂️ 저널 끝의 불완전한 레코드 제거: {offset - valid_end}바이트")
+        
+        print(f"📜 저널 레코드 {replayed}개 적용")
+        return list(classes_by_id.values()), replayed
+    
     def load_classes(self):
-        """저장된 시간표 데이터 불러오기"""
-        if not os.path.exists(self.data_file):
+        """저장된 시간표 데이터 불러오기 (저널 모드면 스냅샷 + 저널 재생)"""
+        # 대기 중인 저장이 있으면 먼저 기록해서 최신 상태를 읽음
+        flush_pending(self.data_file)
+        has_journal = self.journal and os.path.exists(self.journal_file)
+        if not os.path.exists(self.data_file) and not has_journal:
             print("📁 저장된 시간표 데이터가 없습니다.")
+            if self.journal:
+                self._reset_journal({})
             return {}
         
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            classes_list = []
+            if os.path.exists(self.data_file):
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                
+                # 새 형식과 이전 형식 모두 지원
+                if isinstance(data, dict) and "classes" in data:
+                    # 새 형식 (메타데이터 포함)
+                    classes_list = data["classes"]
+                    metadata = data.get("metadata", {})
+                    print(f"📅 데이터 저장 시간: {metadata.get('last_saved', '알 수 없음')}")
+                    print(f"🖥️ 저장 플랫폼: {metadata.get('platform', '알 수 없음')}")
+                else:
+                    # 이전 형식 (직접 리스트)
+                    classes_list = data if isinstance(data, list) else [data]
+                    print("📄 이전 형식의 데이터 감지")
             
-            # 새 형식과 이전 형식 모두 지원
-            if isinstance(data, dict) and "classes" in data:
-                # 새 형식 (메타데이터 포함)
-                classes_list = data["classes"]
-                metadata = data.get("metadata", {})
-                print(f"📅 데이터 저장 시간: {metadata.get('last_saved', '알 수 없음')}")
-                print(f"🖥️ 저장 플랫폼: {metadata.get('platform', '알 수 없음')}")
-            else:
-                # 이전 형식 (직접 리스트)
-                classes_list = data if isinstance(data, list) else [data]
-                print("📄 이전 형식의 데이터 감지")
+            replayed = 0
+            if self.journal:
+                classes_list, replayed = self._replay_journal(classes_list)
             
             # 딕셔너리로 변환
             classes_data = {}
@@ -126,6 +290,13 @@ class TimeTableStorage:
             
             print(f"✅ 시간표 데이터 불러오기 완료: {len(classes_data)}개 과목")
             
+            # 저널 기준 상태 설정 (이후 저장 시 변경분 비교용)
+            if self.journal:
+                with self._journal_lock:
+                    self._journal_state = {class_id: self._serialize_class(class_data)
+                                           for class_id, class_data in classes_data.items()}
+                    self._journal_records = replayed
+            
             # 불러온 데이터 검증
             for class_id, class_data in classes_data.items():
                 required_fields = ['id', 'name', 'day', 'start_time', 'end_time', 'room', 'professor', 'color']
@@ -133,6 +304,9 @@ class TimeTableStorage:
                 if missing_fields:
                     print(f"⚠️ 과목 ID {class_id}: 누락된 필드 {missing_fields}")
             
+            if self.journal and self._journal_needs_compaction():
+                self.compact_in_background()
+            
             return classes_data
             
         except json.JSONDecodeError as e:
@@ -150,6 +324,10 @@ class TimeTableStorage:
     def backup_data(self):
         """데이터 백업 생성"""
         try:
+            # 저널 모드면 백업 전에 스냅샷으로 합치기
+            if self.journal and self._journal_records:
+                self.compact()
+            
             if not os.path.exists(self.data_file):
                 print("📁 백업할 데이터가 없습니다.")
                 return False
@@ -176,7 +354,10 @@ class TimeTableStorage:
             "data_file": self.data_file,
             "file_exists": os.path.exists(self.data_file),
             "file_size": 0,
-            "last_modified": None
+            "last_modified": None,
+            "journal": self.journal,
+            "journal_size": 0,
+            "journal_records": self._journal_records
         }
         
         try:
@@ -184,6 +365,8 @@ class TimeTableStorage:
                 stat = os.stat(self.data_file)
                 info["file_size"] = stat.st_size
                 info["last_modified"] = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+            if os.path.exists(self.journal_file):
+                info["journal_size"] = os.path.getsize(self.journal_file)
         except Exception as e:
             print(f"❌ 파일 정보 가져오기 오류: {e}")
         
@@ -192,6 +375,13 @@ class TimeTableStorage:
     def clear_data(self):
         """저장된 데이터 삭제"""
         try:
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+                print(f"✅ 저널 파일 삭제 완료: {self.journal_file}")
+            if self.journal:
+                self._journal_state = {}
+                self._journal_records = 0
+            
             if os.path.exists(self.data_file):
                 os.remove(self.data_file)
                 print(f"✅ 데이터 파일 삭제 완료: {self.data_file}")
@@ -202,3 +392,350 @@ class TimeTableStorage:
         except Exception as e:
             print(f"❌ 데이터 삭제 오류: {e}")
             return False
+
+
+class SQLiteTimeTableStorage(TimeTableStorage):
+    """SQLite(WAL) 기반 시간표 저장소 - TimeTableStorage와 같은 인터페이스
+
+    과목 한 개 단위 upsert와 요일/시간대 조회를 지원해서
+    여러 학기/학과 데이터가 쌓여도 전체를 읽지 않고 필요한 과목만 가져온다.
+    """
+    SCHEMA_VERSION = 2
+    COLUMNS = ('id', 'name', 'day', 'start_time', 'end_time', 'room', 'professor',
+               'color', 'notify_before', 'semester', 'department')
+
+    def __init__(self, semester="", department=""):
+        # 경로 설정은 JSON 저장소와 동일하게 사용
+        super().__init__(journal=False)
+        self.db_file = os.path.join(self.data_dir, "timetable_data.db")
+        self.semester = semester
+        self.department = department
+        self._conn = None
+        self._connect()
+        self.import_json()
+
+    def _connect(self):
+        """DB 연결 및 스키마 생성"""
+        import sqlite3
+        self._conn = sqlite3.connect(self.db_file)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < self.SCHEMA_VERSION:
+            # 과목 ID는 학기/학과마다 따로 매겨지므로 기본 키는 (semester, department, id)
+            classes_table = """
+                CREATE TABLE IF NOT EXISTS classes (
+                    id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT NOT NULL,
+                    room TEXT,
+                    professor TEXT,
+                    color TEXT,
+                    notify_before INTEGER DEFAULT 5,
+                    semester TEXT NOT NULL DEFAULT '',
+                    department TEXT NOT NULL DEFAULT '',
+                    extra TEXT,
+                    PRIMARY KEY (semester, department, id)
+                );
+            """
+            with self._conn:
+                if version == 1:
+                    # 버전 1은 id만 기본 키 - 새 테이블로 옮김 (기존 인덱스는 이전 테이블과 함께 삭제)
+                    self._conn.executescript(f"""
+                        ALTER TABLE classes RENAME TO classes_v1;
+                        {classes_table}
+                        INSERT INTO classes (id, name, day, start_time, end_time, room, professor,
+                                             color, notify_before, semester, department, extra)
+                            SELECT id, name, day, start_time, end_time, room, professor, color,
+                                   notify_before, COALESCE(semester, ''), COALESCE(department, ''), extra
+                            FROM classes_v1;
+                        DROP TABLE classes_v1;
+                    """)
+                    print("🔄 SQLite 스키마 버전 1 → 2 변경 완료")
+                self._conn.executescript(f"""
+                    {classes_table}
+                    CREATE INDEX IF NOT EXISTS idx_classes_day ON classes(day);
+                    CREATE INDEX IF NOT EXISTS idx_classes_start_time ON classes(start_time);
+                    CREATE INDEX IF NOT EXISTS idx_classes_day_start ON classes(day, start_time);
+                    CREATE TABLE IF NOT EXISTS meta (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    );
+                """)
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        print(f"✅ SQLite 저장소 준비 완료: {self.db_file}")
+
+    def _scope_sql(self):
+        """현재 학기/학과 조건"""
+        return "semester = ? AND department = ?", (self.semester, self.department)
+
+    def _class_to_row(self, class_data):
+        """과목 dict → DB 행"""
+        serialized = self._serialize_class(class_data)
+        extra = {key: value for key, value in serialized.items() if key not in self.COLUMNS}
+        return (
+            serialized['id'],
+            serialized['name'],
+            serialized['day'],
+            serialized['start_time'],
+            serialized['end_time'],
+            serialized.get('room', ''),
+            serialized.get('professor', ''),
+            serialized.get('color', ''),
+            serialized.get('notify_before', 5),
+            self.semester,
+            self.department,
+            json.dumps(extra, ensure_ascii=False) if extra else None
+        )
+
+    def _row_to_class(self, row):
+        """DB 행 → 과목 dict (색상은 튜플로 변환)"""
+        class_data = {
+            'id': row['id'],
+            'name': row['name'],
+            'day': row['day'],
+            'start_time': row['start_time'],
+            'end_time': row['end_time'],
+            'room': row['room'],
+            'professor': row['professor'],
+            'color': row['color'],
+            'notify_before': row['notify_before'] if row['notify_before'] is not None else 5
+        }
+        if isinstance(class_data['color'], str) and ',' in class_data['color']:
+            class_data['color'] = tuple(map(float, class_data['color'].split(',')))
+        if row['extra']:
+            try:
+                class_data.update(json.loads(row['extra']))
+            except json.JSONDecodeError:
+                pass
+        return class_data
+
+    def _upsert_rows(self, rows):
+        self._conn.executemany("""
+            INSERT INTO classes (id, name, day, start_time, end_time, room, professor,
+                                 color, notify_before, semester, department, extra)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(semester, department, id) DO UPDATE SET
+                name = excluded.name,
+                day = excluded.day,
+                start_time = excluded.start_time,
+                end_time = excluded.end_time,
+                room = excluded.room,
+                professor = excluded.professor,
+                color = excluded.color,
+                notify_before = excluded.notify_before,
+                extra = excluded.extra
+        """, rows)
+
+    def save_classes(self, classes_data):
+        """현재 학기/학과의 과목 전체를 한 트랜잭션으로 저장"""
+        try:
+            where, params = self._scope_sql()
+            with self._conn:
+                self._upsert_rows([self._class_to_row(class_data) for class_data in classes_data.values()])
+                # 목록에서 빠진 과목 삭제
+                existing_ids = [row[0] for row in self._conn.execute(f"SELECT id FROM classes WHERE {where}", params)]
+                removed_ids = [(class_id,) for class_id in existing_ids if class_id not in classes_data]
+                if removed_ids:
+                    self._conn.executemany(f"DELETE FROM classes WHERE id = ? AND {where}",
+                                           [removed + params for removed in removed_ids])
+                self._set_meta("last_saved", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            print(f"✅ 시간표 데이터 저장 완료 (SQLite): {len(classes_data)}개 과목")
+            return True
+        except Exception as e:
+            print(f"❌ 시간표 데이터 저장 오류 (SQLite): {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+    def save_classes_later(self, classes_data):
+        """SQLite 연결은 만든 스레드에서만 쓸 수 있으므로 바로 저장 (저장 한 번이 트랜잭션 하나)"""
+        return self.save_classes(classes_data)
+
+    def upsert_class(self, class_data):
+        """과목 한 개만 추가/수정"""
+        try:
+            with self._conn:
+                self._upsert_rows([self._class_to_row(class_data)])
+            return True
+        except Exception as e:
+            print(f"❌ 과목 저장 오류 (SQLite): {e}")
+            return False
+
+    def delete_class(self, class_id):
+        """과목 한 개 삭제"""
+        try:
+            where, params = self._scope_sql()
+            with self._conn:
+                self._conn.execute(f"DELETE FROM classes WHERE id = ? AND {where}", (class_id,) + params)
+            return True
+        except Exception as e:
+            print(f"❌ 과목 삭제 오류 (SQLite): {e}")
+            return False
+
+    def load_classes(self):
+        """현재 학기/학과의 과목 전체 불러오기"""
+        try:
+            where, params = self._scope_sql()
+            rows = self._conn.execute(f"SELECT * FROM classes WHERE {where} ORDER BY day, start_time", params)
+            classes_data = {row['id']: self._row_to_class(row) for row in rows}
+            print(f"✅ 시간표 데이터 불러오기 완료 (SQLite): {len(classes_data)}개 과목")
+            return classes_data
+        except Exception as e:
+            print(f"❌ 시간표 데이터 불러오기 오류 (SQLite): {e}")
+            import traceback
+            traceback.print_exc()
+            return {}
+
+    def get_classes_by_day(self, day):
+        """특정 요일 과목만 조회 (idx_classes_day_start 사용)"""
+        where, params = self._scope_sql()
+        rows = self._conn.execute(
+            f"SELECT * FROM classes WHERE day = ? AND {where} ORDER BY start_time",
+            (day,) + params
+        )
+        return {row['id']: self._row_to_class(row) for row in rows}
+
+    def get_classes_in_range(self, start_time, end_time, day=None):
+        """시작 시간이 [start_time, end_time) 구간에 있는 과목 조회 ("HH:MM" 문자열 비교)"""
+        where, params = self._scope_sql()
+        sql = f"SELECT * FROM classes WHERE start_time >= ? AND start_time < ? AND {where}"
+        args = (start_time, end_time) + params
+        if day is not None:
+            sql += " AND day = ?"
+            args += (day,)
+        rows = self._conn.execute(sql + " ORDER BY day, start_time", args)
+        return {row['id']: self._row_to_class(row) for row in rows}
+
+    def _get_meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    def import_json(self, force=False):
+        """기존 JSON 시간표를 처음 실행할 때 한 번만 DB로 옮김"""
+        if not force and self._get_meta("json_imported"):
+            return 0
+        # 저널 모드에서는 스냅샷 없이 저널에만 과목이 있을 수 있음
+        if not os.path.exists(self.data_file) and not os.path.exists(self.journal_file):
+            with self._conn:
+                self._set_meta("json_imported", "none")
+            return 0
+
+        # JSON 저장소 로직 그대로 사용 (스냅샷 + 저널 재생)
+        json_storage = TimeTableStorage(journal=True)
+        json_storage.data_dir = self.data_dir
+        json_storage.data_file = self.data_file
+        json_storage.journal_file = self.journal_file
+        classes_data = json_storage.load_classes()
+        if not classes_data:
+            # 파일은 있는데 읽은 과목이 없으면 (읽기 오류 포함) 표시하지 않고 다음 실행에서 다시 시도
+            print("⚠️ JSON 시간표에서 불러온 과목 없음 - 이전 보류")
+            return 0
+
+        try:
+            with self._conn:
+                self._upsert_rows([self._class_to_row(class_data) for class_data in classes_data.values()])
+                self._set_meta("json_imported", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            print(f"📦 JSON → SQLite 이전 완료: {len(classes_data)}개 과목")
+            return len(classes_data)
+        except Exception as e:
+            print(f"❌ JSON → SQLite 이전 실패: {e}")
+            return 0
+
+    def backup_data(self):
+        """SQLite 온라인 백업으로 DB 복사본 생성"""
+        try:
+            import sqlite3
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_file = os.path.join(self.data_dir, f"timetable_backup_{timestamp}.db")
+            backup_conn = sqlite3.connect(backup_file)
+            try:
+                self._conn.backup(backup_conn)
+            finally:
+                backup_conn.close()
+            print(f"✅ 백업 생성 완료: {backup_file}")
+            return True
+        except Exception as e:
+            print(f"❌ 백업 생성 오류: {e}")
+            return False
+
+    def get_data_info(self):
+        """DB 파일 정보 반환"""
+        info = {
+            "data_dir": self.data_dir,
+            "data_file": self.db_file,
+            "file_exists": os.path.exists(self.db_file),
+            "file_size": 0,
+            "last_modified": None,
+            "backend": "sqlite",
+            "class_count": 0,
+            "semester": self.semester,
+            "department": self.department
+        }
+
+        try:
+            if info["file_exists"]:
+                stat = os.stat(self.db_file)
+                info["file_size"] = stat.st_size
+                info["last_modified"] = self._get_meta("last_saved")
+            where, params = self._scope_sql()
+            info["class_count"] = self._conn.execute(f"SELECT COUNT(*) FROM classes WHERE {where}", params).fetchone()[0]
+        except Exception as e:
+            print(f"❌ 파일 정보 가져오기 오류: {e}")
+
+        return info
+
+    def clear_data(self):
+        """현재 학기/학과의 과목 삭제"""
+        try:
+            where, params = self._scope_sql()
+            with self._conn:
+                deleted = self._conn.execute(f"DELETE FROM classes WHERE {where}", params).rowcount
+            if deleted:
+                print(f"✅ 과목 {deleted}개 삭제 완료 (SQLite)")
+                return True
+            print("📁 삭제할 데이터가 없습니다.")
+            return False
+        except Exception as e:
+            print(f"❌ 데이터 삭제 오류: {e}")
+            return False
+
+    def compact(self):
+        """WAL 체크포인트 (JSON 저장소의 저널 압축에 해당)"""
+        try:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return True
+        except Exception as e:
+            print(f"❌ WAL 체크포인트 오류: {e}")
+            return False
+
+    def compact_in_background(self):
+        """연결은 메인 스레드 전용이므로 체크포인트를 바로 실행"""
+        self.compact()
+        return None
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def create_storage(backend="json", **kwargs):
+    """설정에 맞는 저장소 생성 ("json" 또는 "sqlite")"""
+    if backend == "sqlite":
+        try:
+            return SQLiteTimeTableStorage(**kwargs)
+        except Exception as e:
+            print(f"❌ SQLite 저장소 생성 실패, JSON 저장소 사용: {e}")
+            kwargs = {}
+    return TimeTableStorage(journal=kwargs.get("journal", True))
@@ -0,0 +1,73 @@
+from alarm_schedule import DAY_INDEX
+
+# 요일 순서 (weekday 0~6)
+WEEK_DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+class GridGeometry:
+    """시간표 그리드의 좌표 표 - 크기/위치가 바뀔 때 한 번 만들고 이후 조회는 O(1)
+
+    day_x[i]는 i번째 표시 요일 열의 왼쪽 경계, minute_y[m]은 시작 시각에서 m분 지난 지점의 y
+    (위에서 아래로 시간이 흐름). 요일 이름은 영어/한글 모두 받는다.
+    """
+
+    def __init__(self, x, y, width, height, days, start_hour, end_hour,
+                 day_col_width, spacing, slot_minutes=15):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.days = tuple(days)
+        self.start_hour = start_hour
+        self.end_hour = end_hour
+        self.day_col_width = day_col_width
+        self.spacing = spacing
+        self.slot_minutes = slot_minutes
+
+        self.total_minutes = (end_hour - start_hour) * 60
+        self.top = y + height
+        self.hour_height = height / (end_hour - start_hour)
+        self.minute_height = height / self.total_minutes
+
+        column_step = day_col_width + spacing
+        self.day_x = [x + i * column_step for i in range(len(self.days))]
+        self.right = x + len(self.days) * column_step - spacing
+        self.minute_y = [self.top - m * self.minute_height for m in range(self.total_minutes + 1)]
+
+        # weekday → 표시 열 (주말이 빠진 설정이면 해당 요일은 없음)
+        self._column_by_weekday = {DAY_INDEX[day]: i for i, day in enumerate(self.days)}
+
+    @property
+    def num_days(self):
+        return len(self.days)
+
+    @property
+    def hours(self):
+        return range(self.start_hour, self.end_hour)
+
+    def day_column(self, day):
+        """요일 이름(영어/한글) → 표시 열 인덱스, 그리드에 없는 요일이면 None"""
+        weekday = DAY_INDEX.get(day)
+        if weekday is None:
+            return None
+        return self._column_by_weekday.get(weekday)
+
+    def minutes_from_start(self, hour, minute=0):
+        return (hour - self.start_hour) * 60 + minute
+
+    def y_at(self, minutes):
+        """시작 시각부터 minutes분 지난 지점의 y (범위 밖이면 끝에 맞춤)"""
+        return self.minute_y[min(max(int(minutes), 0), self.total_minutes)]
+
+    def hour_line_ys(self):
+        """정시 구분선 y 목록 (맨 아래 선 포함)"""
+        return [self.minute_y[m] for m in range(0, self.total_minutes + 1, 60)]
+
+    def slot_line_ys(self):
+        """정시가 아닌 슬롯 경계선 y 목록 (예: 15분 간격이면 15/30/45분)"""
+        return [self.minute_y[m] for m in range(self.slot_minutes, self.total_minutes, self.slot_minutes)
+                if m % 60]
+
+    def column_line_xs(self):
+        """세로 구분선 x 목록 - 각 요일 열의 왼쪽 경계 + 마지막 열의 오른쪽 끝"""
+        return self.day_x + [self.right]
@@ -0,0 +1,91 @@
+"""시작 import 시간 보고서 - python -X importtime 출력으로 느린 모듈과 미뤄야 할 모듈을 확인
+
+사용법:
+    python import_report.py                    # main을 -X importtime으로 import 해서 보고
+    python import_report.py import.log         # 저장해 둔 -X importtime 출력(stderr) 분석
+    python import_report.py --budget-ms 1500   # 전체 import 시간 예산
+
+지연 로딩 대상(DEFERRED_MODULES)이 main import 중에 로드되었거나
+전체 import 시간이 예산을 넘으면 종료 코드 1 (회귀 방지용).
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from startup_trace import DEFERRED_MODULES
+
+
+def parse_importtime(text):
+    """-X importtime 출력 → [(모듈, self_us, cumulative_us, 깊이)]"""
+    entries = []
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 머리글 줄
+        name = parts[2].rstrip()
+        depth = len(name) - len(name.lstrip())
+        entries.append((name.strip(), int(parts[0]), int(parts[1]), depth))
+    return entries
+
+
+def run_importtime(module='main'):
+    """module을 새 프로세스에서 -X importtime으로 import 하고 stderr 반환"""
+    env = dict(os.environ, KIVY_NO_ARGS='1')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True
+    )
+    return result.stderr
+
+
+def report(entries, top=15):
+    """가장 느린 최상위 import와 지연 로딩 위반 출력 - (전체 ms, 위반 목록) 반환"""
+    if not entries:
+        return 0.0, []
+    top_depth = min(depth for _, _, _, depth in entries)
+    roots = [entry for entry in entries if entry[3] == top_depth]
+    total_ms = sum(cumulative for _, _, cumulative, _ in roots) / 1000
+
+    print(f"📦 import {len(entries)}개, 전체 {total_ms:.1f}ms")
+    for name, _, cumulative, _ in sorted(roots, key=lambda entry: -entry[2])[:top]:
+        print(f"   {cumulative / 1000:8.1f}ms  {name}")
+
+    imported = {name for name, _, _, _ in entries}
+    violations = [name for name in DEFERRED_MODULES if name in imported]
+    for name in violations:
+        print(f"⚠️ 시작 시 import됨 (지연 로딩 대상): {name}")
+    return total_ms, violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 import 시간 보고서")
+    parser.add_argument('log', nargs='?', help="-X importtime 출력 파일 (없으면 main을 직접 import)")
+    parser.add_argument('--budget-ms', type=float, default=None, help="전체 import 시간 예산(ms)")
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    if args.log:
+        with open(args.log, encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = run_importtime()
+
+    entries = parse_importtime(text)
+    if not entries:
+        print("❌ importtime 출력이 없습니다.")
+        return 1
+
+    total_ms, violations = report(entries, args.top)
+    failed = bool(violations)
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"❌ import 시간 예산 초과: {total_ms:.1f}ms > {args.budget_ms:.1f}ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
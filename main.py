@@ -9,8 +9,32 @@ import os
 os.environ['KIVY_TEXT'] = 'sdl2'
 os.environ['LANG'] = 'ko_KR.UTF-8'
 
+from platform_backend import is_android, get_platform
+from startup_trace import startup
+
 from kivy.core.text import LabelBase
 
+# 지난 실행에서 찾은 폰트 경로 (다음 실행에서 후보 경로 탐색을 건너뜀)
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.font_path_cache')
+
+
+def load_cached_font_path():
+    """캐시된 폰트 경로 - 없거나 파일이 사라졌으면 None"""
+    try:
+        with open(FONT_CACHE_PATH, encoding='utf-8') as f:
+            font_path = f.read().strip()
+    except OSError:
+        return None
+    return font_path if font_path and os.path.exists(font_path) else None
+
+
+def save_cached_font_path(font_path):
+    try:
+        with open(FONT_CACHE_PATH, 'w', encoding='utf-8') as f:
+            f.write(font_path)
+    except OSError as e:
+        print(f"폰트 경로 캐시 저장 실패: {e}")
+
 # APK용 폰트 설정 
 def setup_korean_font():
     FONT_NAME = "KoreanFont"
@@ -23,18 +47,25 @@ def setup_korean_font():
     ]
     
     # Android 환경인 경우 추가 경로
-    if 'ANDROID_STORAGE' in os.environ:
+    if is_android():
         font_candidates.extend([
             "/system/fonts/NotoSansCJK-Regular.ttc",
             "/system/fonts/DroidSansFallback.ttf"
         ])
     
+    # 캐시된 경로가 있으면 그것부터 (이미 존재 확인됨)
+    cached_path = load_cached_font_path()
+    if cached_path:
+        font_candidates = [cached_path] + [path for path in font_candidates if path != cached_path]
+
     # 폰트 등록 시도
     for font_path in font_candidates:
-        if os.path.exists(font_path):
+        if font_path == cached_path or os.path.exists(font_path):
             try:
                 LabelBase.register(FONT_NAME, font_path)
                 print(f"✅ 폰트 등록 성공: {font_path}")
+                if font_path != cached_path:
+                    save_cached_font_path(font_path)
                 return FONT_NAME
             except Exception as e:
                 print(f"폰트 등록 실패: {font_path} - {e}")
@@ -50,7 +81,8 @@ def setup_korean_font():
         return "Roboto"
 
 # 폰트 설정 실행
-FONT_NAME = setup_korean_font()
+with startup.span('font_register'):
+    FONT_NAME = setup_korean_font()
 
 from kivymd.app import MDApp
 from kivy.app import App 
@@ -60,11 +92,15 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.label import MDLabel
 from kivymd.uix.card import MDCard
 from kivymd.uix.behaviors import TouchBehavior
-from kivymd.uix.dialog import MDDialog
-from kivymd.uix.textfield import MDTextField
-from kivymd.uix.spinner import MDSpinner
-from kivymd.uix.menu import MDDropdownMenu
-from db_handler import TimeTableStorage
+# 대화상자/메뉴/텍스트필드/알림 모듈은 첫 화면에 필요 없으므로 처음 사용할 때 import (시작 시간 단축)
+from db_handler import create_storage
+from persistence import atomic_write, flush_pending, print_write_stats
+from alarm_store import get_alarm_store_path
+from alarm_schedule import RecurringAlarmQueue, alarm_fingerprint, diff_fingerprints, next_class_time
+from android_bridge import get_registry, FLAG_IMMUTABLE, FLAG_UPDATE_CURRENT
+from ui_metrics import OpenLatencyTracker
+from viewport import SpatialGrid, rects_intersect, visible_content_rect
+from grid_geometry import GridGeometry, WEEK_DAYS
 from kivy.logger import Logger
 from kivy.utils import platform 
 
@@ -73,10 +109,17 @@ from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Line, Rectangle
+from kivy.graphics import (Color, Line, Rectangle, RoundedRectangle, InstructionGroup,
+                           Fbo, ClearColor, ClearBuffers, Translate)
+from kivy.core.text import Label as CoreLabel
 from datetime import datetime, timedelta
-from functools import partial
+from functools import lru_cache, partial
+from contextlib import nullcontext
+from bisect import bisect_right
 import random
+import time
+
+startup.mark('imports_done')
 
 class ClassCard(MDCard, TouchBehavior):
     """Custom card class for classes with touch behavior"""
@@ -92,6 +135,20 @@ class ClassCard(MDCard, TouchBehavior):
         if hasattr(self, 'on_release_callback') and self.on_release_callback:
             self.on_release_callback(self)
 
+# 영어-한글 요일 매핑
+korean_day_map = {
+    "Monday": "월요일",
+    "Tuesday": "화요일",
+    "Wednesday": "수요일",
+    "Thursday": "목요일",
+    "Friday": "금요일",
+    "Saturday": "토요일",
+    "Sunday": "일요일"
+}
+
+# 요일 버튼/입력 필드에 쓰는 한 글자 요일 이름
+KOREAN_SHORT_DAY_NAMES = {day: name[0] for day, name in korean_day_map.items()}
+
 # 시간 문자열을 숫자(float)로 바꾸는 함수
 def parse_time_string(time_str):
     try:
@@ -100,12 +157,46 @@ def parse_time_string(time_str):
     except Exception as e:
         print(f"[시간 파싱 오류] {time_str} → {e}")
         return None
+
+@lru_cache(maxsize=None)
+def time_slot_options(start_hour, end_hour, slot_minutes=15):
+    """그리드 시간 범위의 선택 가능한 시각 (("HH:MM", 자정부터 분), ...) - start_hour:00부터 end_hour:00까지"""
+    return tuple(
+        (f"{minutes // 60:02d}:{minutes % 60:02d}", minutes)
+        for minutes in range(start_hour * 60, end_hour * 60 + 1, slot_minutes)
+    )
     
+# 색상 값(튜플/리스트/문자열)을 "r,g,b,a" 문자열로 바꾸는 함수
+def color_to_str(color):
+    if isinstance(color, str):
+        return color
+    return ','.join(map(str, color))
+
+# 카드 표시에 영향을 주는 과목 필드
+CARD_FIELDS = ('name', 'day', 'start_time', 'end_time', 'room', 'professor', 'color', 'notify_before')
+
+def normalize_card_field(field, value):
+    """비교용으로 필드 값 정규화 (색상은 float 튜플로)"""
+    if field == 'color' and value is not None:
+        try:
+            if isinstance(value, str):
+                return tuple(map(float, value.split(',')))
+            return tuple(float(v) for v in value)
+        except (TypeError, ValueError):
+            return value
+    if field == 'notify_before' and value is None:
+        return 5
+    return value
+
 # 📌 비율 기반 레이아웃 설정
 class LayoutConfig:
-    num_days = 5
+    days = WEEK_DAYS[:5]  # 표시할 요일 (주말까지 보려면 WEEK_DAYS)
     time_col_ratio = 0.15
     spacing_ratio = 0.01
+    start_hour = 9   # 시작 시간 (9:00)
+    end_hour = 20    # 종료 시간 (20:00)
+    slot_minutes = 15  # 시간 선택/구분선 간격 (60의 약수)
+    hour_height = 600 / 11  # 한 시간 높이 (dp) - 기본 9~20시가 600dp
 
     @classmethod
     def calculate(cls, total_width, total_height=None):
@@ -121,8 +212,10 @@ class LayoutConfig:
         
         spacing = grid_width * cls.spacing_ratio
         time_col_width = grid_width * cls.time_col_ratio
-        remaining_width = grid_width - time_col_width - spacing * (cls.num_days - 1)
-        day_col_width = remaining_width / cls.num_days
+        num_days = len(cls.days)
+        remaining_width = grid_width - time_col_width - spacing * (num_days - 1)
+        day_col_width = remaining_width / num_days
+        hour_height = dp(cls.hour_height)
 
         return {
             'spacing': spacing,
@@ -133,35 +226,300 @@ class LayoutConfig:
             'total_height': total_height,
             'grid_width': grid_width,
             'total_width': total_width,
-            'start_hour': 9,  # 시작 시간 (9:00)
-            'end_hour': 20    # 종료 시간 (19:00)
+            'days': tuple(cls.days),
+            'num_days': num_days,
+            'start_hour': cls.start_hour,
+            'end_hour': cls.end_hour,
+            'slot_minutes': cls.slot_minutes,
+            'hour_height': hour_height,
+            'time_grid_height': hour_height * (cls.end_hour - cls.start_hour)
         }
     
+# 캔버스 카드 글자 텍스처 캐시: (텍스트, 너비) → Texture
+_card_text_textures = {}
+
+def card_text_texture(text, width):
+    """카드 안 글자를 텍스처로 한 번만 렌더링 - 같은 과목명/강의실/너비면 재사용"""
+    key = (text, int(width))
+    texture = _card_text_textures.get(key)
+    if texture is None:
+        label = CoreLabel(
+            text=text,
+            font_name=FONT_NAME,
+            font_size=28,
+            halign="center",
+            valign="middle",
+            text_size=(int(width), None)
+        )
+        label.refresh()
+        texture = label.texture
+        _card_text_textures[key] = texture
+    return texture
+
+
+class CanvasCard:
+    """위젯 없이 들고 있는 가벼운 과목 카드 기록 - 수정 대화상자에는 ClassCard처럼 class_data로 전달
+
+    canvas 모드에서는 group(캔버스 명령), virtual 모드에서는 화면에 보일 때만 widget을 가진다.
+    """
+    __slots__ = ('class_data', 'day_index', 'pos', 'size', 'color', 'text', 'group', 'widget')
+
+    def __init__(self, class_data, day_index, pos, size, color=None, text=""):
+        self.class_data = class_data
+        self.day_index = day_index
+        self.pos = pos
+        self.size = size
+        self.color = color
+        self.text = text
+        self.group = None
+        self.widget = None
+
+    @property
+    def rect(self):
+        return self.pos[0], self.pos[1], self.pos[0] + self.size[0], self.pos[1] + self.size[1]
+
+    def collide_point(self, x, y):
+        left, bottom = self.pos
+        width, height = self.size
+        return left <= x <= left + width and bottom <= y <= bottom + height
+
+
+class CardLayer:
+    """과목 카드 레이어 공통 부분 - 카드 기록과 공간 인덱스를 들고 보이는 영역의 카드만 화면에 올림
+
+    update_viewport를 한 번도 받지 않았으면 모든 카드를 표시한다.
+    """
+    def __init__(self, cell_width, cell_height):
+        self.cards = {}  # class_id → CanvasCard
+        self._by_day = {}  # day_index → [CanvasCard]
+        self.index = SpatialGrid(cell_width, cell_height)
+        self.view_rect = None
+        self._shown = set()
+
+    def __len__(self):
+        return len(self.cards)
+
+    def add(self, class_id, class_data, day_index, pos, size, color, text):
+        self.remove(class_id)
+        card = CanvasCard(class_data, day_index, pos, size, color, text)
+        self.cards[class_id] = card
+        self._by_day.setdefault(day_index, []).append(card)
+        self.index.insert(class_id, card.rect)
+        if self.view_rect is None or rects_intersect(card.rect, self.view_rect):
+            self._show(class_id, card)
+        return card
+
+    def remove(self, class_id):
+        card = self.cards.pop(class_id, None)
+        if card is not None:
+            if class_id in self._shown:
+                self._hide(class_id, card)
+            self.index.remove(class_id)
+            self._by_day[card.day_index].remove(card)
+        return card
+
+    def clear(self):
+        for class_id in list(self.cards):
+            self.remove(class_id)
+
+    def move(self, class_id, pos, size):
+        """카드 위치/크기 변경 (레이아웃이 바뀐 뒤) - 바뀐 카드만 인덱스를 고치고 다시 표시"""
+        card = self.cards.get(class_id)
+        if card is None or (card.pos == pos and card.size == size):
+            return False
+        if class_id in self._shown:
+            self._hide(class_id, card)
+        card.pos = pos
+        card.size = size
+        card.group = None  # canvas 모드 그리기 명령은 새 좌표로 다시 생성
+        self.index.insert(class_id, card.rect)
+        if self.view_rect is None or rects_intersect(card.rect, self.view_rect):
+            self._show(class_id, card)
+        return True
+
+    def update_viewport(self, rect):
+        """보이는 영역(여유 포함)이 바뀌었을 때 - 벗어난 카드는 내리고 들어온 카드만 올림"""
+        self.view_rect = rect
+        visible = self.index.query(rect)
+        for class_id in self._shown - visible:
+            self._hide(class_id, self.cards[class_id])
+        for class_id in visible - self._shown:
+            self._show(class_id, self.cards[class_id])
+
+    def _show(self, class_id, card):
+        self._shown.add(class_id)
+
+    def _hide(self, class_id, card):
+        self._shown.discard(class_id)
+
+    def hit_test(self, x, y, day_index):
+        """(x, y)에 있는 카드 - 해당 요일 카드만 확인하고 나중에 그린 카드 우선"""
+        for card in reversed(self._by_day.get(day_index, ())):
+            if card.collide_point(x, y):
+                return card
+        return None
+
+    def get_stats(self):
+        return {'cards': len(self.cards), 'shown': len(self._shown)}
+
+
+class CanvasCardLayer(CardLayer):
+    """TimeGridWidget 위에 과목 카드를 캔버스 명령(사각형 + 캐시된 글자 텍스처)으로 그림
+
+    카드마다 위젯을 만들지 않고, 터치는 요일별 카드 목록에서만 찾는다.
+    """
+    def __init__(self, canvas, cell_width, cell_height):
+        super().__init__(cell_width, cell_height)
+        self.group = InstructionGroup()
+        canvas.add(self.group)
+
+    def _show(self, class_id, card):
+        super()._show(class_id, card)
+        if card.group is None:
+            pos, size = card.pos, card.size
+            texture = card_text_texture(card.text, size[0])
+            text_w, text_h = texture.size
+
+            group = InstructionGroup()
+            group.add(Color(*card.color))
+            group.add(RoundedRectangle(pos=pos, size=size, radius=[dp(5)]))
+            group.add(Color(1, 1, 1, 1))  # 흰색 글자
+            group.add(Rectangle(
+                texture=texture,
+                size=(text_w, text_h),
+                pos=(pos[0] + (size[0] - text_w) / 2, pos[1] + (size[1] - text_h) / 2)
+            ))
+            card.group = group
+        self.group.add(card.group)
+
+    def _hide(self, class_id, card):
+        super()._hide(class_id, card)
+        self.group.remove(card.group)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats['cached_text_textures'] = len(_card_text_textures)
+        return stats
+
+
+class VirtualCardLayer(CardLayer):
+    """보이는 영역의 카드만 ClassCard 위젯으로 만들고, 벗어난 위젯은 풀에 넣었다가 재사용
+
+    위젯 수와 메모리가 과목 수가 아니라 화면 크기에 비례한다.
+    card_factory()는 빈 카드 위젯을, bind_card(widget, class_data, pos, size)는 내용 채우기를 담당.
+    """
+    def __init__(self, grid, cell_width, cell_height):
+        super().__init__(cell_width, cell_height)
+        self.grid = grid
+        self.card_factory = None
+        self.bind_card = None
+        self._pool = []
+        self.stats = {'created': 0, 'recycled': 0}
+
+    def _show(self, class_id, card):
+        super()._show(class_id, card)
+        if self._pool:
+            widget = self._pool.pop()
+            self.stats['recycled'] += 1
+        else:
+            widget = self.card_factory()
+            self.stats['created'] += 1
+        self.bind_card(widget, card.class_data, card.pos, card.size)
+        self.grid.add_widget(widget)
+        card.widget = widget
+
+    def _hide(self, class_id, card):
+        super()._hide(class_id, card)
+        widget = card.widget
+        card.widget = None
+        if widget is not None:
+            self.grid.remove_widget(widget)
+            self._pool.append(widget)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats.update(self.stats)
+        stats['pooled'] = len(self._pool)
+        return stats
+
+
     # 📌 시간표 그리드 위젯
 class TimeGridWidget(Widget):
-    def __init__(self, layout_data, **kwargs):
+    def __init__(self, layout_data, cache_background=False, card_mode="widget", **kwargs):
         super().__init__(**kwargs)
         self.size_hint_y = None
-        self.height = dp(600)
+        self.height = layout_data['time_grid_height']
         self.size_hint_x = None
 
         self.time_col_width = 0  # 중요: 시간 열 너비를 0으로 설정 (이미 time_column에 있음)
         self.day_col_width = layout_data['day_col_width']
         self.spacing = layout_data['spacing']
-        self.num_days = LayoutConfig.num_days
+        self.days = layout_data['days']
+        self.num_days = layout_data['num_days']
         self.width = layout_data['grid_width'] - layout_data['time_col_width']  # 시간 열 제외한 너비
         self.start_hour = layout_data['start_hour']  # 시작 시간
         self.end_hour = layout_data['end_hour']      # 종료 시간
+        self.slot_minutes = layout_data['slot_minutes']
 
-        # 요일 컬럼 시작 위치를 저장
+        # 요일 열/분 단위 좌표 표 - 위치나 크기가 바뀔 때마다 한 번 다시 계산
+        self.geometry = None
         self.day_columns = []
-        x_start = self.x
-        for i in range(self.num_days):
-            col_x = x_start + i * (self.day_col_width + self.spacing)
-            self.day_columns.append(col_x)
-
+        self._update_geometry()
+
+        # 캔버스 명령은 한 번만 만들고 위치/크기가 바뀌면 좌표만 갱신
+        # cache_background=True면 배경/그리드 선을 Fbo 텍스처에 그리고 캔버스에는 Rectangle 하나만 둠
+        self.cache_background = cache_background
+        self._fbo = None
+        self._texture_rect = None
+        self._drawn_size = None
+        self._canvas_shape = None
+        self.canvas_stats = {'builds': 0, 'updates': 0, 'instructions_created': 0, 'fbo_renders': 0}
+
+        # card_mode: "widget"은 카드 위젯을 직접 추가, "canvas"는 canvas.after에 그리고 터치는 on_card_press로 전달,
+        # "virtual"은 보이는 카드만 위젯으로 만들어 재사용 (공간 인덱스 셀은 요일 열 x 한 시간)
+        cell_width = self.day_col_width + self.spacing
+        cell_height = self.geometry.hour_height
+        self.card_layer = None
+        if card_mode == "canvas":
+            self.card_layer = CanvasCardLayer(self.canvas.after, cell_width, cell_height)
+        elif card_mode == "virtual":
+            self.card_layer = VirtualCardLayer(self, cell_width, cell_height)
+        self.on_card_press = None
+        self.on_geometry_change = None  # 좌표 표가 바뀔 때 호출 (카드 재배치용)
         self.bind(pos=self.update_canvas, size=self.update_canvas)
+
+    def apply_layout(self, layout_data):
+        """창 크기가 바뀐 뒤 열 너비/간격만 바꿔서 그리드를 다시 그림 (명령/카드 위젯은 유지)"""
+        self.day_col_width = layout_data['day_col_width']
+        self.spacing = layout_data['spacing']
+        self._drawn_size = None  # 열 너비만 바뀐 경우에도 Fbo를 다시 그림
+        size = (layout_data['grid_width'] - layout_data['time_col_width'], layout_data['time_grid_height'])
+        if tuple(self.size) != size:
+            self.size = size  # bind된 update_canvas가 한 번 호출됨
+        else:
+            self.update_canvas()
+
+    def _update_geometry(self):
+        self.geometry = GridGeometry(
+            self.x, self.y, self.width, self.height, self.days,
+            self.start_hour, self.end_hour, self.day_col_width, self.spacing, self.slot_minutes
+        )
+        self.day_columns = self.geometry.day_x
         
+    def day_index_at(self, x):
+        """x 좌표가 속한 요일 인덱스 (열 사이 간격은 왼쪽 열로 취급)"""
+        return max(0, bisect_right(self.day_columns, x) - 1)
+
+    def on_touch_down(self, touch):
+        if super().on_touch_down(touch):
+            return True
+        if isinstance(self.card_layer, CanvasCardLayer) and self.collide_point(*touch.pos):
+            card = self.card_layer.hit_test(touch.x, touch.y, self.day_index_at(touch.x))
+            if card is not None and self.on_card_press:
+                self.on_card_press(card)
+                return True
+        return False
+
     def get_day_column_x(self, day_index):
         """요일 인덱스에 따른 x 좌표 반환 (요일 열의 중앙에 맞춤)"""
         if 0 <= day_index < len(self.day_columns):
@@ -170,51 +528,155 @@ class TimeGridWidget(Widget):
             return self.day_columns[day_index]
         return self.x  # 기본값
 
-    def update_canvas(self, *args):
-        """그리드 캔버스 업데이트 - 그리드 라인 그리기"""
+    def _build_canvas(self, shape):
+        """그리드 캔버스 명령을 한 번만 생성 - 이후 크기가 바뀌면 update_canvas에서 좌표만 갱신"""
+        hour_line_count, slot_line_count, day_line_count = shape
         self.canvas.clear()
-        with self.canvas:
-            # 배경 설정
+        target = self.canvas
+        if self.cache_background:
+            # 그리드는 Fbo 안에 (0, 0) 기준으로 그리고, 위젯 캔버스에는 그 텍스처만 표시
+            self._fbo = Fbo(size=self.size)
+            with self._fbo:
+                ClearColor(0, 0, 0, 0)
+                ClearBuffers()
+            # Fbo도 위젯 캔버스에 넣어야 렌더링됨 (텍스처를 표시하는 Rectangle보다 먼저)
+            self.canvas.add(self._fbo)
+            with self.canvas:
+                Color(1, 1, 1, 1)
+                self._texture_rect = Rectangle(pos=self.pos, size=self.size, texture=self._fbo.texture)
+            target = self._fbo
+        self._drawn_size = None
+
+        with target:
+            # 배경
             Color(0.95, 0.95, 0.95, 1)
-            Rectangle(pos=self.pos, size=self.size)
+            self._background = Rectangle()
 
-            # 수평선 그리기 (시간대 구분선)
-            hours_count = self.end_hour - self.start_hour
-            hour_height = self.height / hours_count
-            
-            # 주요 시간 구분선 (실선)
+            # 주요 시간 구분선 (실선, 맨 아래 선 포함)
             Color(0.8, 0.8, 0.8, 1)
-            # 위에서 아래로 시간이 증가하도록 그리기
-            for i in range(hours_count + 1):  # + 1 to draw the bottom line
-                y = self.y + self.height - i * hour_height  # 위에서부터 그리기 시작
-                Line(points=[self.x, y, self.x + self.width, y], width=1)
+            self._hour_lines = [Line(width=1) for _ in range(hour_line_count)]
 
-            # 15분 간격 라인 (약한 점선)
+            # 슬롯 간격 라인 (약한 점선, 기본 15분)
             Color(0.9, 0.9, 0.9, 1)
-            for i in range(hours_count):
-                for j in range(1, 4):  # 15분, 30분, 45분
-                    y = self.y + self.height - (i * hour_height + j * (hour_height / 4))
-                    Line(points=[self.x, y, self.x + self.width, y], width=0.5)
+            self._slot_lines = [Line(width=0.5) for _ in range(slot_line_count)]
 
-            # 요일 구분 수직선 그리기
+            # 요일 구분 수직선 (시간 열과 첫 요일 구분선 ~ 마지막 요일 끝 선)
             Color(0.8, 0.8, 0.8, 1)
-            # 첫 번째 세로선 (시간 열과 월요일 구분)
-            Line(points=[self.x, self.y, self.x, self.y + self.height], width=1)
-            
-            # 나머지 요일 구분선
-            for i in range(1, self.num_days):
-                x = self.x + i * (self.day_col_width + self.spacing)
-                Line(points=[x, self.y, x, self.y + self.height], width=1)
-            
-            # 마지막 세로선 (금요일 끝)
-            x_end = self.x + self.num_days * (self.day_col_width + self.spacing) - self.spacing
-            Line(points=[x_end, self.y, x_end, self.y + self.height], width=1)
-            
-            # 요일 컬럼 위치 업데이트 (각 요일 열의 왼쪽 경계 저장)
-            self.day_columns = []
-            for i in range(self.num_days):
-                col_x = self.x + i * (self.day_col_width + self.spacing)
-                self.day_columns.append(col_x)
+            self._day_lines = [Line(width=1) for _ in range(day_line_count)]
+
+        self._canvas_shape = shape
+        self.canvas_stats['builds'] += 1
+        self.canvas_stats['instructions_created'] += (
+            4 + 1 + len(self._hour_lines) + len(self._slot_lines) + len(self._day_lines)
+        )
+
+    def update_canvas(self, *args):
+        """그리드 캔버스 업데이트 - 좌표 표를 다시 만들고 기존 Line/Rectangle의 좌표만 바꿈
+
+        시간/슬롯/요일 수가 바뀔 때만 명령을 다시 생성한다.
+        """
+        self._update_geometry()
+        if self.on_geometry_change:
+            self.on_geometry_change()
+        geometry = self.geometry
+        hour_ys = geometry.hour_line_ys()
+        slot_ys = geometry.slot_line_ys()
+        column_xs = geometry.column_line_xs()
+        shape = (len(hour_ys), len(slot_ys), len(column_xs))
+        if self._canvas_shape != shape:
+            self._build_canvas(shape)
+        self.canvas_stats['updates'] += 1
+
+        # Fbo에 그릴 때는 위젯 위치와 상관없이 (0, 0) 기준
+        dx, dy = 0, 0
+        if self.cache_background:
+            # 위치만 바뀌었으면 텍스처를 옮기기만 하고 Fbo는 다시 그리지 않음
+            self._texture_rect.pos = self.pos
+            if self._drawn_size == tuple(self.size):
+                return
+            self._drawn_size = tuple(self.size)
+            self._fbo.size = self.size  # 크기가 바뀌면 텍스처도 새로 만들어짐
+            self._texture_rect.size = self.size
+            self._texture_rect.texture = self._fbo.texture
+            self.canvas_stats['fbo_renders'] += 1
+            dx, dy = -self.x, -self.y
+
+        left, right = self.x + dx, self.x + self.width + dx
+        bottom, top = self.y + dy, geometry.top + dy
+
+        self._background.pos = (left, bottom)
+        self._background.size = (self.width, self.height)
+
+        # 위에서 아래로 시간이 증가하도록 그리기
+        for line, line_y in zip(self._hour_lines, hour_ys):
+            line.points = [left, line_y + dy, right, line_y + dy]
+
+        for line, line_y in zip(self._slot_lines, slot_ys):
+            line.points = [left, line_y + dy, right, line_y + dy]
+
+        # 첫 번째 세로선과 요일 구분선은 각 열의 왼쪽 경계, 마지막 선은 마지막 요일 끝
+        for line, line_x in zip(self._day_lines, column_xs):
+            line.points = [line_x + dx, bottom, line_x + dx, top]
+
+        if self.cache_background:
+            # 좌표를 바꾼 뒤 텍스처에 바로 그려 둠 (다음 프레임까지 빈 텍스처가 보이지 않도록)
+            self._fbo.draw()
+
+    def get_canvas_stats(self):
+        """캔버스 재사용 통계 - 갱신 한 번에 새로 만든 명령 수 (재사용되면 0에 가까움)"""
+        stats = dict(self.canvas_stats)
+        stats['instructions_per_update'] = (
+            stats['instructions_created'] / stats['updates'] if stats['updates'] else 0.0
+        )
+        return stats
+
+def render_widget_to_texture(widget):
+    """위젯(자식 포함)을 Fbo에 한 번 그려서 텍스처로 반환 - 위젯은 부모 캔버스에 붙어 있지 않아야 함"""
+    fbo = Fbo(size=widget.size, with_stencilbuffer=True)
+    with fbo:
+        ClearColor(0, 0, 0, 0)
+        ClearBuffers()
+        Translate(-widget.x, -widget.y, 0)
+    fbo.add(widget.canvas)
+    fbo.draw()
+    texture = fbo.texture
+    fbo.remove(widget.canvas)
+    return texture
+
+
+class TextureSnapshot(Widget):
+    """정적인 위젯을 텍스처로 바꿔 Rectangle 하나로 그리는 대역
+
+    원본 위젯은 위젯 트리에서 빼서 보관하고, 크기가 바뀌면 refresh()로 다시 찍는다.
+    """
+    def __init__(self, source, **kwargs):
+        super().__init__(**kwargs)
+        self.source = source
+        self.size_hint = (None, None)
+        self.size = source.size
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self._rect = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._update_rect)
+        self.refresh()
+
+    def _update_rect(self, *args):
+        self._rect.pos = self.pos
+
+    def refresh(self, *args):
+        self.size = self.source.size
+        self._rect.size = self.size
+        self._rect.texture = render_widget_to_texture(self.source)
+
+
+def replace_with_snapshot(widget):
+    """레이아웃 안의 widget을 같은 자리의 TextureSnapshot으로 교체"""
+    parent = widget.parent
+    index = parent.children.index(widget)
+    parent.remove_widget(widget)
+    snapshot = TextureSnapshot(widget)
+    parent.add_widget(snapshot, index=index)
+    return snapshot
 
 def create_headers(layout_data):
     headers = MDBoxLayout(
@@ -236,11 +698,10 @@ def create_headers(layout_data):
         font_name=FONT_NAME  # FONT_NAME 변수 사용
     ))
 
-    # 요일 헤더
-    days = ["월요일", "화요일", "수요일", "목요일", "금요일"]
-    for day in days:
+    # 요일 헤더 (LayoutConfig.days 순서)
+    for day in layout_data['days']:
         headers.add_widget(MDLabel(
-            text=day,
+            text=korean_day_map[day],
             halign="center",
             valign="center",
             size_hint_x=None,
@@ -250,83 +711,134 @@ def create_headers(layout_data):
 
     return headers
 
-class AddClassDialog:
-    """과목 추가 대화상자 클래스"""
+class ClassEditorDialog:
+    """과목 추가/수정 대화상자 - 위젯 트리 하나를 두 모드가 공유
+
+    처음 열 때 한 번만 만들고, 추가 모드는 입력값을 초기화하고 수정 모드는 카드 데이터로 채워서 재사용한다.
+    """
+    MODE_ADD = "add"
+    MODE_EDIT = "edit"
+
     def __init__(self, screen):
         self.screen = screen
         self.dialog = None
-        self.day_dropdown = None
+        self.mode = self.MODE_ADD
+        self.editing_card = None
         self.current_day = "Monday"  # 기본값
         
         # 현재 등록된 가장 높은 클래스 ID 찾기
         self.next_class_id = 1
-    
-        # 시간 드롭다운 변수 초기화
+        
+        # 시간 드롭다운 변수 초기화 (메뉴와 항목은 처음 열 때 한 번만 생성)
         self.start_time_dropdown = None
         self.end_time_dropdown = None
+        self._start_time_items = None
+        self._end_time_items = None
+        self._end_time_minutes = []
+        self._end_items_by_start = {}
+        self._end_menu_start = None
+        self.selected_color = None
+        self.color_buttons = []
         
         # 🔥 스크롤뷰 참조 저장용
         self.scroll_view = None
 
+        # 처음 열 때만 폰트/키보드 스크롤 설정
+        self._open_setup_done = False
+        self.open_latency = OpenLatencyTracker("과목 편집 대화상자")
+        
+        # 과목 색상 정의
+        self.class_colors = [
+            (0.9, 0.5, 0.2, 1),    # 주황색 (Orange)
+            (0.8, 0.3, 0.6, 1),    # 분홍색 (Pink)
+            (0.6, 0.2, 0.2, 1),    # 진한 빨간색 (Dark Red)
+            (0.3, 0.9, 0.5, 1),    # 민트 그린 (Mint Green)  
+            (0.4, 0.8, 1.0, 1),    # 하늘색 (Sky Blue)
+            (0.3, 0.55, 0.96, 1),   # 진한 파란색 (Deep Blue)
+            (0.5, 0.4, 0.8, 1),    # 보라색 (Purple)
+            (0.7, 0.7, 0.7, 1),    # 진한 회색 (Dark Gray)
+        ]
+        self.selected_button_index = 0
+    
+    def time_slots(self):
+        """시간표 그리드 범위에서 만든 선택 가능한 시각 (한 번만 계산해서 캐시)"""
+        return time_slot_options(LayoutConfig.start_hour, LayoutConfig.end_hour, LayoutConfig.slot_minutes)
+
+    def _build_time_items(self):
+        """드롭다운 항목을 한 번만 생성 - 시작 시간은 마지막 칸 제외, 종료 시간은 첫 칸 제외"""
+        slots = self.time_slots()
+        self._start_time_items = [
+            {
+                "text": time_str,
+                "viewclass": "OneLineListItem",
+                "on_release": lambda x=time_str: self.set_start_time(x),
+            }
+            for time_str, _ in slots[:-1]
+        ]
+        self._end_time_items = [
+            {
+                "text": time_str,
+                "viewclass": "OneLineListItem",
+                "on_release": lambda x=time_str: self.set_end_time(x),
+            }
+            for time_str, _ in slots[1:]
+        ]
+        self._end_time_minutes = [minutes for _, minutes in slots[1:]]
+        self._end_items_by_start = {}
+
+    def end_time_items(self, start_time):
+        """start_time 이후의 종료 시간 항목 - 미리 만든 목록에서 잘라내고 시작 시간별로 캐시"""
+        if self._end_time_items is None:
+            self._build_time_items()
+        start_minutes = -1
+        if start_time:
+            hour, minute = map(int, start_time.split(':'))
+            start_minutes = hour * 60 + minute
+
+        items = self._end_items_by_start.get(start_minutes)
+        if items is None:
+            first = bisect_right(self._end_time_minutes, start_minutes)
+            # 메뉴가 첫/마지막 항목 dict에 모서리 값을 써넣으므로 잘라낸 목록마다 얕은 복사
+            items = [dict(item) for item in self._end_time_items[first:]]
+            self._end_items_by_start[start_minutes] = items
+        return start_minutes, items
+
     def show_start_time_dropdown(self, instance, value):
-        """시작 시간 드롭다운 메뉴 표시"""
+        """시작 시간 드롭다운 메뉴 표시 - 메뉴는 처음 한 번만 생성"""
+        from kivymd.uix.menu import MDDropdownMenu
         if value:  # 텍스트 필드가 포커스를 얻으면
-            # 시간 옵션 생성 (09:00부터 18:45까지 15분 간격)
-            time_options = []
-            for hour in range(9, 19):  # 9시부터 18시까지
-                for minute in [0, 15, 30, 45]:  # 15분 간격
-                    time_str = f"{hour:02d}:{minute:02d}"
-                    time_options.append({
-                        "text": time_str,
-                        "viewclass": "OneLineListItem",
-                        "on_release": lambda x=time_str: self.set_start_time(x),
-                    })
-            
-            # 드롭다운 메뉴 생성 (높이 제한 및 스크롤 가능)
-            self.start_time_dropdown = MDDropdownMenu(
-                caller=instance,  # 텍스트 필드를 기준으로 표시
-                items=time_options,
-                width_mult=3,  # width_mult
-                max_height=dp(250),  # 높이 제한
-                position="auto"  # 자동 위치
-            )
+            if self.start_time_dropdown is None:
+                if self._start_time_items is None:
+                    self._build_time_items()
+                # 드롭다운 메뉴 생성 (높이 제한 및 스크롤 가능)
+                self.start_time_dropdown = MDDropdownMenu(
+                    caller=instance,  # 텍스트 필드를 기준으로 표시
+                    items=self._start_time_items,
+                    width_mult=3,
+                    max_height=dp(250),  # 높이 제한
+                    position="auto"  # 자동 위치
+                )
             self.start_time_dropdown.open()
 
     def show_end_time_dropdown(self, instance, value):
-        """종료 시간 드롭다운 메뉴 표시"""
+        """종료 시간 드롭다운 메뉴 표시 - 시작 시간이 바뀐 경우에만 항목 교체"""
+        from kivymd.uix.menu import MDDropdownMenu
         if value:  # 텍스트 필드가 포커스를 얻으면
-            # 시간 옵션 생성 (09:15부터 19:00까지 15분 간격)
-            time_options = []
-            
-            # 시작 시간이 선택되지 않았으면 모든 시간 표시
-            if not self.start_time_field.text:
-                start_hour = 9
-                start_minute = 0
-            else:
-                # 시작 시간이 선택되었으면 그 이후 시간만 표시
-                start_time = self.start_time_field.text
-                start_hour, start_minute = map(int, start_time.split(':'))
-            
-            # 시작 시간 이후의 옵션만 생성
-            for hour in range(9, 20):  # 9시부터 19시까지
-                for minute in [0, 15, 30, 45]:  # 15분 간격
-                    # 시작 시간보다 늦은 시간만 포함
-                    if (hour > start_hour) or (hour == start_hour and minute > start_minute):
-                        time_str = f"{hour:02d}:{minute:02d}"
-                        time_options.append({
-                            "text": time_str,
-                            "viewclass": "OneLineListItem",
-                            "on_release": lambda x=time_str: self.set_end_time(x),
-                        })
-            
-            # 드롭다운 메뉴 생성 (높이 제한 및 스크롤 가능)
-            self.end_time_dropdown = MDDropdownMenu(
-                caller=instance,  # 텍스트 필드를 기준으로 표시
-                items=time_options,
-                width_mult=3,  # width_mult 대신 직접 너비 설정
-                max_height=dp(250),  # 높이 제한
-                position="auto"  # 자동 위치
-            )
+            # 시작 시간이 선택되지 않았으면 모든 시간, 선택되었으면 그 이후 시간만 표시
+            start_minutes, items = self.end_time_items(self.start_time_field.text)
+            
+            if self.end_time_dropdown is None:
+                # 드롭다운 메뉴 생성 (높이 제한 및 스크롤 가능)
+                self.end_time_dropdown = MDDropdownMenu(
+                    caller=instance,  # 텍스트 필드를 기준으로 표시
+                    items=items,
+                    width_mult=3,
+                    max_height=dp(250),  # 높이 제한
+                    position="auto"  # 자동 위치
+                )
+            elif start_minutes != self._end_menu_start:
+                self.end_time_dropdown.items = items
+            self._end_menu_start = start_minutes
             self.end_time_dropdown.open()
             
     def set_start_time(self, time_str):
@@ -334,7 +846,7 @@ class AddClassDialog:
         self.start_time_field.text = time_str
         self.start_time_field.focus = False  # 포커스 해제
         
-        if hasattr(self, 'start_time_dropdown'):
+        if self.start_time_dropdown:
             self.start_time_dropdown.dismiss()  # 드롭다운 닫기
         
         # 종료 시간이 설정되어 있고 시작 시간보다 빠르다면 초기화
@@ -346,10 +858,9 @@ class AddClassDialog:
         self.end_time_field.text = time_str
         self.end_time_field.focus = False  # 포커스 해제
         
-        if hasattr(self, 'end_time_dropdown'):
+        if self.end_time_dropdown:
             self.end_time_dropdown.dismiss()  # 드롭다운 닫기
-
-    # ← 여기에 새 메서드들 추가!
+    
     def on_start_time_touch(self, instance, touch):
         """시작 시간 필드 터치 이벤트"""
         if instance.collide_point(*touch.pos):
@@ -362,11 +873,26 @@ class AddClassDialog:
         if instance.collide_point(*touch.pos):
             self.show_end_time_dropdown(instance, True)
             return True
-        return False    
+        return False
+    
+    def set_day(self, english_day, korean_day):
+        """요일 설정"""
+        self.current_day = english_day
+        self.day_field.text = korean_day
+        # 포커스 해제
+        self.day_field.focus = False
     
-    # 여기에 새 메서드를 추가합니다
+    def set_color(self, color, index):
+        """선택된 색상 설정"""
+        self.selected_color = color
+        # 버튼 높이를 업데이트하여 선택 표시
+        for i, btn in enumerate(self.color_buttons):
+            btn.elevation = 3 if i == index else 0
+        self.selected_button_index = index
+        
     def apply_fonts_to_dialog(self, instance):
         """다이얼로그 내 모든 위젯에 폰트 설정"""
+        from kivymd.uix.textfield import MDTextField
         try:
             # 다이얼로그 타이틀에 폰트 설정
             if hasattr(self.dialog, '_title'):
@@ -410,833 +936,69 @@ class AddClassDialog:
                 textfield._line_lbl.font_name = FONT_NAME
         except Exception as e:
             print(f"텍스트 필드 폰트 설정 오류: {e}")
-
-    def set_color(self, color, index):
-        """선택된 색상 설정"""
-        self.selected_color = color
-        # 버튼 높이를 업데이트하여 선택 표시
-        for i, btn in enumerate(self.color_buttons):
-            btn.elevation = 3 if i == index else 0
-        self.selected_button_index = index
         
-    def show_dialog(self, *args):
-        """과목 추가 대화상자 표시"""
-        if not self.dialog:
-            self.create_dialog(edit_mode=False)
-        self.dialog.open()
-
-
-        
-    def create_dialog(self, edit_mode=False, class_id=None):
-        """대화상자 생성 - 키보드 자동 스크롤 포함"""
-        
-        # 🔥 ScrollView로 감싸기 (키보드 가림 방지)
-        self.scroll_view = ScrollView(
-            size_hint_y=None,
-            height=dp(400),  # 전체 높이를 줄여서 키보드 공간 확보
-            do_scroll_x=False,
-            do_scroll_y=True,
-            bar_width=dp(4),
-            scroll_type=['bars', 'content'],
-            effect_cls='ScrollEffect'  # 부드러운 스크롤 효과
-        )
-        
-        # 대화상자 내용 레이아웃
-        self.content = MDBoxLayout(
-            orientation="vertical",
-            spacing=dp(5),
-            size_hint_y=None,
-            height=dp(760),  # 높이를 조금 늘려서 충분한 스크롤 공간 확보
-            padding=(dp(20), dp(20), dp(20), dp(15))
-        )
-        
-        
-        # MDTextField의 폰트 속성을 직접 설정하기 위한 함수
-        def set_font_for_textfield(textfield):
-            # TextField의 모든 하위 위젯에 폰트 설정 시도
-            try:
-                textfield.font_name = FONT_NAME
-                # 힌트 텍스트와 헬퍼 텍스트도 함께 설정
-                if hasattr(textfield, '_hint_lbl'):
-                    textfield._hint_lbl.font_name = FONT_NAME
-                if hasattr(textfield, '_helper_text'):
-                    textfield._helper_text.font_name = FONT_NAME
-                # 메인 텍스트 레이블 설정
-                if hasattr(textfield, '_line_lbl'):
-                    textfield._line_lbl.font_name = FONT_NAME
-            except Exception as e:
-                print(f"텍스트 필드 폰트 설정 오류: {e}")
-        
-        # 과목명 입력
-        self.name_field = MDTextField(
-            hint_text="Class Name",
-            helper_text="Ex: Physics1",
-            helper_text_mode="on_focus",
-            height=dp(20),
-            font_name=FONT_NAME  # FONT_NAME 변수 사용
-        )
-        set_font_for_textfield(self.name_field)
-        self.content.add_widget(self.name_field)
-        
-        
-        # 요일 선택 필드
-        self.day_field = MDTextField(
-            hint_text="Day of the week",
-            helper_text_mode="on_focus",
-            font_name=FONT_NAME,
-            height=dp(20),
-            readonly=True
-        )
-    
-        self.day_field.font_size = "15.5sp" 
-        set_font_for_textfield(self.day_field)
-        self.content.add_widget(self.day_field)
-        
-        # 요일 버튼 레이아웃 추가
-        days_layout = MDBoxLayout(
-            orientation='horizontal',
-            size_hint_y=None,
-            height=dp(20),
-            spacing=dp(0),
-            padding=(-40, 0, 0, 0),
-            adaptive_width=False
-        )
-        
-        # 한글 요일 이름과 영어 요일 매핑 사용
-        day_names = {
-            "Monday": "월",
-            "Tuesday": "화",
-            "Wednesday": "수",
-            "Thursday": "목", 
-            "Friday": "금"
-        }
-        
-        for day, day_kr in day_names.items():
-            day_btn = MDFlatButton(
-                text=day_kr,  # 한글 요일 표시
-                font_name=FONT_NAME,
-                on_release=lambda x, d=day, k=day_names[day]: self.set_day(d, k),
-                size_hint_x=None,
-                width=dp(20)
-            )
-            days_layout.add_widget(day_btn)
-        
-        self.content.add_widget(days_layout)
-    
-        # 시작 시간 - 텍스트 필드를 드롭다운 선택으로 변경
-        self.start_time_field = MDTextField(
-            hint_text="Start Time",
-            helper_text="Click to select time",
-            helper_text_mode="on_focus",
-            height=dp(20),
-            font_name=FONT_NAME,
-            readonly=True  # 직접 입력 불가능하게 설정
-        )
-        self.start_time_field.bind(on_touch_down=self.on_start_time_touch)
-        set_font_for_textfield(self.start_time_field)
-        self.content.add_widget(self.start_time_field)
-        
-        # 종료 시간 - 텍스트 필드를 드롭다운 선택으로 변경
-        self.end_time_field = MDTextField(
-            hint_text="End Time",
-            helper_text="Click to select time",
-            helper_text_mode="on_focus",
-            height=dp(20),
-            font_name=FONT_NAME,
-            readonly=True  # 직접 입력 불가능하게 설정
-        )
-        self.end_time_field.bind(on_touch_down=self.on_end_time_touch)
-        set_font_for_textfield(self.end_time_field)
-        self.content.add_widget(self.end_time_field)
-        
-        # 강의실
-        self.room_field = MDTextField(
-            hint_text="Class Room",
-            helper_text="Ex: 61304A",
-            helper_text_mode="on_focus",
-            height=dp(20),
-            font_name=FONT_NAME
-        )
-        set_font_for_textfield(self.room_field)
-        self.content.add_widget(self.room_field)
-        
-        # 교수명
-        self.professor_field = MDTextField(
-            hint_text="Professor",
-            helper_text="Ex: Kim Bumjun",
-            helper_text_mode="on_focus",
-            height=dp(20),
-            font_name=FONT_NAME
-        )
-        set_font_for_textfield(self.professor_field)
-        self.content.add_widget(self.professor_field)
-    
-        
-        # 시작 시간 필드와 days_layout 사이에 작은 간격 위젯 추가
-        spacer = Widget(size_hint_y=None, height=dp(10))  # 아주 작은 간격
-        self.content.add_widget(spacer)
-    
-        # 색상 선택 라벨
-        self.color_label = MDLabel(
-            text="Color Selection", 
-            theme_text_color="Secondary",
-            font_style="Body2",
-            font_name=FONT_NAME,  # FONT_NAME 변수 사용
-            size_hint_y=None,
-            height=dp(16)
-        )
-        self.color_label.font_size = "15.5sp" 
-        self.content.add_widget(self.color_label)
-    
-        # 색상 선택 버튼들
-        colors_layout = MDBoxLayout(
-            orientation='horizontal',
-            size_hint_y=None,
-            height=dp(40),  # 작은 높이
-            spacing=dp(2)   # 좁은 간격
-        )
-    
-        # 과목 색상 정의
-        self.class_colors = [
-            (0.9, 0.5, 0.2, 1),    # 주황색 (Orange)
-            (0.8, 0.3, 0.6, 1),    # 분홍색 (Pink)
-            (0.6, 0.2, 0.2, 1),    # 진한 빨간색 (Dark Red)
-            (0.3, 0.9, 0.5, 1),    # 민트 그린 (Mint Green)  
-            (0.4, 0.8, 1.0, 1),    # 하늘색 (Sky Blue)
-            (0.3, 0.55, 0.96, 1),   # 진한 파란색 (Deep Blue)
-            (0.5, 0.4, 0.8, 1),    # 보라색 (Purple)
-            (0.7, 0.7, 0.7, 1),    # 진한 회색 (Dark Gray)
-        ]
-        
-        self.selected_color = self.class_colors[0]  # 기본 색상
-        self.color_buttons = []
-    
-        for i, color in enumerate(self.class_colors):
-            # MDRectangleFlatButton 대신 MDCard 사용
-            from kivymd.uix.card import MDCard
-            color_btn = MDCard(
-                size_hint=(None, None),
-                size=(dp(35), dp(35)),  # 작은 크기
-                md_bg_color=color,
-                radius=[dp(2)],  # 약간의 모서리 둥글기
-                elevation=1 if i == 0 else 0  # 첫 번째 버튼은 선택된 상태로 표시
-            )
-            # 터치 이벤트 추가
-            color_btn.bind(on_touch_down=lambda instance, touch, c=color, i=i: 
-                        self.set_color(c, i) if instance.collide_point(*touch.pos) else None)
-            
-            self.color_buttons.append(color_btn)
-            colors_layout.add_widget(color_btn)
-        
-        # 첫 번째 버튼을 선택된 상태로 설정
-        self.selected_button_index = 0
-        self.color_buttons[0].elevation = 3
-        self.content.add_widget(colors_layout)
-    
-    
-        # 시작 시간 필드와 days_layout 사이에 작은 간격 위젯 추가
-        spacer = Widget(size_hint_y=None, height=dp(10))  # 아주 작은 간격
-        self.content.add_widget(spacer)
-    
-        self.notify_label = MDLabel(
-            text="Set Alarm",
-            theme_text_color="Secondary",
-            font_style="Body2",
-            font_name=FONT_NAME,
-            size_hint_y=None,
-            height=dp(20)
-        )
-    
-        self.notify_label.font_size = "15.5sp" 
-        self.content.add_widget(self.notify_label)
-    
-        # 입력창과 "Minute" 텍스트를 함께 표시할 수평 레이아웃
-        notify_layout = MDBoxLayout(
-            orientation="horizontal",
-            size_hint_y=None,
-            height=dp(45),
-            spacing=dp(5),
-            padding=[0, 0, 0, 0]
-        )
-    
-        # 숫자 입력 필드 (더 좁게 설정)
-        self.notify_input = MDTextField(
-            hint_text="",  # 힌트 텍스트 제거
-            input_filter="int",
-            text="5",
-            font_name=FONT_NAME,
-            size_hint_x=0.2,  # 너비 30%로 제한
-        )
-    
-        set_font_for_textfield(self.notify_input)
-    
-        # "Minute" 레이블
-        minute_label = MDLabel(
-            text="Minutes Before",
-            theme_text_color="Secondary",
-            font_name=FONT_NAME,
-            size_hint_x=0.8,  # 나머지 70% 차지
-            halign="left",
-            valign="center"
-        )
-    
-    
-        # 레이아웃에 위젯 추가
-        notify_layout.add_widget(self.notify_input)
-        notify_layout.add_widget(minute_label)
-    
-        # 메인 컨텐트에 레이아웃 추가
-        self.content.add_widget(notify_layout)
-        
-        # 🔥 키보드 가림 방지용 여분 공간 추가 (더 넉넉하게)
-        extra_spacer = Widget(size_hint_y=None, height=dp(150))
-        self.content.add_widget(extra_spacer)
-    
-        # 🔥 ScrollView에 콘텐츠 추가
-        self.scroll_view.add_widget(self.content)
-    
-        # 다이얼로그 생성 후 글꼴 설정을 위한 함수
-        def post_dialog_open(dialog):
-            try:
-                # 다이얼로그 타이틀 폰트 설정
-                if hasattr(dialog, '_title'):
-                    dialog._title.font_name = FONT_NAME
-                
-                # content_cls 내부의 모든 텍스트 필드에 폰트 설정
-                if hasattr(dialog, 'content_cls'):
-                    for child in dialog.content_cls.children:
-                        if isinstance(child, MDTextField):
-                            set_font_for_textfield(child)
-                            
-                # 🔥 키보드 자동 스크롤 설정
-                Clock.schedule_once(lambda dt: self.setup_keyboard_scroll(), 0.2)
-            except Exception as e:
-                print(f"다이얼로그 폰트 설정 오류: {e}")
-                
-        # 버튼을 모드에 따라 다르게 설정
-        if edit_mode:
-            # 수정 모드: 취소, 삭제, 저장
-            buttons = [
-                MDFlatButton(
-                    text="취소",
-                    font_name=FONT_NAME,
-                    on_release=lambda x: self.dialog.dismiss()
-                ),
-                MDFlatButton(
-                    text="삭제", 
-                    font_name=FONT_NAME,
-                    theme_text_color="Custom",
-                    text_color=[1, 0.3, 0.3, 1],
-                    on_release=lambda x: self.screen.confirm_delete_class(class_id)
-                ),
-                MDRaisedButton(
-                    text="저장",
-                    font_name=FONT_NAME,
-                    on_release=lambda x: self.screen.save_edited_class(class_id)
-                )
-            ]
-        else:
-            # 추가 모드: 취소, 추가
-            buttons = [
-                MDFlatButton(
-                    text="취소",
-                    font_name=FONT_NAME,
-                    on_release=lambda x: self.dialog.dismiss()
-                ),
-                MDRaisedButton(
-                    text="추가",
-                    font_name=FONT_NAME,
-                    on_release=lambda x: self.add_class()
-                )
-            ]
-        
-        # 🔥 팝업 대화상자 생성 - ScrollView를 content로 사용
-        self.dialog = MDDialog(
-            title="새 과목 추가" if not edit_mode else "과목 수정",
-            type="custom",
-            content_cls=self.scroll_view,  # ScrollView를 content로 사용
-            size_hint=(0.90, 0.75),   # 높이를 75%로 조정하여 더 많은 키보드 공간 확보
-            buttons=buttons
-        )
-        
-        # 다이얼로그가 열릴 때 한 번 더 글꼴 설정 및 키보드 스크롤 설정
-        self.dialog.bind(on_open=lambda *args: post_dialog_open(self.dialog))
-
-        # 이 부분 추가
-        print(f"🔍 다이얼로그 생성됨: {self.dialog}")
-        print(f"🔍 버튼 개수: {len(buttons) if buttons else 0}")
-        for i, btn in enumerate(buttons):
-            print(f"🔍 버튼 {i}: {btn.text}")
-
-    def setup_keyboard_scroll(self):
-        """키보드 올라올 때 자동 스크롤 설정 - 개선된 버전"""
-        # 각 텍스트 필드에 포커스 이벤트 바인딩
-        fields = [
-            self.name_field, 
-            self.room_field, 
-            self.professor_field, 
-            self.notify_input
-        ]
-        
-        print(f"🔧 자동 스크롤 설정: {len(fields)}개 필드")
-        
-        for i, field in enumerate(fields):
-            print(f"   {i+1}. {field.hint_text}")
-            field.bind(focus=self.on_field_focus)
-            # 터치 이벤트도 추가로 바인딩
-            field.bind(on_touch_down=lambda instance, touch: self.on_field_touch(instance, touch))
-    
-    def on_field_focus(self, instance, value):
-        """텍스트 필드에 포커스가 갈 때 호출"""
-        if value and self.scroll_view:  # 포커스를 얻었을 때
-            print(f"🎯 필드 포커스: {instance.hint_text}")
-            
-            # 🔥 상단 필드들(과목명, 요일)은 스크롤하지 않음
-            if hasattr(self, 'name_field') and instance == self.name_field:
-                print("📝 과목명 필드 - 스크롤 안 함")
-                return
-            elif hasattr(self, 'day_field') and instance == self.day_field:
-                print("📅 요일 필드 - 스크롤 안 함")
-                return
-            # 🔥 하단 필드들(교수명, 알람 설정)인 경우 최하단으로 스크롤
-            elif hasattr(self, 'professor_field') and instance == self.professor_field:
-                print("👨‍🏫 교수명 필드 - 최하단으로 스크롤")
-                Clock.schedule_once(lambda dt: self.smart_scroll_to_bottom(), 0.5)
-            elif hasattr(self, 'notify_input') and instance == self.notify_input:
-                print("🔽 알람 설정 필드 - 최하단으로 스크롤")
-                Clock.schedule_once(lambda dt: self.smart_scroll_to_bottom(), 0.5)
-            else:
-                # 중간 필드들(시간, 강의실)만 적당한 위치로 스크롤
-                print("📍 중간 필드 - 적당한 위치로 스크롤")
-                Clock.schedule_once(lambda dt: self.scroll_to_widget(instance), 0.6)
-    
-    def on_field_touch(self, instance, touch):
-        """텍스트 필드 터치 시 호출"""
-        if instance.collide_point(*touch.pos):
-            print(f"👆 필드 터치: {instance.hint_text}")
-            
-            # 🔥 상단 필드들(과목명, 요일)은 스크롤하지 않음
-            if hasattr(self, 'name_field') and instance == self.name_field:
-                print("📝 과목명 필드 터치 - 스크롤 안 함")
-                return False
-            elif hasattr(self, 'day_field') and instance == self.day_field:
-                print("📅 요일 필드 터치 - 스크롤 안 함")
-                return False
-            # 🔥 하단 필드들(교수명, 알람 설정)인 경우 최하단으로 스크롤
-            elif hasattr(self, 'professor_field') and instance == self.professor_field:
-                print("👨‍🏫 교수명 필드 터치 - 최하단으로 스크롤")
-                Clock.schedule_once(lambda dt: self.smart_scroll_to_bottom(), 0.3)
-            elif hasattr(self, 'notify_input') and instance == self.notify_input:
-                print("🔽 알람 설정 필드 터치 - 최하단으로 스크롤")
-                Clock.schedule_once(lambda dt: self.smart_scroll_to_bottom(), 0.3)
-            else:
-                # 중간 필드들만 적당한 위치로 스크롤
-                print("📍 중간 필드 터치 - 적당한 위치로 스크롤")
-                Clock.schedule_once(lambda dt: self.scroll_to_widget(instance), 0.3)
-            return False  # 이벤트 전파 계속
-
-    
-    def scroll_to_widget(self, widget):
-        """특정 위젯이 보이도록 부드럽게 스크롤 - 개선된 버전"""
-        if not self.scroll_view or not widget:
-            return
-            
-        try:
-            print(f"🎯 스크롤 대상: {widget.hint_text}")
-            
-            # 현재 ScrollView와 Content 정보
-            scroll_height = self.scroll_view.height
-            content_height = self.content.height
-            current_scroll = self.scroll_view.scroll_y
-            
-            print(f"📏 ScrollView 높이: {scroll_height}")
-            print(f"📏 Content 높이: {content_height}")
-            print(f"📏 현재 스크롤: {current_scroll:.2f}")
-            
-            # 위젯의 절대 위치 (content 기준)
-            widget_y_in_content = widget.y
-            widget_height = widget.height
-            widget_top = widget_y_in_content + widget_height
-            widget_bottom = widget_y_in_content
-            
-            print(f"📍 위젯 위치 (content 기준): y={widget_y_in_content}, 높이={widget_height}")
-            print(f"📍 위젯 상단: {widget_top}, 하단: {widget_bottom}")
-            
-            # 키보드 높이 고려 (실제 가시 영역 계산)
-            keyboard_height = dp(280)  # 일반적인 안드로이드 키보드 높이
-            visible_height = scroll_height - keyboard_height * 0.7  # 키보드가 70% 가림
-            
-            print(f"⌨️ 키보드 높이: {keyboard_height}")
-            print(f"👁️ 실제 가시 높이: {visible_height}")
-            
-            # 현재 보이는 영역 계산 (content 좌표계)
-            # scroll_y = 0 (최하단), scroll_y = 1 (최상단)
-            current_view_bottom = (1 - current_scroll) * content_height
-            current_view_top = current_view_bottom + visible_height
-            
-            print(f"👀 현재 보이는 영역: 하단={current_view_bottom:.1f}, 상단={current_view_top:.1f}")
-            
-            # 위젯이 가시 영역에 완전히 들어와야 하는 목표 위치 계산
-            margin = dp(50)  # 위젯 주변 여백
-            
-            # 위젯이 가시 영역 하단에 가려져 있는 경우
-            if widget_bottom < current_view_bottom + margin:
-                # 위젯 하단이 가시 영역 하단 근처에 오도록 스크롤
-                target_view_bottom = widget_bottom - margin
-                target_scroll_y = 1 - (target_view_bottom / content_height)
-                action = "하단 가림 해결"
-                
-            # 위젯이 가시 영역 상단에 가려져 있는 경우  
-            elif widget_top > current_view_top - margin:
-                # 위젯 상단이 가시 영역 상단 근처에 오도록 스크롤
-                target_view_top = widget_top + margin
-                target_view_bottom = target_view_top - visible_height
-                target_scroll_y = 1 - (target_view_bottom / content_height)
-                action = "상단 가림 해결"
-                
-            else:
-                # 위젯이 이미 보이는 상태
-                print("✅ 위젯이 이미 가시 영역에 있음 - 스크롤 불필요")
-                return
-            
-            # 스크롤 범위 제한 (0~1)
-            target_scroll_y = max(0.0, min(1.0, target_scroll_y))
-            
-            print(f"🎯 {action}: {current_scroll:.2f} → {target_scroll_y:.2f}")
-            
-            # 스크롤 변화량이 너무 작으면 스킵
-            if abs(target_scroll_y - current_scroll) < 0.05:
-                print("📏 스크롤 변화량이 너무 작음 - 스킵")
-                return
-            
-            # 부드러운 스크롤 애니메이션
-            from kivy.animation import Animation
-            anim = Animation(
-                scroll_y=target_scroll_y, 
-                duration=0.4,  # 조금 더 느리게
-                transition='out_quart'  # 더 부드러운 전환
-            )
-            anim.start(self.scroll_view)
-            
-            print(f"🚀 스크롤 애니메이션 시작: {target_scroll_y:.2f}")
-            
-        except Exception as e:
-            print(f"❌ 스크롤 계산 오류: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def smart_scroll_to_bottom(self):
-        """하단 필드 편집 시 자동으로 최하단으로 스크롤 - 들여쓰기 수정"""
-        if not self.scroll_view:
-            print("❌ scroll_view가 없음")
-            return
-            
-        try:
-            print(f"🔽 최하단 스크롤 시작")
-            print(f"   현재 scroll_y: {self.scroll_view.scroll_y:.2f}")
-            print(f"   목표 scroll_y: 0.0 (최하단)")
-            
-            # 부드럽게 최하단으로 스크롤
-            from kivy.animation import Animation
-            anim = Animation(
-                scroll_y=0,  # 0은 최하단
-                duration=0.4, 
-                transition='out_cubic'
-            )
-            
-            # 애니메이션 완료 시 콜백 - 🔥 들여쓰기 수정!
-            def on_complete(animation, widget):
-                print(f"✅ 최하단 스크롤 완료: {widget.scroll_y:.2f}")
-            
-            anim.bind(on_complete=on_complete)
-            anim.start(self.scroll_view)
-            
-            print("🚀 최하단 스크롤 애니메이션 시작")
-            
-        except Exception as e:
-            print(f"❌ 하단 스크롤 오류: {e}")
-            import traceback
-            traceback.print_exc()
-
-    
-    def set_day(self, english_day, korean_day):
-        """요일 설정"""
-        self.current_day = english_day
-        self.day_field.text = korean_day
-        # 포커스 해제
-        self.day_field.focus = False
-            
-    def dismiss_dialog(self, *args):
-        """대화상자 닫기"""
-        if self.dialog:
-            self.dialog.dismiss()
-            
-    def add_class(self, *args):
-        """새 과목 추가"""
-        # 입력값 가져오기
-        print("🔥🔥🔥 add_class 호출됨!")  # 이 줄만 추가
-        name = self.name_field.text.strip()
-        day = self.current_day
-        start_time = self.start_time_field.text.strip()
-        end_time = self.end_time_field.text.strip()
-        room = self.room_field.text.strip()
-        professor = self.professor_field.text.strip()
-        
-        # 🔥 알람 시간 가져오기 추가
-        notify_before = 5  # 기본값
-        if hasattr(self, 'notify_input') and self.notify_input.text.strip():
-            try:
-                notify_before = int(self.notify_input.text.strip())
-                print(f"🔔 사용자 설정 알람: {notify_before}분")
-            except ValueError:
-                notify_before = 5  # 잘못된 입력시 기본값
-                print(f"⚠️ 잘못된 알람 시간 입력, 기본값 사용: {notify_before}분")
-        
-        # 입력 검증
-        if not all([name, day, start_time, end_time, room, professor]):
-            # 경고 대화상자 표시 (한글 처리 개선)
-            warning_dialog = MDDialog(
-                title="입력 오류",
-                text="모든 필드를 입력해주세요.",
-                buttons=[
-                    MDFlatButton(
-                        text="확인",
-                        theme_text_color="Custom",
-                        text_color=self.screen.app.theme_cls.primary_color,
-                        font_name=FONT_NAME,
-                        on_release=lambda x: warning_dialog.dismiss()
-                    )
-                ]
-            )
-            # 경고 다이얼로그의 텍스트에 폰트 설정
-            warning_dialog.text_font_name = FONT_NAME
-            warning_dialog.open()
-            return
-            
-        # 색상 정보 준비
-        color_str = f"{self.selected_color[0]},{self.selected_color[1]},{self.selected_color[2]},{self.selected_color[3]}"
-        
-        # 🔥 시간표에 과목 추가 (알람 시간도 함께 전달)
-        success = self.screen.add_class_to_grid(
-            self.next_class_id, name, day, start_time, end_time, room, professor, color_str, notify_before
-        )
-        
-        if success:
-            print(f"✅ 과목 추가 완료: {name} (ID: {self.next_class_id}, 알람: {notify_before}분)")
-            self.next_class_id += 1
-            # 대화상자 닫기
-            self.dismiss_dialog()
-        else:
-            print(f"❌ 과목 추가 실패: {name}")
-
-
-class EditClassDialog:
-    """과목 수정 대화상자 클래스 - 완전히 독립적인 구현"""
-    def __init__(self, screen):
-        self.screen = screen
-        self.dialog = None
-        self.editing_card = None
-        self.day_dropdown = None
-        self.current_day = "Monday"  # 기본값
-        
-        # 시간 드롭다운 변수 초기화
-        self.start_time_dropdown = None
-        self.end_time_dropdown = None
-        self.selected_color = None
-        self.color_buttons = []
-        
-        # 🔥 스크롤뷰 참조 저장용
-        self.scroll_view = None
-        
-        # 과목 색상 정의 (AddClassDialog와 동일하게 유지)
-        self.class_colors = [
-            (0.9, 0.5, 0.2, 1),    # 주황색 (Orange)
-            (0.8, 0.3, 0.6, 1),    # 분홍색 (Pink)
-            (0.6, 0.2, 0.2, 1),    # 진한 빨간색 (Dark Red)
-            (0.3, 0.9, 0.5, 1),    # 민트 그린 (Mint Green)  
-            (0.4, 0.8, 1.0, 1),    # 하늘색 (Sky Blue)
-            (0.3, 0.55, 0.96, 1),   # 진한 파란색 (Deep Blue)
-            (0.5, 0.4, 0.8, 1),    # 보라색 (Purple)
-            (0.7, 0.7, 0.7, 1),    # 진한 회색 (Dark Gray)
-        ]
-        self.selected_button_index = 0
-    
-    def show_start_time_dropdown(self, instance, value):
-        """시작 시간 드롭다운 메뉴 표시"""
-        if value:  # 텍스트 필드가 포커스를 얻으면
-            # 시간 옵션 생성 (09:00부터 18:45까지 15분 간격)
-            time_options = []
-            for hour in range(9, 19):  # 9시부터 18시까지
-                for minute in [0, 15, 30, 45]:  # 15분 간격
-                    time_str = f"{hour:02d}:{minute:02d}"
-                    time_options.append({
-                        "text": time_str,
-                        "viewclass": "OneLineListItem",
-                        "on_release": lambda x=time_str: self.set_start_time(x),
-                    })
-            
-            # 드롭다운 메뉴 생성 (높이 제한 및 스크롤 가능)
-            self.start_time_dropdown = MDDropdownMenu(
-                caller=instance,  # 텍스트 필드를 기준으로 표시
-                items=time_options,
-                width_mult=3,  # width_mult
-                max_height=dp(250),  # 높이 제한
-                position="auto"  # 자동 위치
-            )
-            self.start_time_dropdown.open()
-
-    def show_end_time_dropdown(self, instance, value):
-        """종료 시간 드롭다운 메뉴 표시"""
-        if value:  # 텍스트 필드가 포커스를 얻으면
-            # 시간 옵션 생성 (09:15부터 19:00까지 15분 간격)
-            time_options = []
-            
-            # 시작 시간이 선택되지 않았으면 모든 시간 표시
-            if not self.start_time_field.text:
-                start_hour = 9
-                start_minute = 0
-            else:
-                # 시작 시간이 선택되었으면 그 이후 시간만 표시
-                start_time = self.start_time_field.text
-                start_hour, start_minute = map(int, start_time.split(':'))
-            
-            # 시작 시간 이후의 옵션만 생성
-            for hour in range(9, 20):  # 9시부터 19시까지
-                for minute in [0, 15, 30, 45]:  # 15분 간격
-                    # 시작 시간보다 늦은 시간만 포함
-                    if (hour > start_hour) or (hour == start_hour and minute > start_minute):
-                        time_str = f"{hour:02d}:{minute:02d}"
-                        time_options.append({
-                            "text": time_str,
-                            "viewclass": "OneLineListItem",
-                            "on_release": lambda x=time_str: self.set_end_time(x),
-                        })
-            
-            # 드롭다운 메뉴 생성 (높이 제한 및 스크롤 가능)
-            self.end_time_dropdown = MDDropdownMenu(
-                caller=instance,  # 텍스트 필드를 기준으로 표시
-                items=time_options,
-                width_mult=3,  # width_mult 대신 직접 너비 설정
-                max_height=dp(250),  # 높이 제한
-                position="auto"  # 자동 위치
-            )
-            self.end_time_dropdown.open()
-            
-    def set_start_time(self, time_str):
-        """시작 시간 설정"""
-        self.start_time_field.text = time_str
-        self.start_time_field.focus = False  # 포커스 해제
-        
-        if hasattr(self, 'start_time_dropdown'):
-            self.start_time_dropdown.dismiss()  # 드롭다운 닫기
-        
-        # 종료 시간이 설정되어 있고 시작 시간보다 빠르다면 초기화
-        if self.end_time_field.text and self.end_time_field.text <= time_str:
-            self.end_time_field.text = ""
-
-    def set_end_time(self, time_str):
-        """종료 시간 설정"""
-        self.end_time_field.text = time_str
-        self.end_time_field.focus = False  # 포커스 해제
-        
-        if hasattr(self, 'end_time_dropdown'):
-            self.end_time_dropdown.dismiss()  # 드롭다운 닫기
-    
-    def on_start_time_touch(self, instance, touch):
-        """시작 시간 필드 터치 이벤트"""
-        if instance.collide_point(*touch.pos):
-            self.show_start_time_dropdown(instance, True)
-            return True
-        return False
-
-    def on_end_time_touch(self, instance, touch):
-        """종료 시간 필드 터치 이벤트"""
-        if instance.collide_point(*touch.pos):
-            self.show_end_time_dropdown(instance, True)
-            return True
-        return False
-    
-    def set_day(self, english_day, korean_day):
-        """요일 설정"""
-        self.current_day = english_day
-        self.day_field.text = korean_day
-        # 포커스 해제
-        self.day_field.focus = False
-    
-    def set_color(self, color, index):
-        """선택된 색상 설정"""
-        self.selected_color = color
-        # 버튼 높이를 업데이트하여 선택 표시
-        for i, btn in enumerate(self.color_buttons):
-            btn.elevation = 3 if i == index else 0
-        self.selected_button_index = index
-        
-    def apply_fonts_to_dialog(self, instance):
-        """다이얼로그 내 모든 위젯에 폰트 설정"""
-        try:
-            # 다이얼로그 타이틀에 폰트 설정
-            if hasattr(self.dialog, '_title'):
-                self.dialog._title.font_name = FONT_NAME
-            
-            # content_cls 내부의 모든 위젯에 폰트 설정
-            if hasattr(self.dialog, 'content_cls'):
-                # 모든 텍스트 필드에 폰트 적용
-                for child in self.dialog.content_cls.children:
-                    if isinstance(child, MDTextField):
-                        self.set_font_for_textfield(child)
-                    elif isinstance(child, MDLabel):
-                        child.font_name = FONT_NAME
-                        # 레이블 폰트 크기 증가
-                        child.font_size = "16sp"
-                    elif isinstance(child, MDBoxLayout):
-                        # 중첩된 레이아웃 내부의 버튼에도 폰트 적용
-                        for grandchild in child.children:
-                            if hasattr(grandchild, 'font_name'):
-                                grandchild.font_name = FONT_NAME
-
-            # 버튼에 폰트 설정
-            if hasattr(self.dialog, 'buttons'):
-                for button in self.dialog.buttons:
-                    button.font_name = FONT_NAME
-        except Exception as e:
-            print(f"다이얼로그 폰트 설정 오류: {e}")
-
-    def set_font_for_textfield(self, textfield):
-        """MDTextField의 폰트 속성을 직접 설정하기 위한 함수"""
-        # TextField의 모든 하위 위젯에 폰트 설정 시도
-        try:
-            textfield.font_name = FONT_NAME
-            # 힌트 텍스트와 헬퍼 텍스트도 함께 설정
-            if hasattr(textfield, '_hint_lbl'):
-                textfield._hint_lbl.font_name = FONT_NAME
-            if hasattr(textfield, '_helper_text'):
-                textfield._helper_text.font_name = FONT_NAME
-            # 메인 텍스트 레이블 설정
-            if hasattr(textfield, '_line_lbl'):
-                textfield._line_lbl.font_name = FONT_NAME
-        except Exception as e:
-            print(f"텍스트 필드 폰트 설정 오류: {e}")
-        
-    def show_edit_dialog(self, card):
-        """과목 수정 대화상자 표시 - AddClassDialog와 동일한 패턴"""
-        self.editing_card = card
-        
-        # 기존 다이얼로그가 있으면 닫기
-        if self.dialog:
-            self.dialog.dismiss()
-            self.dialog = None
+    def show_add_dialog(self, *args):
+        """과목 추가 모드로 표시 - 입력값을 새 과목 기본값으로 초기화"""
+        self.editing_card = None
+        self._open(self.MODE_ADD)
         
-        # 새 다이얼로그 생성
-        self.create_edit_dialog()
+    def show_edit_dialog(self, card):
+        """과목 수정 모드로 표시 - 카드의 기존 데이터로 필드 채움"""
+        self.editing_card = card
+        self._open(self.MODE_EDIT, card.class_data)
+
+    def _open(self, mode, class_data=None):
+        built = not self.dialog
+        self.open_latency.start(built)
+        if built:
+            self.create_dialog()
         
-        # 기존 데이터로 필드 채우기
-        self.populate_fields_with_existing_data(card.class_data)
+        self.set_mode(mode)
+        if class_data is None:
+            self.reset_fields()
+        else:
+            self.populate_fields_with_existing_data(class_data)
+        self.scroll_view.scroll_y = 1
         
         # 다이얼로그 열기
         self.dialog.open()
+
+    def set_mode(self, mode):
+        """제목과 버튼을 모드에 맞게 변경 (삭제 버튼은 수정 모드에서만 표시)"""
+        self.mode = mode
+        is_edit = mode == self.MODE_EDIT
+        self.dialog.title = "과목 수정" if is_edit else "새 과목 추가"
+        self.submit_button.text = "저장" if is_edit else "추가"
+        self.delete_button.opacity = 1 if is_edit else 0
+        self.delete_button.disabled = not is_edit
+
+    def submit(self, *args):
+        """추가/저장 버튼"""
+        if self.mode == self.MODE_EDIT:
+            self.update_class()
+        else:
+            self.add_class()
+
+    def reset_fields(self):
+        """입력값을 새 과목 기본값으로 되돌림"""
+        for field in (self.name_field, self.day_field, self.start_time_field,
+                      self.end_time_field, self.room_field, self.professor_field):
+            field.text = ""
+            field.focus = False
+        self.current_day = LayoutConfig.days[0]
+        self.notify_input.text = "5"
+        self.set_color(self.class_colors[0], 0)
+
+    def dismiss_dialog(self, *args):
+        """대화상자 닫기"""
+        if self.dialog:
+            self.dialog.dismiss()
         
-    def create_edit_dialog(self):
-        """수정 다이얼로그 생성 - 키보드 자동 스크롤 포함"""
+
+    def create_dialog(self):
+        """대화상자 생성 - 키보드 자동 스크롤 포함 (두 모드 공통, 한 번만 호출)"""
+        from kivymd.uix.dialog import MDDialog
+        from kivymd.uix.textfield import MDTextField
         
         # 🔥 ScrollView로 감싸기 (키보드 가림 방지)
         self.scroll_view = ScrollView(
@@ -1295,20 +1057,13 @@ class EditClassDialog:
             adaptive_width=False
         )
         
-        # 한글 요일 이름과 영어 요일 매핑
-        day_names = {
-            "Monday": "월",
-            "Tuesday": "화",
-            "Wednesday": "수",
-            "Thursday": "목", 
-            "Friday": "금"
-        }
-        
-        for day, day_kr in day_names.items():
+        # 시간표에 표시되는 요일만 버튼으로 (한글 한 글자)
+        for day in LayoutConfig.days:
+            day_kr = KOREAN_SHORT_DAY_NAMES[day]
             day_btn = MDFlatButton(
                 text=day_kr,
                 font_name=FONT_NAME,
-                on_release=lambda x, d=day, k=day_names[day]: self.set_day(d, k),
+                on_release=lambda x, d=day, k=day_kr: self.set_day(d, k),
                 size_hint_x=None,
                 width=dp(20)
             )
@@ -1462,8 +1217,12 @@ class EditClassDialog:
         # 🔥 ScrollView에 콘텐츠 추가
         self.scroll_view.add_widget(self.content)
     
-        # 폰트 설정 함수
+        # 폰트 설정 함수 (재사용하는 위젯이므로 처음 열 때 한 번만)
         def post_dialog_open(dialog):
+            self.open_latency.finish()
+            if self._open_setup_done:
+                return
+            self._open_setup_done = True
             try:
                 if hasattr(dialog, '_title'):
                     dialog._title.font_name = FONT_NAME
@@ -1478,30 +1237,32 @@ class EditClassDialog:
             except Exception as e:
                 print(f"다이얼로그 폰트 설정 오류: {e}")
     
-        # 버튼 생성
+        # 버튼 생성 - 삭제 버튼과 추가/저장 버튼은 set_mode에서 모드에 맞게 바꿈
+        self.delete_button = MDFlatButton(
+            text="삭제",
+            font_name=FONT_NAME,
+            theme_text_color="Custom",
+            text_color=[1, 0.3, 0.3, 1],
+            on_release=lambda x: self.delete_class()
+        )
+        self.submit_button = MDRaisedButton(
+            text="추가",
+            font_name=FONT_NAME,
+            on_release=self.submit
+        )
         buttons = [
             MDFlatButton(
                 text="취소",
                 font_name=FONT_NAME,
                 on_release=lambda x: self.dialog.dismiss()
             ),
-            MDFlatButton(
-                text="삭제",
-                font_name=FONT_NAME,
-                theme_text_color="Custom",
-                text_color=[1, 0.3, 0.3, 1],
-                on_release=lambda x: self.delete_class()
-            ),
-            MDRaisedButton(
-                text="저장",
-                font_name=FONT_NAME,
-                on_release=lambda x: self.update_class()
-            )
+            self.delete_button,
+            self.submit_button
         ]
         
         # 🔥 다이얼로그 생성 - ScrollView를 content로 사용
         self.dialog = MDDialog(
-            title="과목 수정",
+            title="새 과목 추가",
             type="custom",
             content_cls=self.scroll_view,  # ScrollView를 content로 사용
             size_hint=(0.90, 0.75),   # 높이를 75%로 조정하여 더 많은 키보드 공간 확보
@@ -1710,14 +1471,7 @@ class EditClassDialog:
         self.end_time_field.text = class_data['end_time']
         
         # 요일 설정
-        korean_day_map = {
-            "Monday": "월",
-            "Tuesday": "화", 
-            "Wednesday": "수",
-            "Thursday": "목",
-            "Friday": "금"
-        }
-        self.day_field.text = korean_day_map.get(class_data['day'], "월")
+        self.day_field.text = KOREAN_SHORT_DAY_NAMES.get(class_data['day'], "월")
         self.current_day = class_data['day']
         
         # 색상 설정
@@ -1732,8 +1486,68 @@ class EditClassDialog:
         # 알림 시간 설정
         self.notify_input.text = str(class_data.get('notify_before', 5))
 
+
+    def add_class(self, *args):
+        """새 과목 추가"""
+        from kivymd.uix.dialog import MDDialog
+        # 입력값 가져오기
+        name = self.name_field.text.strip()
+        day = self.current_day
+        start_time = self.start_time_field.text.strip()
+        end_time = self.end_time_field.text.strip()
+        room = self.room_field.text.strip()
+        professor = self.professor_field.text.strip()
+        
+        # 🔥 알람 시간 가져오기 추가
+        notify_before = 5  # 기본값
+        if hasattr(self, 'notify_input') and self.notify_input.text.strip():
+            try:
+                notify_before = int(self.notify_input.text.strip())
+                print(f"🔔 사용자 설정 알람: {notify_before}분")
+            except ValueError:
+                notify_before = 5  # 잘못된 입력시 기본값
+                print(f"⚠️ 잘못된 알람 시간 입력, 기본값 사용: {notify_before}분")
+        
+        # 입력 검증
+        if not all([name, day, start_time, end_time, room, professor]):
+            # 경고 대화상자 표시 (한글 처리 개선)
+            warning_dialog = MDDialog(
+                title="입력 오류",
+                text="모든 필드를 입력해주세요.",
+                buttons=[
+                    MDFlatButton(
+                        text="확인",
+                        theme_text_color="Custom",
+                        text_color=self.screen.app.theme_cls.primary_color,
+                        font_name=FONT_NAME,
+                        on_release=lambda x: warning_dialog.dismiss()
+                    )
+                ]
+            )
+            # 경고 다이얼로그의 텍스트에 폰트 설정
+            warning_dialog.text_font_name = FONT_NAME
+            warning_dialog.open()
+            return
+            
+        # 색상 정보 준비
+        color_str = f"{self.selected_color[0]},{self.selected_color[1]},{self.selected_color[2]},{self.selected_color[3]}"
+        
+        # 🔥 시간표에 과목 추가 (알람 시간도 함께 전달)
+        success = self.screen.add_class_to_grid(
+            self.next_class_id, name, day, start_time, end_time, room, professor, color_str, notify_before
+        )
+        
+        if success:
+            print(f"✅ 과목 추가 완료: {name} (ID: {self.next_class_id}, 알람: {notify_before}분)")
+            self.next_class_id += 1
+            # 대화상자 닫기
+            self.dismiss_dialog()
+        else:
+            print(f"❌ 과목 추가 실패: {name}")
+
     def update_class(self, *args):
         """과목 정보 업데이트 - 중복 생성 방지 + 알람 시간 반영"""
+        from kivymd.uix.dialog import MDDialog
         if not self.editing_card:
             return
             
@@ -1774,7 +1588,7 @@ class EditClassDialog:
         
         # 2단계: 화면에서 기존 카드 제거
         try:
-            self.screen.time_grid.remove_widget(self.editing_card)
+            self.screen.remove_class_card(class_id)
             print(f"✅ 화면에서 기존 카드 제거: {class_id}")
         except Exception as e:
             print(f"⚠️ 카드 제거 실패: {e}")
@@ -1810,6 +1624,7 @@ class EditClassDialog:
         
     def delete_class(self, *args):
         """과목 삭제"""
+        from kivymd.uix.dialog import MDDialog
         if not self.editing_card:
             return
             
@@ -1846,12 +1661,12 @@ class EditClassDialog:
         class_id = self.editing_card.class_data['id']
         
         # 카드 위젯 제거
-        self.screen.time_grid.remove_widget(self.editing_card)
+        self.screen.remove_class_card(class_id)
         
         # 스토리지에서 해당 클래스 정보 삭제
         if class_id in self.screen.classes_data:
             # 알람 취소 (Android 환경인 경우)
-            if 'ANDROID_STORAGE' in os.environ and hasattr(self.screen, 'alarm_manager') and self.screen.alarm_manager is not None:
+            if is_android() and hasattr(self.screen, 'alarm_manager') and self.screen.alarm_manager is not None:
                 try:
                     self.screen.alarm_manager.cancel_alarm(class_id)
                 except Exception as e:
@@ -1863,28 +1678,32 @@ class EditClassDialog:
         # 수정 대화상자 닫기
         self.dialog.dismiss()
 
-# 영어-한글 요일 매핑
-korean_day_map = {
-    "Monday": "월요일",
-    "Tuesday": "화요일",
-    "Wednesday": "수요일",
-    "Thursday": "목요일",
-    "Friday": "금요일"
-}
-
 class MainScreen(MDScreen):
+    # 시간표 저장 방식: "json" (변경분만 기록하는 저널 모드) 또는 "sqlite"
+    STORAGE_BACKEND = "json"
+    # True면 그리드 선/요일 헤더/시간 열을 텍스처로 한 번 그려서 표시 (과목 카드만 위젯으로 남음)
+    CACHE_STATIC_GRID = False
+    # 과목 카드 표시 방식: "widget" (ClassCard 위젯), "canvas" (그리드 캔버스에 직접 그림, 과목이 많을 때),
+    # "virtual" (보이는 영역의 카드만 ClassCard 위젯으로 만들어 재사용, 과목이 아주 많은 관리자 화면용)
+    CARD_RENDER_MODE = "widget"
+
     def __init__(self, app, **kwargs):
         super().__init__(**kwargs)
         self.app = app
-        self.add_class_dialog = AddClassDialog(self)
-        self.edit_class_dialog = EditClassDialog(self)
+        self.class_editor = ClassEditorDialog(self)
         self.classes_data = {}
-        self.storage = TimeTableStorage()
+        self.class_cards = {}  # class_id → ClassCard 인덱스 (classes_data와 동기화)
+        # 인앱 알람: 과목별 Clock 이벤트 대신 큐 하나 + 가장 빠른 알람용 Clock 이벤트 하나
+        self.in_app_alarms = RecurringAlarmQueue()
+        self._alarm_event = None
+        self._armed_alarm_time = None
+        with startup.span('storage_open'):
+            self.storage = create_storage(self.STORAGE_BACKEND)
         self.subtitle_text = "2025년 1학기 소재부품융합공학과"
     
         # 🔥 AlarmManager 초기화 - 안전한 버전 (app에도 설정)
         self.alarm_manager = None
-        if 'ANDROID_STORAGE' in os.environ:
+        if is_android():
             try:
                 from alarm_manager import AlarmManager
                 self.alarm_manager = AlarmManager(app)
@@ -1907,11 +1726,13 @@ class MainScreen(MDScreen):
         self.is_initialized = False
         self.layout_created = False
         
-        # 즉시 레이아웃 설정 시도
-        Clock.schedule_once(self.setup_layout, 0)
+        # Window가 준비되면 바로 레이아웃 설정 (폴링 없이 준비 신호로 시작)
+        startup.when('window_ready', lambda: Clock.schedule_once(self.setup_layout, 0))
 
     def show_subtitle_edit_dialog(self, instance):
         """부제목 편집 대화상자 표시"""
+        from kivymd.uix.dialog import MDDialog
+        from kivymd.uix.textfield import MDTextField
         self.subtitle_field = MDTextField(
             text=self.subtitle_text,
             hint_text="Edit",
@@ -1960,8 +1781,7 @@ class MainScreen(MDScreen):
             
             # 부제목 저장 (간단하게 파일로)
             try:
-                with open('subtitle.txt', 'w', encoding='utf-8') as f:
-                    f.write(new_text)
+                atomic_write('subtitle.txt', new_text)
             except:
                 pass
         
@@ -1980,13 +1800,12 @@ class MainScreen(MDScreen):
             """전자출결 앱 열기 (로그캣으로 확인한 정확한 액티비티명 사용)"""
             try:
                 if platform == 'android':
-                    from jnius import autoclass
-                    Intent = autoclass('android.content.Intent')
-                    PythonActivity = autoclass('org.kivy.android.PythonActivity')
+                    java = get_registry()
+                    Intent = java.Intent
                     
                     package_name = 'edu.skku.attend'
                     activity_name = 'edu.skku.attend.ui.activity.IntroActivity'  # 로그캣에서 확인한 정확한 이름
-                    context = PythonActivity.mActivity
+                    context = java.activity()
                     
                     # 방법 1: PackageManager 사용
                     pm = context.getPackageManager()
@@ -2015,6 +1834,7 @@ class MainScreen(MDScreen):
         
     def show_attendance_error_dialog(self):
         """전자출결 앱 실행 오류 대화상자 표시"""
+        from kivymd.uix.dialog import MDDialog
         error_dialog = MDDialog(
             title="전자출결 앱 오류",
             text="전자출결 앱을 실행할 수 없습니다. 앱이 설치되어 있는지 확인하세요.",
@@ -2042,19 +1862,16 @@ class MainScreen(MDScreen):
         """앱스토어에서 전자출결 앱 페이지 열기"""
         try:
             # 안드로이드 환경인지 확인
-            if 'ANDROID_STORAGE' in os.environ:
+            if is_android():
                 # 안드로이드 환경
-                from jnius import autoclass
-                
-                Intent = autoclass('android.content.Intent')
-                Uri = autoclass('android.net.Uri')
-                PythonActivity = autoclass('org.kivy.android.PythonActivity')
+                java = get_registry()
+                Intent = java.Intent
                 
                 # 성균관대 전자출결 앱 실제 Play 스토어 주소
-                store_uri = Uri.parse("market://details?id=edu.skku.attend")
+                store_uri = java.Uri.parse("market://details?id=edu.skku.attend")
                 intent = Intent(Intent.ACTION_VIEW, store_uri)
                 
-                currentActivity = PythonActivity.mActivity
+                currentActivity = java.activity()
                 currentActivity.startActivity(intent)
             else:
                 # 안드로이드가 아닌 환경 (개발 PC)에서는 웹브라우저 URL로 열기
@@ -2075,38 +1892,35 @@ class MainScreen(MDScreen):
         # 🔥 1단계: 기존 카드들 모두 제거 (중복 방지)
         if hasattr(self, 'time_grid') and self.time_grid:
             print("🧹 기존 카드들 정리 중...")
-            # 기존 카드들을 모두 제거
-            for card in self.time_grid.children[:]:  # 복사본으로 순회
-                if hasattr(card, 'class_data'):
-                    self.time_grid.remove_widget(card)
-                    print(f"🗑️ 기존 카드 제거: {card.class_data.get('name', '알 수 없음')}")
+            # 기존 카드들을 모두 제거 (인덱스 기준)
+            for class_id in list(self.class_cards.keys()):
+                card = self.remove_class_card(class_id)
+                print(f"🗑️ 기존 카드 제거: {card.class_data.get('name', '알 수 없음')}")
             
             # 메모리 정리
             self.classes_data.clear()
             print("✅ 기존 카드 및 데이터 정리 완료")
         
         # 🔥 2단계: 저장된 데이터 로드
-        saved_classes = self.storage.load_classes()
+        with startup.span('storage_load'):
+            saved_classes = self.storage.load_classes()
         
         if not saved_classes:
             # 저장된 시간표가 없으면 빈 시간표로 시작
             print("📄 저장된 시간표가 없습니다. 새 시간표를 만드세요.")
-            self.add_class_dialog.next_class_id = 1  # ID는 1부터 시작
+            self.class_editor.next_class_id = 1  # ID는 1부터 시작
             return
         
-        # 🔥 3단계: 저장된 시간표 복원
+        # 🔥 3단계: 저장된 시간표 복원 (일괄 모드 - 과목마다 저장하지 않음)
         print(f"📚 저장된 과목 {len(saved_classes)}개 불러오는 중...")
+        restore_started = time.perf_counter()
         max_id = 0
         success_count = 0
         
         for class_id, class_data in saved_classes.items():
             try:
                 # 색상 처리
-                color = class_data['color']
-                if isinstance(color, str) and ',' in color:
-                    color_str = color
-                else:
-                    color_str = ','.join(map(str, color))
+                color_str = color_to_str(class_data['color'])
                 
                 # 🔥 과목 카드 생성 및 추가 (알람 시간 포함)
                 notify_before = class_data.get('notify_before', 5)  # 저장된 알람 시간 또는 기본값 5분
@@ -2119,7 +1933,8 @@ class MainScreen(MDScreen):
                     class_data['room'], 
                     class_data['professor'], 
                     color_str,
-                    notify_before  # 🔥 알람 시간 전달
+                    notify_before,  # 🔥 알람 시간 전달
+                    save=False  # 방금 읽은 데이터이므로 다시 저장할 필요 없음
                 )
                 
                 if success:
@@ -2141,10 +1956,11 @@ class MainScreen(MDScreen):
                 traceback.print_exc()
         
         # 🔥 4단계: 다음 ID 설정
-        self.add_class_dialog.next_class_id = max_id + 1
+        self.class_editor.next_class_id = max_id + 1
         
-        print(f"🎉 시간표 불러오기 완료: {success_count}/{len(saved_classes)}개 성공")
-        print(f"🆔 다음 과목 ID: {self.add_class_dialog.next_class_id}")
+        restore_elapsed = time.perf_counter() - restore_started
+        print(f"🎉 시간표 불러오기 완료: {success_count}/{len(saved_classes)}개 성공 ({restore_elapsed * 1000:.1f}ms)")
+        print(f"🆔 다음 과목 ID: {self.class_editor.next_class_id}")
 
     def safe_load_timetable(self):
         """안전한 시간표 로드 - 중복 방지"""
@@ -2155,24 +1971,50 @@ class MainScreen(MDScreen):
                 Clock.schedule_once(lambda dt: self.safe_load_timetable(), 0.5)
                 return
             
-            # 이미 카드가 있으면 중복 로드 방지
-            existing_cards = [child for child in self.time_grid.children if hasattr(child, 'class_data')]
-            if existing_cards:
-                print(f"⚠️ 이미 {len(existing_cards)}개 카드가 있음 - 로드 스킵")
+            # 이미 카드가 있으면 전체를 다시 만들지 않고 저장소와 다른 카드만 갱신 (앱 재개 시)
+            if self.class_cards:
+                print(f"⚠️ 이미 {len(self.class_cards)}개 카드가 있음 - 변경분만 적용")
+                self.apply_classes_diff(self.storage.load_classes(), save=False)
                 return
             
             print("🔄 안전한 시간표 로드 시작")
-            self.load_saved_timetable()
+            with startup.span('load_timetable'):
+                self.load_saved_timetable()
 
-            # 🔥 새로 추가: 모든 알람 예약
-            Clock.schedule_once(lambda dt: self.load_and_schedule_all_alarms(), 2.0)
+            # 🔥 새로 추가: 모든 알람 예약 - 카드가 그려진 첫 프레임 뒤에 실행 (고정 대기 없음)
+            startup.when('first_frame', self.load_and_schedule_all_alarms)
+            self.wait_for_first_frame()
             
         except Exception as e:
             print(f"❌ 안전한 시간표 로드 실패: {e}")
             import traceback
             traceback.print_exc()
+            self.wait_for_first_frame()
+
+    def wait_for_first_frame(self):
+        """시간표가 반영된 다음 프레임이 화면에 나가면 'first_frame' 신호 (뒤로 미룬 작업 시작)"""
+        if startup.is_set('first_frame') or getattr(self, '_first_frame_bound', False):
+            return
+        self._first_frame_bound = True
+
+        def on_flip(window):
+            Window.unbind(on_flip=on_flip)
+            # 뒤로 미룬 작업(알람 안내 대화상자 등)이 import하기 전에 확인
+            eager_imports = startup.eager_imports()
+            startup.signal('first_frame')
+            first_frame_ms = startup.get_stats()['first_frame']['start_ms']
+            print(f"🚀 첫 화면까지 {first_frame_ms:.1f}ms")
+            startup.print_summary()
+            for module_name in eager_imports:
+                print(f"⚠️ 첫 화면 전에 import됨 (지연 로딩 대상): {module_name}")
+            trace_path = startup.write()
+            if trace_path:
+                print(f"📝 시작 타임라인 저장: {trace_path}")
+
+        Window.bind(on_flip=on_flip)
             
                 
+    @startup.span('setup_layout')
     def setup_layout(self, dt):
         # 🔥 중복 초기화 방지
         if self.layout_created:
@@ -2234,11 +2076,12 @@ class MainScreen(MDScreen):
             )
             self.layout.add_widget(self.scroll_view)
 
-            # 그리드 컨테이너 설정 - 그리드 너비로 설정 (전체 화면의 90%)
+            # 그리드 컨테이너 설정 - 그리드 너비로 설정 (전체 화면의 90%), 높이는 헤더 + 시간 범위
+            grid_height = self.layout_data['time_grid_height']
             self.grid_container = MDBoxLayout(
                 orientation="vertical",
                 size_hint_y=None,
-                height=dp(660),
+                height=dp(60) + grid_height,
                 size_hint_x=None,
                 width=self.layout_data['grid_width']  # 그리드 너비 (전체의 90%)
             )
@@ -2252,7 +2095,7 @@ class MainScreen(MDScreen):
             self.time_grid_layout = MDBoxLayout(
                 orientation="horizontal",
                 size_hint_y=None,
-                height=dp(600),
+                height=grid_height,
                 spacing=self.layout_data['spacing'],
                 size_hint_x=None,
                 width=self.layout_data['grid_width']  # 그리드 너비와 동일
@@ -2267,10 +2110,9 @@ class MainScreen(MDScreen):
             )
 
             # 시간 열에 시간 레이블 추가
-            hours_count = self.layout_data['end_hour'] - self.layout_data['start_hour']
-            hour_height = dp(600) / hours_count  # 전체 높이를 시간대 수로 나눔
+            hour_height = self.layout_data['hour_height']
             
-            # 시간을 위에서 아래로 순서대로 표시 (09:00부터 18:00까지)
+            # 시간을 위에서 아래로 순서대로 표시 (start_hour부터 end_hour 직전까지)
             for hour in range(self.layout_data['start_hour'], self.layout_data['end_hour']):
                 self.time_column.add_widget(MDLabel(
                     text=f"{hour:02d}:00",
@@ -2285,7 +2127,15 @@ class MainScreen(MDScreen):
             self.time_grid_layout.add_widget(self.time_column)
 
             # 시간표 그리드 추가
-            self.time_grid = TimeGridWidget(layout_data=self.layout_data)
+            self.time_grid = TimeGridWidget(
+                layout_data=self.layout_data,
+                cache_background=self.CACHE_STATIC_GRID,
+                card_mode=self.CARD_RENDER_MODE
+            )
+            self.time_grid.on_card_press = self.class_editor.show_edit_dialog
+            if isinstance(self.time_grid.card_layer, VirtualCardLayer):
+                self.time_grid.card_layer.card_factory = self.build_class_card
+                self.time_grid.card_layer.bind_card = self.bind_class_card
             self.time_grid_layout.add_widget(self.time_grid)
             self.grid_container.add_widget(self.time_grid_layout)
             
@@ -2294,7 +2144,7 @@ class MainScreen(MDScreen):
                 icon="plus",
                 pos_hint={"right": 0.98, "y": 0.02},
                 md_bg_color=self.app.theme_cls.primary_color,
-                on_release=self.add_class_dialog.show_dialog 
+                on_release=self.class_editor.show_add_dialog 
             )
             self.add_widget(self.add_class_button)
 
@@ -2316,13 +2166,35 @@ class MainScreen(MDScreen):
             )
             self.add_widget(self.test_button)
 
+            # 창 크기/방향이 바뀌면 위젯을 다시 만들지 않고 폭만 조정 (연속 이벤트는 마지막 한 번만)
+            self._relayout_trigger = Clock.create_trigger(self.relayout, 0.2)
+            Window.bind(size=self._on_window_resize)
+            # 그리드 좌표 표가 바뀌면 카드 위치를 맞춤 (프레임당 한 번)
+            self._reposition_trigger = Clock.create_trigger(self.reposition_cards)
+            self.time_grid.on_geometry_change = self._reposition_trigger
+
+            # 카드 레이어가 있으면 스크롤/크기 변경 시 보이는 영역의 카드만 표시 (프레임당 한 번)
+            if self.time_grid.card_layer is not None:
+                self._viewport_trigger = Clock.create_trigger(self.update_card_viewport)
+                self.scroll_view.bind(scroll_x=self._viewport_trigger, scroll_y=self._viewport_trigger,
+                                      size=self._viewport_trigger)
+                self.grid_container.bind(size=self._viewport_trigger)
+                self._viewport_trigger()
+
+            # 정적인 헤더/시간 열은 배치가 끝난 뒤 텍스처로 교체
+            self.static_snapshots = []
+            if self.CACHE_STATIC_GRID:
+                Clock.schedule_once(self.cache_static_grid, 0.1)
+
             # 🔥 초기화 완료 플래그 설정
             self.layout_created = True
             print("✅ 레이아웃 설정 완료")
             
-            # 🔥 시간표 로드를 더 안전하게 실행 (한 번만!)
+            startup.signal('layout_ready')
+
+            # 🔥 시간표 로드를 더 안전하게 실행 (한 번만!) - 레이아웃이 준비됐으므로 다음 틱에 바로 실행
             if not hasattr(self, '_timetable_loaded'):  # 중복 로드 방지 플래그
-                Clock.schedule_once(lambda dt: self.safe_load_timetable(), 1.0)  # 1초 후 실행
+                Clock.schedule_once(lambda dt: self.safe_load_timetable(), 0)
                 self._timetable_loaded = True
                 print("📅 시간표 로드 예약됨")
 
@@ -2337,6 +2209,93 @@ class MainScreen(MDScreen):
             # 오류 발생 시 다시 시도
             Clock.schedule_once(self.setup_layout, 0.5)
 
+    def _on_window_resize(self, window, size):
+        """창 크기 변경 - 디바운스 (크기 조절/화면 분할 중에는 계속 미룸)"""
+        self._relayout_trigger.cancel()
+        self._relayout_trigger()
+
+    def relayout(self, *args):
+        """현재 창 너비로 레이아웃 다시 계산 - 기존 위젯의 폭/간격만 바꾸고 카드는 reposition_cards에서 이동"""
+        if not self.layout_created:
+            return
+        layout_data = LayoutConfig.calculate(Window.width)
+        if all(layout_data[key] == self.layout_data[key]
+               for key in ('grid_width', 'time_col_width', 'day_col_width', 'spacing')):
+            return
+
+        started = time.perf_counter()
+        self.layout_data = layout_data
+        grid_width = layout_data['grid_width']
+        time_col_width = layout_data['time_col_width']
+        day_col_width = layout_data['day_col_width']
+        spacing = layout_data['spacing']
+
+        self.grid_container.width = grid_width
+        self.time_grid_layout.width = grid_width
+        self.time_grid_layout.spacing = spacing
+        self.time_column.width = time_col_width
+
+        # 헤더: 첫 번째로 추가한 라벨(children 끝)이 시간 열, 나머지는 요일 열
+        self.headers.width = grid_width
+        self.headers.spacing = spacing
+        for label in self.headers.children[:-1]:
+            label.width = day_col_width
+        self.headers.children[-1].width = time_col_width
+
+        # 텍스처로 바꿔 둔 헤더/시간 열은 원본 배치를 끝낸 뒤 다시 찍음
+        for snapshot in self.static_snapshots:
+            snapshot.source.do_layout()
+            snapshot.refresh()
+
+        self.time_grid.apply_layout(layout_data)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"📐 레이아웃 갱신: 너비 {Window.width}px ({elapsed_ms:.1f}ms)")
+
+    def reposition_cards(self, *args):
+        """그리드 좌표 표 기준으로 기존 카드를 새 위치/크기로 이동 (위젯 재생성/저장소 재로드 없음)"""
+        layer = self.time_grid.card_layer
+        moved = 0
+        for class_id, card in list(self.class_cards.items()):
+            class_data = card.class_data
+            geometry = self.card_geometry(
+                class_data['day'],
+                parse_time_string(class_data['start_time']),
+                parse_time_string(class_data['end_time'])
+            )
+            if geometry is None:
+                continue
+            _, x, y, card_width, card_height = geometry
+            if layer is not None:
+                moved += layer.move(class_id, (x, y), (card_width, card_height))
+            elif tuple(card.pos) != (x, y) or tuple(card.size) != (card_width, card_height):
+                card.pos = (x, y)
+                card.size = (card_width, card_height)
+                moved += 1
+        if moved:
+            print(f"📐 카드 {moved}개 위치 조정")
+            if layer is not None:
+                self.update_card_viewport()
+
+    def update_card_viewport(self, *args):
+        """지금 보이는 영역(위아래/좌우 여유 포함)을 카드 레이어에 알려 화면 밖 카드를 정리"""
+        rect = visible_content_rect(self.scroll_view, margin=dp(150))
+        if rect is not None:
+            self.time_grid.card_layer.update_viewport(rect)
+
+    def cache_static_grid(self, dt=None):
+        """요일 헤더와 시간 열을 텍스처 스냅샷으로 교체 - 스크롤할 때 라벨 위젯 대신 Rectangle 하나씩만 그림"""
+        try:
+            started = time.perf_counter()
+            for source in (self.headers, self.time_column):
+                for widget in source.walk():
+                    if hasattr(widget, 'texture_update'):
+                        widget.texture_update()  # 라벨 텍스처를 먼저 만들어야 스냅샷에 글자가 들어감
+                self.static_snapshots.append(replace_with_snapshot(source))
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"🖼️ 정적 그리드 텍스처 캐시: {len(self.static_snapshots)}개 ({elapsed_ms:.1f}ms)")
+        except Exception as e:
+            print(f"정적 그리드 캐시 오류: {e}")
+
     def on_subtitle_touch(self, instance, touch):
         """부제목 터치 이벤트"""
         if instance.collide_point(*touch.pos):
@@ -2346,20 +2305,12 @@ class MainScreen(MDScreen):
         
     def save_timetable(self):  
         """현재 시간표 저장"""
-        success = self.storage.save_classes(self.classes_data)
-        # 알람 데이터도 함께 저장 (Android용)
-        if hasattr(self, 'alarm_manager') and self.alarm_manager is not None:
-            try:
-                import pickle
-                # 앱의 내부 저장소에 저장 (app.alarm_file_path 사용)
-                with open(self.app.alarm_file_path, 'wb') as f:
-                    pickle.dump(self.alarm_manager.alarms, f)
-                print("✅ Android 알람 시스템 초기화 완료")
-            except Exception as e:
-                print(f"알람 데이터 저장 오류: {e}")
+        # 연속 편집은 잠시 뒤 한 번만 기록 (일시정지/종료 시 flush_pending()으로 바로 기록)
+        success = self.storage.save_classes_later(self.classes_data)
+        # 알람 데이터는 AlarmManager가 예약/취소 시점에 공유 알람 DB에 바로 기록함
         
         if success:
-            print("시간표 저장 완료")
+            print("시간표 저장 예약됨")
 
 
     def add_dummy_data(self):
@@ -2459,21 +2410,17 @@ class MainScreen(MDScreen):
         print(f"🎉 더미 데이터 추가 완료: {success_count}/{len(dummy_classes)}개 성공")
         
         # 다음 ID 설정 (더미 데이터 이후)
-        self.add_class_dialog.next_class_id = 1006
+        self.class_editor.next_class_id = 1006
 
     
     def request_alarm_permission(self):
         """알람 권한 요청 (Android 12+)"""
         try:
-            from jnius import autoclass
-            
-            Intent = autoclass('android.content.Intent')
-            Settings = autoclass('android.provider.Settings')
-            PythonActivity = autoclass('org.kivy.android.PythonActivity')
+            java = get_registry()
             
             # 알람 권한 설정 페이지로 이동
-            intent = Intent(Settings.ACTION_REQUEST_SCHEDULE_EXACT_ALARM)
-            PythonActivity.mActivity.startActivity(intent)
+            intent = java.Intent(java.Settings.ACTION_REQUEST_SCHEDULE_EXACT_ALARM)
+            java.activity().startActivity(intent)
             
             print("알람 권한을 허용해주세요!")
             
@@ -2483,81 +2430,42 @@ class MainScreen(MDScreen):
     # MainScreen 클래스에 추가할 인앱 알람 시스템
     
     def calculate_next_class_time(self, class_data):
-        """다음 수업 시간 계산"""
-        from datetime import datetime, timedelta
-        
-        day_map = {
-            "Monday": 0, "Tuesday": 1, "Wednesday": 2,
-            "Thursday": 3, "Friday": 4
-        }
-        
-        day = class_data.get("day")
-        start_time = class_data.get("start_time")
-        
-        if not day or not start_time:
-            return None
-        
-        target_weekday = day_map.get(day)
-        if target_weekday is None:
-            return None
-        
-        # 현재 시간
-        now = datetime.now()
-        today_weekday = now.weekday()
-        
-        # 다음 수업까지 남은 날 계산
-        days_ahead = (target_weekday - today_weekday) % 7
-        target_date = now + timedelta(days=days_ahead)
-        
-        # 수업 시간 설정
-        hour, minute = map(int, start_time.split(":"))
-        class_datetime = target_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        
-        # 오늘 수업인데 이미 지났으면 다음 주로
-        if class_datetime <= now:
-            class_datetime += timedelta(days=7)
-        
-        return class_datetime
+        """다음 수업 시간 계산 (알람 매니저/서비스와 같은 계산 사용)"""
+        return next_class_time(class_data.get("day"), class_data.get("start_time"))
     
     def schedule_in_app_alarm(self, class_data, notify_before=5):
         """앱 실행 중일 때만 작동하는 인앱 알람"""
         try:
-            # 다음 수업 시간 계산
-            class_time = self.calculate_next_class_time(class_data)
-            if not class_time:
+            # 알람 관련 필드가 그대로면 다시 예약하지 않음 (표시용 정보만 갱신)
+            fingerprint = alarm_fingerprint(class_data, notify_before)
+            previous = self.in_app_alarms.get(class_data['id'])
+            if previous is not None and previous['fingerprint'] == fingerprint and previous['fire_time'] is not None:
+                previous['payload'] = class_data
+                return True
+
+            # 큐에 등록 (이미 있으면 교체) - 이번 주 알람이 지났으면 다음 주
+            was_next = previous is not None and previous['fire_time'] == self._armed_alarm_time
+            alarm_time = self.in_app_alarms.add(
+                class_data['id'], class_data.get("day"), class_data.get("start_time"),
+                notify_before, payload=class_data, fingerprint=fingerprint
+            )
+            if not alarm_time:
+                self.in_app_alarms.remove(class_data['id'])
+                if was_next:
+                    self._arm_in_app_alarm_clock()
                 print(f"❌ 시간 계산 실패: {class_data['name']}")
                 return False
+            class_time = alarm_time + timedelta(minutes=notify_before)
             
-            # 알람 시간 계산
-            from datetime import timedelta, datetime
-            alarm_time = class_time - timedelta(minutes=notify_before)
+            # 가장 빠른 알람이 바뀐 경우에만 Clock 이벤트 재설정
+            if was_next or self._armed_alarm_time is None or alarm_time < self._armed_alarm_time:
+                self._arm_in_app_alarm_clock()
             
-            # 현재 시간과의 차이 계산
-            now = datetime.now()
-            delay_seconds = (alarm_time - now).total_seconds()
-            
-            if delay_seconds > 0:
-                # 기존 알람이 있으면 취소
-                self.cancel_in_app_alarm(class_data['id'])
-                
-                # Kivy Clock으로 알람 예약
-                event = Clock.schedule_once(
-                    lambda dt: self.show_class_notification(class_data), 
-                    delay_seconds
-                )
-                
-                # 알람 정보 저장 (취소용)
-                if not hasattr(self, 'scheduled_alarms'):
-                    self.scheduled_alarms = {}
-                self.scheduled_alarms[class_data['id']] = event
-                
-                print(f"⏰ 인앱 알람 예약: {class_data['name']} - {delay_seconds/60:.1f}분 후")
-                print(f"📅 수업 시간: {class_time.strftime('%Y-%m-%d %H:%M')}")
-                print(f"⏰ 알람 시간: {alarm_time.strftime('%Y-%m-%d %H:%M')}")
-                return True
-            else:
-                print(f"⏭️ 이미 지난 시간: {class_data['name']}")
-                return False
+            delay_seconds = (alarm_time - datetime.now()).total_seconds()
+            print(f"⏰ 인앱 알람 예약: {class_data['name']} - {delay_seconds/60:.1f}분 후")
+            print(f"📅 수업 시간: {class_time.strftime('%Y-%m-%d %H:%M')}")
+            print(f"⏰ 알람 시간: {alarm_time.strftime('%Y-%m-%d %H:%M')}")
+            return True
                 
         except Exception as e:
             print(f"❌ 인앱 알람 설정 실패: {e}")
@@ -2565,13 +2473,41 @@ class MainScreen(MDScreen):
             traceback.print_exc()
             return False
     
+    def _arm_in_app_alarm_clock(self):
+        """가장 빠른 인앱 알람 시간에 맞춰 Clock 이벤트 하나만 예약"""
+        if self._alarm_event is not None:
+            self._alarm_event.cancel()
+            self._alarm_event = None
+        self._armed_alarm_time = None
+        
+        next_due = self.in_app_alarms.next_due()
+        if next_due is None:
+            return
+        alarm_time = next_due[0]
+        delay_seconds = max(0, (alarm_time - datetime.now()).total_seconds())
+        self._alarm_event = Clock.schedule_once(self._dispatch_in_app_alarms, delay_seconds)
+        self._armed_alarm_time = alarm_time
+    
+    def _dispatch_in_app_alarms(self, dt):
+        """시간이 된 인앱 알람 처리 후 다음 주로 넘기고 Clock 재설정"""
+        self._alarm_event = None
+        now = datetime.now()
+        for class_id, alarm_time, class_data in self.in_app_alarms.pop_due(now):
+            self.show_class_notification(class_data)
+            # 매주 반복 알람이므로 다음 주로 넘김
+            self.in_app_alarms.reschedule(class_id, now=now)
+        self._arm_in_app_alarm_clock()
+    
     def cancel_in_app_alarm(self, class_id):
         """특정 과목의 인앱 알람 취소"""
         try:
-            if hasattr(self, 'scheduled_alarms') and class_id in self.scheduled_alarms:
-                event = self.scheduled_alarms[class_id]
-                event.cancel()  # Clock 이벤트 취소
-                del self.scheduled_alarms[class_id]
+            entry = self.in_app_alarms.get(class_id)
+            if entry is not None:
+                was_next = entry['fire_time'] == self._armed_alarm_time
+                self.in_app_alarms.remove(class_id)
+                # 대기 중인 Clock 이벤트가 이 알람 것이었으면 다음 알람으로 재설정
+                if was_next:
+                    self._arm_in_app_alarm_clock()
                 print(f"✅ 인앱 알람 취소됨: ID {class_id}")
                 return True
         except Exception as e:
@@ -2581,53 +2517,71 @@ class MainScreen(MDScreen):
     def cancel_all_in_app_alarms(self):
         """모든 인앱 알람 취소"""
         try:
-            if hasattr(self, 'scheduled_alarms'):
-                for class_id, event in self.scheduled_alarms.items():
-                    event.cancel()
-                self.scheduled_alarms.clear()
-                print("✅ 모든 인앱 알람 취소됨")
+            self.in_app_alarms.clear()
+            self._arm_in_app_alarm_clock()
+            print("✅ 모든 인앱 알람 취소됨")
         except Exception as e:
             print(f"❌ 모든 알람 취소 실패: {e}")
     
     def show_class_notification(self, class_data):
-        """수업 알림 표시 (실제 알람이 울릴 때 호출됨)"""
+        """수업 알림 표시 (실제 알람이 울릴 때 호출됨 - 다음 주 예약은 디스패처가 처리)"""
         try:
             print(f"🔔 알림 표시: {class_data['name']} 수업!")
             
             # Android에서는 시스템 알림
-            if 'ANDROID_STORAGE' in os.environ:
+            if is_android():
                 self.create_class_notification(class_data)
             else:
-                # PC에서는 콘솔 출력
-                print(f"📚 {class_data['name']} 수업이 곧 시작됩니다!")
-                print(f"🏛️ 강의실: {class_data['room']}")
-                print(f"👨‍🏫 교수: {class_data['professor']}")
-                
-            # 알람이 울린 후 다음 주 알람 자동 설정
-            self.schedule_in_app_alarm(class_data, class_data.get('notify_before', 5))
+                # PC에서는 시뮬레이션 플랫폼에 기록 (콘솔 출력)
+                get_platform().show_notification(
+                    int(class_data['id']),
+                    f"📚 {class_data['name']} 수업이 곧 시작됩니다!",
+                    f"🏛️ 강의실: {class_data['room']} | 👨‍🏫 교수: {class_data['professor']}"
+                )
             
         except Exception as e:
             print(f"❌ 알림 표시 실패: {e}")
     
+    def reconcile_in_app_alarms(self):
+        """시간표와 인앱 알람 큐를 비교해 달라진 알람만 예약/갱신/취소"""
+        desired = {
+            class_id: alarm_fingerprint(class_data, class_data.get('notify_before', 5))
+            for class_id, class_data in self.classes_data.items()
+        }
+        added, changed, removed, unchanged = diff_fingerprints(desired, self.in_app_alarms.fingerprints())
+
+        for class_id in removed:
+            self.cancel_in_app_alarm(class_id)
+        for class_id in added + changed:
+            class_data = self.classes_data[class_id]
+            self.schedule_in_app_alarm(class_data, class_data.get('notify_before', 5))
+
+        print(f"🔁 인앱 알람 동기화: 추가 {len(added)}개, 변경 {len(changed)}개, "
+              f"취소 {len(removed)}개, 유지 {unchanged}개")
+        return {'added': len(added), 'updated': len(changed), 'removed': len(removed), 'unchanged': unchanged}
+
+    @startup.span('schedule_alarms')
     def load_and_schedule_all_alarms(self):
-        """저장된 모든 과목의 인앱 알람 예약"""
+        """저장된 모든 과목의 알람을 시간표와 맞춤 (바뀐 것만 다시 예약)"""
         try:
             if not hasattr(self, 'classes_data'):
                 print("📚 시간표 데이터가 없습니다.")
                 return
-            
-            success_count = 0
-            for class_id, class_data in self.classes_data.items():
-                notify_before = class_data.get('notify_before', 5)
-                if self.schedule_in_app_alarm(class_data, notify_before):
-                    success_count += 1
-            
-            print(f"🎉 인앱 알람 일괄 설정 완료: {success_count}/{len(self.classes_data)}개")
-            
+
+            self.reconcile_in_app_alarms()
+            if self.alarm_manager is not None:
+                # 이미 예약된 시스템 알람만 시간표에 맞춤 (새 시스템 알람은 만들지 않음)
+                self.alarm_manager.reconcile({
+                    class_id: class_data for class_id, class_data in self.classes_data.items()
+                    if class_id in self.alarm_manager.alarms
+                })
+
+            print(f"🎉 인앱 알람 일괄 설정 완료: {len(self.in_app_alarms)}/{len(self.classes_data)}개")
+
             # 사용자에게 안내 메시지
-            if success_count > 0:
+            if len(self.in_app_alarms) > 0:
                 self.show_in_app_alarm_info()
-                
+
         except Exception as e:
             print(f"❌ 일괄 알람 설정 실패: {e}")
     
@@ -2663,57 +2617,13 @@ class MainScreen(MDScreen):
     # MainScreen 클래스에 추가할 포어그라운드 서비스 함수들
     # 위치: MainScreen 클래스 내부, show_in_app_alarm_info() 함수 다음에 추가
     
-    
-    from datetime import datetime, timedelta
-    from kivy.clock import Clock
-    
-    def format_remaining_time(target_time):
-        now = datetime.now()
-        delta = target_time - now
-        seconds = int(delta.total_seconds())
-        if seconds <= 0:
-            return "수업 시작됨!"
-        h, rem = divmod(seconds, 3600)
-        m, s = divmod(rem, 60)
-        return f"{h:02d}:{m:02d}:{s:02d} 남음"
+    def format_remaining_time(self, target_time):
+        from countdown import format_remaining_time
+        return format_remaining_time(target_time)
     
     def get_class_datetime(self, class_data):
-        day_map = {
-            "Monday": 0, "Tuesday": 1, "Wednesday": 2,
-            "Thursday": 3, "Friday": 4,
-            "월요일": 0, "화요일": 1, "수요일": 2,
-            "목요일": 3, "금요일": 4
-        }
-        weekday = day_map.get(class_data['day'], 0)
-        hour, minute = map(int, class_data['start_time'].split(":"))
-        now = datetime.now()
-        today = now.weekday()
-        delta = (weekday - today + 7) % 7
-        class_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0) + timedelta(days=delta)
-        return class_time
-    
-    def update_foreground_notification(self, target_time):
-        from jnius import autoclass
-        PythonActivity = autoclass('org.kivy.android.PythonActivity')
-        Context = autoclass('android.content.Context')
-        Notification = autoclass('android.app.Notification')
-        Builder = autoclass('android.app.Notification$Builder')
-        NotificationManager = autoclass('android.app.NotificationManager')
-    
-        context = PythonActivity.mActivity
-        channel_id = "foreground_service_channel"
-        text = format_remaining_time(target_time)
-    
-        builder = Builder(context, channel_id)
-        builder.setSmallIcon(context.getApplicationInfo().icon)
-        builder.setContentTitle("📚 수업 카운트다운")
-        builder.setContentText(text)
-        builder.setOngoing(True)
-        builder.setPriority(Notification.PRIORITY_LOW)
-    
-        notification = builder.build()
-        manager = context.getSystemService(Context.NOTIFICATION_SERVICE)
-        manager.notify(1001, notification)
+        """카운트다운 대상 수업 시작 시간 (오늘 수업이 지났으면 다음 주)"""
+        return next_class_time(class_data['day'], class_data['start_time'])
     
     def trigger_alarm(self, class_data):
         try:
@@ -2728,46 +2638,53 @@ class MainScreen(MDScreen):
             print(f"❌ 알림 실패: {e}")
     
     def start_countdown_notification(self, class_data):
+        """수업 시작까지 카운트다운 알림 (분이 바뀔 때만 갱신)"""
+        from countdown import CountdownNotification, create_countdown_notifier
+        self.stop_countdown_notification()
         target_time = self.get_class_datetime(class_data)
+        if target_time is None:
+            return
+        
+        self._countdown = CountdownNotification(
+            create_countdown_notifier(),
+            target_time,
+            on_finish=lambda: self.trigger_alarm(class_data)
+        )
+        self._countdown.start()
     
-        def update(dt):
-            now = datetime.now()
-            if (target_time - now).total_seconds() <= 0:
-                Clock.unschedule(update)
-                self.trigger_alarm(class_data)
-            else:
-                self.update_foreground_notification(target_time)
-    
-        Clock.schedule_interval(update, 1)
+    def stop_countdown_notification(self):
+        """진행 중인 카운트다운 중지"""
+        countdown = getattr(self, '_countdown', None)
+        if countdown is None:
+            return
+        countdown.stop()
+        stats = countdown.get_stats()
+        print(f"⏱️ 카운트다운 갱신 {stats['updates']}/{stats['ticks']}회, 평균 {stats['avg_tick_ms']:.2f}ms")
+        self._countdown = None
     
+    @startup.span('foreground_service')
     def start_foreground_service(self):
             """포어그라운드 서비스 시작 - "앱이 작동중" 알림 표시"""
             try:
-                if 'ANDROID_STORAGE' not in os.environ:
+                if not is_android():
                     print("💻 PC 환경 - 포어그라운드 서비스 불가")
                     return False
                     
-                from jnius import autoclass
+                java = get_registry()
                 
-                # Android 클래스들
-                PythonActivity = autoclass('org.kivy.android.PythonActivity')
-                Context = autoclass('android.content.Context')
-                NotificationManager = autoclass('android.app.NotificationManager')
-                NotificationChannel = autoclass('android.app.NotificationChannel')
-                Notification = autoclass('android.app.Notification')
-                Builder = autoclass('android.app.Notification$Builder')
-                PendingIntent = autoclass('android.app.PendingIntent')
-                Intent = autoclass('android.content.Intent')
+                # Android 클래스들 (프로세스당 한 번만 로딩)
+                PythonActivity = java.PythonActivity
+                Intent = java.Intent
                 
-                context = PythonActivity.mActivity
+                context = java.activity()
                 
                 # 알림 채널 생성
                 channel_id = "foreground_service_channel"
                 channel_name = "시간표 알람 서비스"
-                importance = NotificationManager.IMPORTANCE_LOW  # 조용한 알림
+                importance = java.NotificationManager.IMPORTANCE_LOW  # 조용한 알림
                 
-                notification_manager = context.getSystemService(Context.NOTIFICATION_SERVICE)
-                channel = NotificationChannel(channel_id, channel_name, importance)
+                notification_manager = java.notification_manager()
+                channel = java.NotificationChannel(channel_id, channel_name, importance)
                 channel.setDescription("시간표 알람이 백그라운드에서 작동중입니다")
                 channel.setSound(None, None)  # 소리 없음
                 notification_manager.createNotificationChannel(channel)
@@ -2777,19 +2694,17 @@ class MainScreen(MDScreen):
                 app_intent.setFlags(Intent.FLAG_ACTIVITY_NEW_TASK | Intent.FLAG_ACTIVITY_CLEAR_TOP)
                 
                 # PendingIntent 생성
-                FLAG_IMMUTABLE = 67108864
-                FLAG_UPDATE_CURRENT = 134217728
-                pending_intent = PendingIntent.getActivity(
+                pending_intent = java.PendingIntent.getActivity(
                     context, 0, app_intent, FLAG_UPDATE_CURRENT | FLAG_IMMUTABLE
                 )
                 
                 # 포어그라운드 알림 생성
-                builder = Builder(context, channel_id)
+                builder = java.Builder(context, channel_id)
                 builder.setSmallIcon(context.getApplicationInfo().icon)
                 builder.setContentTitle("📚 시간표 알람 활성화")
                 builder.setContentText("수업 알람이 백그라운드에서 작동중입니다")
                 builder.setOngoing(True)  # 스와이프로 삭제 불가
-                builder.setPriority(Notification.PRIORITY_LOW)  # 낮은 우선순위
+                builder.setPriority(java.Notification.PRIORITY_LOW)  # 낮은 우선순위
                 builder.setContentIntent(pending_intent)
                 
                 notification = builder.build()
@@ -2806,18 +2721,12 @@ class MainScreen(MDScreen):
     
     def stop_foreground_service(self):
         """포어그라운드 서비스 중지"""
+        self.stop_countdown_notification()
         try:
-            if 'ANDROID_STORAGE' not in os.environ:
+            if not is_android():
                 return
                 
-            from jnius import autoclass
-            
-            PythonActivity = autoclass('org.kivy.android.PythonActivity')
-            Context = autoclass('android.content.Context')
-            NotificationManager = autoclass('android.app.NotificationManager')
-            
-            context = PythonActivity.mActivity
-            notification_manager = context.getSystemService(Context.NOTIFICATION_SERVICE)
+            notification_manager = get_registry().notification_manager()
             
             # 포어그라운드 알림 제거
             notification_manager.cancel(1001)
@@ -2905,13 +2814,73 @@ class MainScreen(MDScreen):
     
     
         
-    def add_class_to_grid(self, class_id, name, day, start_time, end_time, room, professor, color_str, notify_before=5):
-        # 🔥 맨 앞에 추가: 중복 확인
-        for existing_card in self.time_grid.children[:]:
-            if hasattr(existing_card, 'class_data') and existing_card.class_data.get('id') == class_id:
-                print(f"🔄 기존 카드 발견 - 제거 중: {class_id}")
-                self.time_grid.remove_widget(existing_card)
-                break
+    def get_class_card(self, class_id):
+        """class_id에 해당하는 카드 반환 (없으면 None)"""
+        return self.class_cards.get(class_id)
+
+    def remove_class_card(self, class_id):
+        """class_id에 해당하는 카드를 화면과 인덱스에서 제거"""
+        card = self.class_cards.pop(class_id, None)
+        if isinstance(card, CanvasCard):
+            self.time_grid.card_layer.remove(class_id)
+        elif card is not None and card.parent is not None:
+            card.parent.remove_widget(card)
+        return card
+
+    def apply_classes_diff(self, new_classes, save=True):
+        """새 과목 목록과 현재 상태를 비교해 바뀐 카드만 추가/교체/제거"""
+        added = updated = removed = 0
+
+        # 사라진 과목 제거 - 카드가 없는 과목(그리드에 없는 요일 등)도 데이터/알람은 있으므로 classes_data 기준
+        # 시스템 알람(AlarmManager)도 함께 취소해야 서비스가 삭제된 과목을 알리지 않음 (저장은 한 번)
+        alarm_manager = getattr(self, 'alarm_manager', None)
+        with alarm_manager.batch() if alarm_manager is not None else nullcontext():
+            for class_id in set(self.classes_data) | set(self.class_cards):
+                if class_id not in new_classes:
+                    self.remove_class_card(class_id)
+                    self.classes_data.pop(class_id, None)
+                    self.cancel_in_app_alarm(class_id)
+                    if alarm_manager is not None and class_id in alarm_manager.alarms:
+                        try:
+                            alarm_manager.cancel_alarm(class_id)
+                        except Exception as e:
+                            print(f"알람 취소 오류: {e}")
+                    removed += 1
+
+        # 새 과목 추가 또는 바뀐 과목만 교체
+        for class_id, class_data in new_classes.items():
+            current = self.classes_data.get(class_id)
+            if current is not None:
+                if all(normalize_card_field(field, current.get(field)) == normalize_card_field(field, class_data.get(field))
+                       for field in CARD_FIELDS):
+                    continue
+                updated += 1
+            else:
+                added += 1
+
+            self.add_class_to_grid(
+                class_id,
+                class_data['name'],
+                class_data['day'],
+                class_data['start_time'],
+                class_data['end_time'],
+                class_data['room'],
+                class_data['professor'],
+                color_to_str(class_data['color']),
+                class_data.get('notify_before', 5),
+                save=False
+            )
+
+        if save and (added or updated or removed):
+            self.save_timetable()
+
+        print(f"🔀 카드 변경 적용: 추가 {added}, 수정 {updated}, 삭제 {removed}")
+        return added, updated, removed
+
+    def add_class_to_grid(self, class_id, name, day, start_time, end_time, room, professor, color_str, notify_before=5, save=True):
+        # 🔥 맨 앞에 추가: 중복 확인 (인덱스 조회)
+        if self.remove_class_card(class_id) is not None:
+            print(f"🔄 기존 카드 발견 - 제거 중: {class_id}")
                 
         # 시간 문자열을 숫자로 변환
         start_time_float = parse_time_string(start_time)
@@ -2922,34 +2891,7 @@ class MainScreen(MDScreen):
             print(f"[스킵] 잘못된 시간 값: start={start_time}, end={end_time}")
             return False
         
-        layout_data = self.layout_data
-        
-        # 영어 또는 한글 요일 이름을 인덱스로 변환
-        day_index = {"Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3, "Friday": 4,
-                    "월요일": 0, "화요일": 1, "수요일": 2, "목요일": 3, "금요일": 4}.get(day, 0)
-        
-        # TimeGridWidget의 get_day_column_x 메소드로 요일 열의 왼쪽 경계 가져오기
-        day_column_left = self.time_grid.get_day_column_x(day_index)
-        
-        # 카드 크기 및 위치 계산
-        day_col_width = layout_data['day_col_width']
-        if day_index == 4:  # 금요일
-            card_width = day_col_width - (layout_data['spacing'] * 2.0)  # 오른쪽 여백 늘림
-        else:
-            card_width = day_col_width - (layout_data['spacing'] * 1.1)  # 기존 너비 유지
-        
-        x = day_column_left + (layout_data['spacing'] * 1)
-        
-        # 시간대별 높이 계산
-        hours_count = layout_data['end_hour'] - layout_data['start_hour']
-        hour_height = self.time_grid.height / hours_count
-        
-        # 시작 시간과 그리드 시작 시간의 차이를 기준으로 시작 위치 계산
-        start_offset_from_top = (start_time_float - layout_data['start_hour']) * hour_height
-        
-        # 뒤집어서 위에서부터 계산 (그리드 상단에서 시작)
-        duration_height = (end_time_float - start_time_float) * hour_height
-        y = self.time_grid.y + self.time_grid.height - start_offset_from_top - duration_height
+        geometry = self.card_geometry(day, start_time_float, end_time_float)
         
         # 색상 문자열을 튜플로 변환
         try:
@@ -2959,21 +2901,7 @@ class MainScreen(MDScreen):
             color = (0.6, 0.2, 0.8, 1)  # 기본 보라색
     
         try:
-            # 카드 생성 및 위치 조정
-            card = ClassCard(
-                size_hint=(None, None),
-                size=(card_width, duration_height),
-                pos=(x, y),
-                elevation=4,
-                md_bg_color=color,
-                radius=[dp(5)],
-                ripple_behavior=True
-            )
-    
-            print(f"카드 생성: 크기=({card_width}, {duration_height}), 위치=({x}, {y})")
-            
-            # 🔥 카드에 클래스 데이터 저장 (알람 시간 포함)
-            card.class_data = {
+            class_data = {
                 'id': class_id,
                 'name': name,
                 'day': day,
@@ -2985,64 +2913,35 @@ class MainScreen(MDScreen):
                 'notify_before': notify_before  # 🔥 알람 시간 저장
             }
             
+            if geometry is None:
+                # 시간표에 표시하지 않는 요일(예: 주말을 뺀 설정) - 데이터와 알람은 유지하고 카드만 생략
+                print(f"📅 표시하지 않는 요일이라 카드 생략: {name} ({day})")
+            elif self.time_grid.card_layer is not None:
+                # canvas/virtual 모드: 카드 기록만 레이어에 넣고, 보이는 카드만 그리거나 위젯으로 만듦
+                day_index, x, y, card_width, duration_height = geometry
+                self.class_cards[class_id] = self.time_grid.card_layer.add(
+                    class_id, class_data, day_index, (x, y), (card_width, duration_height),
+                    color, f"{name}\n{room}"
+                )
+            else:
+                day_index, x, y, card_width, duration_height = geometry
+                self.class_cards[class_id] = self.create_class_card_widget(
+                    class_data, x, y, card_width, duration_height
+                )
+            
             # 🔥 클래스 데이터 저장소에 추가 (알람 시간 포함)
-            self.classes_data[class_id] = card.class_data.copy()
+            self.classes_data[class_id] = class_data.copy()
             print(f"💾 클래스 데이터 저장: {name} (알람: {notify_before}분)")
-                        
-            # 카드 내용 추가 - 이 부분만 교체!
-            card_label = MDLabel(
-                text=f"{name}\n{room}",
-                halign="center",
-                valign="center",
-                font_name=FONT_NAME,
-                theme_text_color="Custom",
-                text_color=(1, 1, 1, 1)  # 흰색으로 설정
-            )
-            
-            # 강제로 작은 폰트 크기 적용
-            Clock.schedule_once(lambda dt: setattr(card_label, 'font_size', 28), 0.1)
-            card.add_widget(card_label)
-            
-            # 시간표 그리드에 카드 추가
-            self.time_grid.add_widget(card)
-            
-            # try-except 블록 밖에서 터치 핸들러 정의
-            def make_touch_handler(card_instance, class_id):
-                def handle_touch(instance, touch):
-                    if instance.collide_point(*touch.pos):
-                        self.edit_class_dialog.show_edit_dialog(card_instance)
-                        return True
-                    return False
-                return handle_touch
-    
-            card.bind(on_touch_down=make_touch_handler(card, class_id))
-            
-            print(f"카드 생성: 크기=({card_width}, {duration_height}), 위치=({x}, {y})")
-            
-            # 클릭 이벤트 연결
-            card.on_release_callback = lambda card: self.edit_class_dialog.show_edit_dialog(card)
             
             # 🔥 인앱 알람 설정
-            class_data_for_alarm = {
-                'id': class_id,
-                'name': name,
-                'day': day,
-                'start_time': start_time,
-                'end_time': end_time,
-                'room': room,
-                'professor': professor,
-                'color': color,
-                'notify_before': notify_before
-            }
-            
-            success = self.schedule_in_app_alarm(class_data_for_alarm, notify_before)
+            success = self.schedule_in_app_alarm(class_data.copy(), notify_before)
             if success:
                 print(f"✅ 인앱 알람 설정 성공: {name}")
             else:
                 print(f"❌ 인앱 알람 설정 실패: {name}")
         
-            # 시간표 저장 - 수정 중이 아닐 때만 저장
-            if not hasattr(self, '_updating_class'):
+            # 시간표 저장 - 수정 중이 아니고 일괄 복원 중이 아닐 때만 저장
+            if save and not hasattr(self, '_updating_class'):
                 self.save_timetable()
         
             return True
@@ -3052,25 +2951,96 @@ class MainScreen(MDScreen):
             import traceback
             traceback.print_exc()
             return False
-                        
+
+    def create_class_card_widget(self, class_data, x, y, card_width, duration_height):
+        """ClassCard 위젯 생성 후 그리드에 추가 (widget 모드)"""
+        card = self.build_class_card()
+        self.bind_class_card(card, class_data, (x, y), (card_width, duration_height))
+        print(f"카드 생성: 크기=({card_width}, {duration_height}), 위치=({x}, {y})")
+        
+        # 시간표 그리드에 카드 추가
+        self.time_grid.add_widget(card)
+        return card
+
+    def build_class_card(self):
+        """내용이 비어 있는 ClassCard 위젯 - virtual 모드에서는 화면 밖으로 나간 카드를 재사용"""
+        card = ClassCard(
+            size_hint=(None, None),
+            elevation=4,
+            radius=[dp(5)],
+            ripple_behavior=True
+        )
+        
+        # 카드 내용 추가
+        card.label = MDLabel(
+            halign="center",
+            valign="center",
+            font_name=FONT_NAME,
+            theme_text_color="Custom",
+            text_color=(1, 1, 1, 1)  # 흰색으로 설정
+        )
+        
+        # 강제로 작은 폰트 크기 적용
+        Clock.schedule_once(lambda dt: setattr(card.label, 'font_size', 28), 0.1)
+        card.add_widget(card.label)
+        
+        # 터치 핸들러 - 재사용되는 카드도 그 시점의 class_data로 수정 대화상자를 엶
+        def handle_touch(instance, touch):
+            if instance.collide_point(*touch.pos):
+                self.class_editor.show_edit_dialog(instance)
+                return True
+            return False
+
+        card.bind(on_touch_down=handle_touch)
+        
+        # 클릭 이벤트 연결
+        card.on_release_callback = lambda card: self.class_editor.show_edit_dialog(card)
+        return card
+
+    def bind_class_card(self, card, class_data, pos, size):
+        """카드 위젯에 과목 데이터/위치/색상 채우기"""
+        # 🔥 카드에 클래스 데이터 저장 (알람 시간 포함)
+        card.class_data = class_data
+        card.pos = pos
+        card.size = size
+        card.md_bg_color = class_data['color']
+        card.label.text = f"{class_data['name']}\n{class_data['room']}"
+
+    def card_geometry(self, day, start_time_float, end_time_float):
+        """과목 카드의 (요일 열 인덱스, x, y, 너비, 높이) - 그리드 좌표 표에서 조회, 표시하지 않는 요일이면 None"""
+        geometry = self.time_grid.geometry
+        day_index = geometry.day_column(day)
+        if day_index is None:
+            return None
+        
+        # 카드 크기 및 위치 계산 (마지막 열은 오른쪽 여백을 더 둠)
+        spacing = geometry.spacing
+        if day_index == geometry.num_days - 1:
+            card_width = geometry.day_col_width - (spacing * 2.0)
+        else:
+            card_width = geometry.day_col_width - (spacing * 1.1)
+        x = geometry.day_x[day_index] + spacing
+        
+        # 시작/종료 시각의 y를 분 단위 표에서 조회 (위에서 아래로 시간이 흐름)
+        start_minutes = round((start_time_float - geometry.start_hour) * 60)
+        end_minutes = round((end_time_float - geometry.start_hour) * 60)
+        top = geometry.y_at(start_minutes)
+        y = geometry.y_at(end_minutes)
+        return day_index, x, y, card_width, top - y
 
     def create_class_notification(self, class_data, minutes_before=5):
             """실제 과목 정보로 알림 생성"""
             try:
-                if 'ANDROID_STORAGE' not in os.environ:
+                if not is_android():
                     return  # Android 환경이 아니면 건너뛰기
                     
-                from jnius import autoclass
-                PythonActivity = autoclass('org.kivy.android.PythonActivity')
-                Context = autoclass('android.content.Context')
-                
-                Notification = autoclass('android.app.Notification')
-                NotificationManager = autoclass('android.app.NotificationManager')
-                Builder = autoclass('android.app.Notification$Builder')
-                Intent = autoclass('android.content.Intent')
-                PendingIntent = autoclass('android.app.PendingIntent')
+                java = get_registry()
+                Notification = java.Notification
+                Builder = java.Builder
+                Intent = java.Intent
+                PendingIntent = java.PendingIntent
                 
-                context = PythonActivity.mActivity
+                context = java.activity()
                 channel_id = "timetable_alarm_channel"
                 
                 # 전자출결 앱 Intent 생성 (로그캣으로 확인한 정확한 액티비티명 사용)
@@ -3092,15 +3062,11 @@ class MainScreen(MDScreen):
                         action_text = "전자출결 앱을 "
                     except:
                         # 실패 시 Play Store로
-                        Uri = autoclass('android.net.Uri')
-                        store_uri = Uri.parse("market://details?id=edu.skku.attend")
+                        store_uri = java.Uri.parse("market://details?id=edu.skku.attend")
                         attendance_intent = Intent(Intent.ACTION_VIEW, store_uri)
                         action_text = "전자출결 앱 설치"
                 
                 # FLAG_IMMUTABLE 설정 (Android 12+ 필수)
-                FLAG_IMMUTABLE = 67108864
-                FLAG_UPDATE_CURRENT = 134217728
-                
                 pending_intent = PendingIntent.getActivity(
                     context,
                     int(class_data['id']),  # 과목 ID를 request code로 사용
@@ -3126,8 +3092,7 @@ class MainScreen(MDScreen):
                 
                 # 확장된 알림 내용
                 try:
-                    BigTextStyle = autoclass('android.app.Notification$BigTextStyle')
-                    big_text_style = BigTextStyle()
+                    big_text_style = java.BigTextStyle()
                     expanded_text = (
                         f"📚 과목: {class_data['name']}\n"
                         f"🕐 시간: {day_kr} {class_data['start_time']}\n"
@@ -3146,7 +3111,7 @@ class MainScreen(MDScreen):
                 builder.setVibrate([0, 250, 250, 250])
                 
                 # 알림 표시
-                notification_manager = context.getSystemService(Context.NOTIFICATION_SERVICE)
+                notification_manager = java.notification_manager()
                 notification_manager.notify(int(class_data['id']), builder.build())
                 
                 print(f"✅ {class_data['name']} 과목 알림 생성 완료")
@@ -3159,22 +3124,20 @@ class MainScreen(MDScreen):
     def test_notification(self):
             """과목 알림 테스트 - 실제 과목 정보 포함"""
             try:
-                if 'ANDROID_STORAGE' in os.environ:
+                if is_android():
                     # 시스템 알림 직접 호출
-                    from jnius import autoclass
-                    PythonActivity = autoclass('org.kivy.android.PythonActivity')
-                    Context = autoclass('android.content.Context')
+                    java = get_registry()
+                    PythonActivity = java.PythonActivity
                     
                     # Android 기본 Notification 클래스 사용
-                    Notification = autoclass('android.app.Notification')
-                    NotificationManager = autoclass('android.app.NotificationManager')
-                    Builder = autoclass('android.app.Notification$Builder')
+                    Notification = java.Notification
+                    Builder = java.Builder
                     
-                    Intent = autoclass('android.content.Intent')
-                    PendingIntent = autoclass('android.app.PendingIntent')
+                    Intent = java.Intent
+                    PendingIntent = java.PendingIntent
                     
                     # 컨텍스트 가져오기
-                    context = PythonActivity.mActivity
+                    context = java.activity()
                     
                     # 알림 채널 ID
                     channel_id = "timetable_alarm_channel"
@@ -3204,8 +3167,7 @@ class MainScreen(MDScreen):
                         print(f"전자출결 앱 Intent 생성 오류: {e}")
                         # 실패 시 Play Store로
                         try:
-                            Uri = autoclass('android.net.Uri')
-                            store_uri = Uri.parse("market://details?id=edu.skku.attend")
+                            store_uri = java.Uri.parse("market://details?id=edu.skku.attend")
                             attendance_intent = Intent(Intent.ACTION_VIEW, store_uri)
                             notification_action_text = "전자출결 앱 설치"
                             print("❌ 전자출결 앱 실행 실패 - Play Store로 이동")
@@ -3215,10 +3177,6 @@ class MainScreen(MDScreen):
                             attendance_intent.setFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
                             notification_action_text = "시간표 앱 열기"
                     
-                    # 🔥 Android 12+ 호환성을 위한 FLAG_IMMUTABLE 설정
-                    FLAG_IMMUTABLE = 67108864  # PendingIntent.FLAG_IMMUTABLE
-                    FLAG_UPDATE_CURRENT = 134217728  # PendingIntent.FLAG_UPDATE_CURRENT
-                    
                     # PendingIntent 생성 (크래시 방지를 위해 FLAG_IMMUTABLE 필수)
                     pending_intent = PendingIntent.getActivity(
                         context, 
@@ -3246,8 +3204,7 @@ class MainScreen(MDScreen):
                     
                     # 확장된 알림 스타일 (BigTextStyle 사용)
                     try:
-                        BigTextStyle = autoclass('android.app.Notification$BigTextStyle')
-                        big_text_style = BigTextStyle()
+                        big_text_style = java.BigTextStyle()
                         expanded_text = (
                             f"📚 과목: {sample_class['name']}\n"
                             f"🕐 시간: {sample_class['day']} {sample_class['time']}\n"
@@ -3272,7 +3229,7 @@ class MainScreen(MDScreen):
                         pass
                     
                     # 알림 표시
-                    notification_manager = context.getSystemService(Context.NOTIFICATION_SERVICE)
+                    notification_manager = java.notification_manager()
                     notification_manager.notify(9999, builder.build())
                     
                     print("✅ 과목 알림 전송 완료 (전자출결 앱 연동)")
@@ -3293,6 +3250,7 @@ class MainScreen(MDScreen):
                 traceback.print_exc()
 
 class TimeTableApp(MDApp):
+    @startup.span('build')
     def build(self):
         print("✅ build() 실행됨")
         Logger.info("DoubleCheck: build 시작됨")
@@ -3304,7 +3262,7 @@ class TimeTableApp(MDApp):
             pass  # PC에서는 이 경로가 없으므로 무시
 
         # 데이터 디렉토리 설정
-        if 'ANDROID_STORAGE' in os.environ:
+        if is_android():
             # Android 환경에서 데이터 디렉토리 생성
             data_dir = os.path.join(
                 os.path.dirname(os.path.abspath(__file__)), 
@@ -3315,32 +3273,24 @@ class TimeTableApp(MDApp):
             print(f"Android 환경: 데이터 디렉토리 = {data_dir}")
             print(f"✅ 데이터 디렉토리 확인/생성 완료: {data_dir}")
             
-            # 알람 파일 경로 설정 - 중요!
-            self.alarm_file_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), 
-                "alarms.pkl"
-            )
-            print(f"Android 알람 파일 경로: {self.alarm_file_path}")
-        else:
-            # PC 환경에서 기본 경로 설정
-            self.alarm_file_path = "alarms.pkl"
+        # 알람 파일 경로 - 서비스와 공유하는 단일 알람 DB
+        self.alarm_file_path = get_alarm_store_path()
+        print(f"알람 파일 경로: {self.alarm_file_path}")
 
         # 안드로이드에서는 윈도우 크기 설정하지 않음
-        if 'ANDROID_STORAGE' not in os.environ:
+        if not is_android():
             # PC 개발환경에서만 윈도우 크기 설정
             Window.size = (480, 800)
             
-        # 🔥 Window 준비 대기 - 인자 수정!
-        def wait_for_window(dt):  # ← dt 인자 추가!
-            if Window.width > 100 and Window.height > 100:
-                print(f"✅ Window 준비됨: {Window.width}x{Window.height}")
-                return False  # 스케줄링 중단
-            else:
-                print(f"⏳ Window 대기 중: {Window.width}x{Window.height}")
-                return True  # 계속 대기
-        
-        # Window가 준비될 때까지 대기
-        Clock.schedule_interval(wait_for_window, 0.1)
+        # 🔥 Window 준비 신호 - 0.1초 폴링 대신 크기 변경 이벤트로 확인
+        def on_window_size(window, size):
+            if window.width > 100 and window.height > 100:
+                print(f"✅ Window 준비됨: {window.width}x{window.height}")
+                window.unbind(size=on_window_size)
+                startup.signal('window_ready')
+
+        Window.bind(size=on_window_size)
+        on_window_size(Window, Window.size)
         
         # 한글 폰트 설정
         self.theme_cls.font_styles.update({
@@ -3361,17 +3311,13 @@ class TimeTableApp(MDApp):
         self.theme_cls.theme_style = "Light"
 
         # Android에서 알림 채널 생성
-        if 'ANDROID_STORAGE' in os.environ:
+        if is_android():
             try:
-                from jnius import autoclass
+                java = get_registry()
+                NotificationManager = java.NotificationManager
+                NotificationChannel = java.NotificationChannel
 
-                Context = autoclass('android.content.Context')
-                NotificationManager = autoclass('android.app.NotificationManager')
-                NotificationChannel = autoclass('android.app.NotificationChannel')
-                PythonActivity = autoclass('org.kivy.android.PythonActivity')
-
-                context = PythonActivity.mActivity.getApplicationContext()
-                notification_manager = context.getSystemService(Context.NOTIFICATION_SERVICE)
+                notification_manager = java.notification_manager()
 
                 if notification_manager:
                     channel_id = "timetable_alarm_channel"
@@ -3397,7 +3343,7 @@ class TimeTableApp(MDApp):
                     Logger.error(f"DoubleCheck: 알림 채널 예외 - {e}")
 
         # Android에서 백그라운드 서비스 시작
-        if 'ANDROID_STORAGE' in os.environ:
+        if is_android():
             try:
                 self.start_background_service()
                 print("✅ 백그라운드 알림 서비스 시작됨")
@@ -3413,12 +3359,9 @@ class TimeTableApp(MDApp):
         """앱 시작시 포어그라운드 서비스 자동 시작"""
         print("✅ 앱 시작됨")
         
-        # 포어그라운드 서비스 자동 시작
+        # 포어그라운드 서비스 자동 시작 - 시간표 첫 화면이 그려진 뒤 (고정 2초 대기 없음)
         if hasattr(self, 'main_screen'):
-            Clock.schedule_once(
-                lambda dt: self.main_screen.start_foreground_service(), 
-                2.0
-            )
+            startup.when('first_frame', self.main_screen.start_foreground_service)
         
     def on_resume(self):
         """백그라운드에서 돌아올 때 호출"""
@@ -3430,9 +3373,27 @@ class TimeTableApp(MDApp):
         except Exception as e:
             print(f"앱 재개 오류: {e}")
             
+    def on_stop(self):
+        """앱 종료시 대기 중인 파일 쓰기 기록"""
+        flush_pending()
+        print_write_stats()
+        if getattr(self, 'main_screen', None):
+            self.main_screen.class_editor.open_latency.print_stats()
+        if is_android():
+            get_registry().print_stats()
+    
     def on_pause(self):
         """백그라운드로 갈 때 호출"""
         print("📱 앱 일시정지됨")
+        # 대기 중인 파일 쓰기를 바로 기록 (일시정지 후 종료될 수 있음)
+        flush_pending()
+        print_write_stats()
+        # 백그라운드로 가는 동안 저널을 스냅샷으로 압축
+        try:
+            if hasattr(self, 'main_screen') and self.main_screen:
+                self.main_screen.storage.compact_in_background()
+        except Exception as e:
+            print(f"저널 압축 오류: {e}")
         return True  # True 반환해야 앱이 종료되지 않음
 
 
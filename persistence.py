@@ -0,0 +1,198 @@
+import os
+import tempfile
+import threading
+import time
+
+# 연속 저장을 하나로 합치는 기본 대기 시간 (초)
+DEFAULT_COALESCE_WINDOW = 0.5
+
+# 파일별 쓰기 지연 시간 통계 (path → dict)
+_write_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _record_write(path, elapsed, size):
+    """파일별 쓰기 시간 기록"""
+    with _stats_lock:
+        stats = _write_stats.setdefault(path, {
+            "count": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "last_ms": 0.0,
+            "last_size": 0,
+            "coalesced": 0
+        })
+        elapsed_ms = elapsed * 1000
+        stats["count"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        stats["last_ms"] = elapsed_ms
+        stats["last_size"] = size
+
+
+def _record_coalesced(path):
+    """대기 중인 쓰기가 새 쓰기로 대체된 횟수 기록"""
+    with _stats_lock:
+        stats = _write_stats.setdefault(path, {
+            "count": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "last_ms": 0.0,
+            "last_size": 0,
+            "coalesced": 0
+        })
+        stats["coalesced"] += 1
+
+
+def get_write_stats():
+    """파일별 쓰기 통계 복사본 반환 (평균 시간 포함)"""
+    with _stats_lock:
+        report = {}
+        for path, stats in _write_stats.items():
+            entry = dict(stats)
+            entry["avg_ms"] = stats["total_ms"] / stats["count"] if stats["count"] else 0.0
+            report[path] = entry
+        return report
+
+
+def print_write_stats():
+    """파일별 쓰기 통계 출력"""
+    for path, stats in get_write_stats().items():
+        print(f"💾 {os.path.basename(path)}: {stats['count']}회 쓰기, "
+              f"평균 {stats['avg_ms']:.1f}ms, 최대 {stats['max_ms']:.1f}ms, "
+              f"합쳐진 쓰기 {stats['coalesced']}회")
+
+
+def atomic_write(path, data, fsync=True):
+    """임시 파일에 쓴 뒤 rename으로 교체 - 쓰기 도중 종료되어도 기존 파일 유지
+
+    data가 str이면 UTF-8 텍스트, bytes면 바이너리로 기록한다.
+    """
+    started = time.perf_counter()
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        if fsync:
+            _fsync_directory(directory)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _record_write(path, time.perf_counter() - started, len(data))
+    return True
+
+
+def _fsync_directory(directory):
+    """rename 결과가 디스크에 반영되도록 디렉토리 fsync (지원하지 않는 플랫폼은 무시)"""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class CoalescingWriter:
+    """같은 파일에 대한 연속 저장을 window 시간 안에서 한 번의 원자적 쓰기로 합침
+
+    write_later는 파일 내용을, run_later는 저장 함수를 받는다 (저널 추가처럼 내용을 미리 만들 수 없는 저장용).
+    """
+
+    def __init__(self, window=DEFAULT_COALESCE_WINDOW):
+        self.window = window
+        self._pending = {}  # path → 가장 최근 데이터
+        self._timers = {}
+        self._lock = threading.Lock()
+
+    def write_later(self, path, data):
+        """window 시간 후 마지막 데이터만 기록 (window가 0이면 즉시 기록)"""
+        if self.window <= 0:
+            return atomic_write(path, data)
+        return self._schedule(path, data)
+
+    def run_later(self, key, save):
+        """window 시간 후 마지막으로 받은 save()만 실행 (window가 0이면 즉시 실행)"""
+        if self.window <= 0:
+            return save()
+        return self._schedule(key, save)
+
+    def _schedule(self, path, data):
+        with self._lock:
+            if path in self._pending:
+                _record_coalesced(path)
+            self._pending[path] = data
+            if path not in self._timers:
+                timer = threading.Timer(self.window, self._flush_path, args=(path,))
+                timer.daemon = True
+                self._timers[path] = timer
+                timer.start()
+        return True
+
+    def _flush_path(self, path):
+        with self._lock:
+            data = self._pending.pop(path, None)
+            timer = self._timers.pop(path, None)
+        if timer is not None:
+            timer.cancel()
+        if data is None:
+            return
+        try:
+            if callable(data):
+                started = time.perf_counter()
+                data()
+                _record_write(path, time.perf_counter() - started, 0)
+            else:
+                atomic_write(path, data)
+        except Exception as e:
+            print(f"❌ 지연 저장 실패 ({path}): {e}")
+
+    def flush(self, path=None):
+        """대기 중인 쓰기를 즉시 기록 (path가 없으면 전체)"""
+        with self._lock:
+            paths = [path] if path is not None else list(self._pending.keys())
+        for pending_path in paths:
+            self._flush_path(pending_path)
+
+    def has_pending(self, path=None):
+        with self._lock:
+            if path is None:
+                return bool(self._pending)
+            return path in self._pending
+
+
+# 프로세스 전체에서 공유하는 기본 writer
+default_writer = CoalescingWriter()
+
+
+def write_later(path, data):
+    """기본 writer로 지연 저장"""
+    return default_writer.write_later(path, data)
+
+
+def run_later(key, save):
+    """기본 writer로 저장 함수 지연 실행"""
+    return default_writer.run_later(key, save)
+
+
+def flush_pending(path=None):
+    """기본 writer의 대기 중인 쓰기 즉시 기록"""
+    default_writer.flush(path)
@@ -0,0 +1,213 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+from android_bridge import get_registry, FLAG_IMMUTABLE, FLAG_UPDATE_CURRENT
+
+# 알람이 울릴 때 Android가 호출하는 BroadcastReceiver
+ALARM_ACTION = "org.kivy.skkutimetable.TIMETABLE_ALARM"
+ALARM_RECEIVER_PACKAGE = "org.kivy.skkutimetable.doublecheck"
+ALARM_RECEIVER_CLASS = "org.kivy.skkutimetable.doublecheck.AlarmReceiver"
+
+ALARM_CHANNEL_ID = "timetable_alarm_channel"
+ATTENDANCE_PACKAGE = "edu.skku.attend"
+
+
+def is_android():
+    """Android 앱으로 실행 중인지 여부"""
+    return 'ANDROID_STORAGE' in os.environ
+
+
+class PlatformBackend(ABC):
+    """알람 예약/취소와 알림 표시를 담당하는 플랫폼 계층 - 호출별 횟수와 시간을 기록
+
+    세 메서드를 모두 구현하지 않은 백엔드는 생성할 때 TypeError (알람이 울릴 때가 아니라).
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.stats = {}  # 작업 이름 → {'count', 'total_ms', 'max_ms'}
+
+    @contextmanager
+    def _timed(self, operation):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats = self.stats.setdefault(operation, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+
+    def get_stats(self):
+        report = {}
+        for operation, stats in self.stats.items():
+            entry = dict(stats)
+            entry['avg_ms'] = stats['total_ms'] / stats['count'] if stats['count'] else 0.0
+            report[operation] = entry
+        return report
+
+    def print_stats(self):
+        for operation, stats in self.get_stats().items():
+            print(f"📊 {self.name}.{operation}: {stats['count']}회, "
+                  f"평균 {stats['avg_ms']:.2f}ms, 최대 {stats['max_ms']:.2f}ms")
+
+    @abstractmethod
+    def schedule_repeating(self, alarm_id, trigger_ms, interval_ms, extras):
+        """alarm_id 알람을 trigger_ms부터 interval_ms 간격으로 반복 예약"""
+
+    @abstractmethod
+    def cancel_alarm(self, alarm_id):
+        """alarm_id 알람 취소"""
+
+    @abstractmethod
+    def show_notification(self, notification_id, title, text, big_text=None):
+        """알림 표시 - 성공 여부 반환"""
+
+
+class AndroidPlatform(PlatformBackend):
+    """실제 Android AlarmManager/NotificationManager 사용"""
+
+    name = "android"
+
+    def __init__(self):
+        super().__init__()
+        self.java = get_registry()
+
+    def _alarm_pending_intent(self, alarm_id, extras=None):
+        java = self.java
+        intent = java.Intent()
+        intent.setAction(ALARM_ACTION)
+        intent.setComponent(java.ComponentName(ALARM_RECEIVER_PACKAGE, ALARM_RECEIVER_CLASS))
+        for key, value in (extras or {}).items():
+            intent.putExtra(key, value)
+        context = java.activity().getApplicationContext()
+        return java.PendingIntent.getBroadcast(context, alarm_id, intent, FLAG_UPDATE_CURRENT | FLAG_IMMUTABLE)
+
+    def schedule_repeating(self, alarm_id, trigger_ms, interval_ms, extras):
+        with self._timed('schedule_repeating'):
+            pending_intent = self._alarm_pending_intent(alarm_id, extras)
+            self.java.alarm_service().setRepeating(
+                self.java.AlarmManager.RTC_WAKEUP, trigger_ms, interval_ms, pending_intent
+            )
+
+    def cancel_alarm(self, alarm_id):
+        with self._timed('cancel_alarm'):
+            self.java.alarm_service().cancel(self._alarm_pending_intent(alarm_id))
+
+    def show_notification(self, notification_id, title, text, big_text=None):
+        """수업 알림 표시 - 터치하면 전자출결 앱(없으면 시간표 앱) 실행"""
+        with self._timed('show_notification'):
+            java = self.java
+            context = java.context()
+            if context is None:
+                print("❌ 알림을 표시할 컨텍스트가 없습니다")
+                return False
+
+            intent = context.getPackageManager().getLaunchIntentForPackage(ATTENDANCE_PACKAGE)
+            if not intent:
+                # 시간표 앱으로 폴백
+                intent = java.Intent(context, java.PythonActivity)
+                intent.setFlags(java.Intent.FLAG_ACTIVITY_NEW_TASK)
+            pending_intent = java.PendingIntent.getActivity(
+                context, notification_id, intent, FLAG_UPDATE_CURRENT | FLAG_IMMUTABLE
+            )
+
+            builder = java.Builder(context, ALARM_CHANNEL_ID)
+            builder.setSmallIcon(context.getApplicationInfo().icon)
+            builder.setContentTitle(title)
+            builder.setContentText(text)
+            if big_text:
+                try:
+                    big_text_style = java.BigTextStyle()
+                    big_text_style.bigText(big_text)
+                    builder.setStyle(big_text_style)
+                except Exception as style_e:
+                    print(f"BigTextStyle 설정 실패: {style_e}")
+            builder.setPriority(java.Notification.PRIORITY_HIGH)
+            builder.setContentIntent(pending_intent)
+            builder.setAutoCancel(True)
+            builder.setVibrate([0, 250, 250, 250])
+
+            java.notification_manager().notify(notification_id, builder.build())
+            return True
+
+
+class SimulatedPlatform(PlatformBackend):
+    """메모리 안에서 동작하는 가짜 플랫폼 - 예약된 인텐트와 표시된 알림을 기록
+
+    PC에서 예약/저장/알림 흐름 전체를 대량으로 실행해 성능을 재거나 회귀를 확인할 때 사용한다.
+    """
+
+    name = "simulated"
+
+    def __init__(self, verbose=False):
+        super().__init__()
+        self.verbose = verbose
+        self.scheduled = {}  # alarm_id → {'trigger_ms', 'interval_ms', 'extras'}
+        self.notifications = []  # (notification_id, title, text, big_text)
+        self.fired = []  # (alarm_id, trigger_ms)
+
+    def schedule_repeating(self, alarm_id, trigger_ms, interval_ms, extras):
+        with self._timed('schedule_repeating'):
+            self.scheduled[alarm_id] = {
+                'trigger_ms': trigger_ms,
+                'interval_ms': interval_ms,
+                'extras': dict(extras)
+            }
+            if self.verbose:
+                print(f"💻 알람 예약 시뮬레이션: {extras.get('class_name', alarm_id)}")
+
+    def cancel_alarm(self, alarm_id):
+        with self._timed('cancel_alarm'):
+            self.scheduled.pop(alarm_id, None)
+            if self.verbose:
+                print(f"💻 알람 취소 시뮬레이션: {alarm_id}")
+
+    def show_notification(self, notification_id, title, text, big_text=None):
+        with self._timed('show_notification'):
+            self.notifications.append((notification_id, title, text, big_text))
+            if self.verbose:
+                print(f"🔔 {title} - {text}")
+            return True
+
+    def advance(self, now_ms):
+        """now_ms까지 울려야 하는 예약 알람을 실행하고 다음 반복 시간으로 넘김 - 실행된 alarm_id 목록"""
+        with self._timed('advance'):
+            fired_ids = []
+            for alarm_id, alarm in self.scheduled.items():
+                while alarm['trigger_ms'] <= now_ms:
+                    self.fired.append((alarm_id, alarm['trigger_ms']))
+                    fired_ids.append(alarm_id)
+                    extras = alarm['extras']
+                    self.show_notification(
+                        alarm_id,
+                        f"🔔 수업 알림: {extras.get('class_name', '수업')}",
+                        f"{extras.get('class_time', '')} | {extras.get('class_room', '')}"
+                    )
+                    if alarm['interval_ms'] <= 0:
+                        alarm['trigger_ms'] = float('inf')  # 반복 없는 알람은 한 번만
+                    else:
+                        alarm['trigger_ms'] += alarm['interval_ms']
+            return fired_ids
+
+
+_platform = None
+
+
+def get_platform():
+    """실행 환경에 맞는 공유 플랫폼 (처음 사용할 때 생성)"""
+    global _platform
+    if _platform is None:
+        _platform = AndroidPlatform() if is_android() else SimulatedPlatform(verbose=True)
+    return _platform
+
+
+def set_platform(platform):
+    """플랫폼 교체 (벤치마크/회귀 확인용 SimulatedPlatform 등)"""
+    global _platform
+    _platform = platform
+    return platform
@@ -0,0 +1,277 @@
+"""시간표 복원 경로 벤치마크 - 과목 수(기본 5/50/500개)에 따라 시작 시간이 늘어나는지 확인
+
+Kivy가 있으면 실제 MainScreen.load_saved_timetable/add_class_to_grid를 위젯 대신 카드 기록만 남기는
+CardLayer 그리드에 대고 실행하고, 이어서 AlarmManager 로드/동기화를 측정한다.
+Kivy가 없으면 같은 순서(저장소 로드 → 카드 좌표 계산 → 인앱 알람 큐 동기화)를 이 파일의 사본으로 측정한다.
+
+복원 중 시간표 저장 요청(save_classes/save_classes_later 호출) 횟수도 세어서 1회를 넘으면
+종료 코드 1 (과목마다 저장하던 회귀 방지용).
+
+사용법:
+    python restore_benchmark.py
+    python restore_benchmark.py --counts 5 50 500 --backend sqlite --repeat 5
+    python restore_benchmark.py --budget-ms 200   # 가장 큰 과목 수의 전체 시간 예산
+    python restore_benchmark.py --no-kivy         # Kivy가 있어도 사본 경로로 측정
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from alarm_manager import AlarmManager
+from alarm_schedule import RecurringAlarmQueue, alarm_fingerprint, diff_fingerprints
+from alarm_store import AlarmStore
+from db_handler import create_storage
+from grid_geometry import GridGeometry, WEEK_DAYS
+from persistence import flush_pending
+from platform_backend import SimulatedPlatform
+
+PHASES = ('storage_load', 'card_layout', 'in_app_alarms', 'alarm_manager')
+APP_PHASES = ('restore', 'alarm_manager')
+MAX_RESTORE_SAVES = 1
+
+# 복원 중 MainScreen에서 그대로 빌려 쓰는 메서드
+RESTORE_METHODS = (
+    'load_saved_timetable', 'add_class_to_grid', 'remove_class_card', 'card_geometry',
+    'create_class_card_widget', 'schedule_in_app_alarm', '_arm_in_app_alarm_clock',
+    '_dispatch_in_app_alarms', 'save_timetable'
+)
+
+
+def make_classes(count):
+    """요일/시간이 골고루 퍼진 과목 count개"""
+    classes = {}
+    for class_id in range(1, count + 1):
+        hour = 9 + (class_id // 5) % 10
+        classes[class_id] = {
+            'id': class_id,
+            'name': f"과목 {class_id}",
+            'day': WEEK_DAYS[class_id % 5],
+            'start_time': f"{hour:02d}:00",
+            'end_time': f"{hour + 1:02d}:00",
+            'room': f"{class_id:05d}",
+            'professor': f"교수 {class_id}",
+            'color': (0.5, 0.6, 0.9, 1),
+            'notify_before': 5
+        }
+    return classes
+
+
+def layout_cards(geometry, classes):
+    """MainScreen.card_geometry와 같은 조회 (좌표 표 기준, 위젯 생성 제외)"""
+    cards = {}
+    for class_id, class_data in classes.items():
+        day_index = geometry.day_column(class_data['day'])
+        if day_index is None:
+            continue
+        start_hour, start_minute = map(int, class_data['start_time'].split(':'))
+        end_hour, end_minute = map(int, class_data['end_time'].split(':'))
+        top = geometry.y_at(geometry.minutes_from_start(start_hour, start_minute))
+        bottom = geometry.y_at(geometry.minutes_from_start(end_hour, end_minute))
+        cards[class_id] = (geometry.day_x[day_index] + geometry.spacing, bottom, top - bottom)
+    return cards
+
+
+def sync_in_app_alarms(queue, classes):
+    """MainScreen.reconcile_in_app_alarms와 같은 비교 후 예약"""
+    desired = {class_id: alarm_fingerprint(class_data, class_data.get('notify_before', 5))
+               for class_id, class_data in classes.items()}
+    added, changed, removed, _ = diff_fingerprints(desired, queue.fingerprints())
+    for class_id in removed:
+        queue.remove(class_id)
+    for class_id in added + changed:
+        class_data = classes[class_id]
+        queue.add(class_id, class_data['day'], class_data['start_time'], class_data.get('notify_before', 5),
+                  payload=class_data, fingerprint=desired[class_id])
+
+
+def load_app():
+    """Kivy가 있으면 main 모듈, 없으면 None"""
+    os.environ.setdefault('KIVY_NO_ARGS', '1')
+    try:
+        import main as app_main
+    except ImportError as e:
+        print(f"⚠️ Kivy 없음 - 실제 복원 경로 대신 사본으로 측정: {e}")
+        return None
+    return app_main
+
+
+@contextlib.contextmanager
+def counting_saves(storage):
+    """with 블록 안의 시간표 저장 요청 횟수 - save_classes와 save_classes_later 호출을 한 번씩 셈
+
+    지연 저장은 예약할 때 세므로 과목마다 저장하면 나중에 한 번으로 합쳐지더라도 과목 수만큼 잡힌다.
+    """
+    counter = {'saves': 0, 'deferring': False}
+    save_classes = storage.save_classes
+    save_classes_later = storage.save_classes_later
+
+    def counted_save_classes(classes_data):
+        if not counter['deferring']:
+            counter['saves'] += 1
+        return save_classes(classes_data)
+
+    def counted_save_classes_later(classes_data):
+        counter['saves'] += 1
+        counter['deferring'] = True  # SQLite는 바로 save_classes를 부름 - 두 번 세지 않음
+        try:
+            return save_classes_later(classes_data)
+        finally:
+            counter['deferring'] = False
+
+    storage.save_classes = counted_save_classes
+    storage.save_classes_later = counted_save_classes_later
+    try:
+        yield counter
+    finally:
+        del storage.save_classes
+        del storage.save_classes_later
+
+
+def make_restore_screen(app_main, storage, geometry):
+    """MainScreen 복원 메서드를 그대로 쓰는 화면 대역 - 그리드는 위젯 없이 카드 기록만 남기는 CardLayer"""
+    screen_class = type('RestoreScreen', (), {
+        name: getattr(app_main.MainScreen, name) for name in RESTORE_METHODS
+    })
+    screen = screen_class()
+    screen.storage = storage
+    screen.time_grid = SimpleNamespace(
+        geometry=geometry,
+        card_layer=app_main.CardLayer(geometry.day_col_width, 60)
+    )
+    screen.class_cards = {}
+    screen.classes_data = {}
+    screen.class_editor = SimpleNamespace(next_class_id=1)
+    screen.in_app_alarms = RecurringAlarmQueue()
+    screen._alarm_event = None
+    screen._armed_alarm_time = None
+    return screen
+
+
+def run_once(count, backend, work_dir, app_main=None):
+    """과목 count개 복원 한 번 - ({단계: ms}, 복원 중 시간표 저장 횟수)"""
+    os.environ['HOME'] = work_dir  # 저장소 경로(~/.timetable_app)를 임시 디렉토리로
+    alarm_db = os.path.join(work_dir, "alarms.db")
+    classes = make_classes(count)
+
+    # 준비 (측정 제외): 저장된 시간표와 이미 예약된 알람
+    storage = create_storage(backend)
+    storage.save_classes(classes)
+    if hasattr(storage, 'close'):
+        storage.close()
+    manager = AlarmManager(platform=SimulatedPlatform(), store=AlarmStore(alarm_db, notify=False))
+    manager.schedule_many(classes)
+    manager.store.close()
+
+    timings = {}
+    geometry = GridGeometry(0, 0, 400, 600, WEEK_DAYS[:5], 9, 20, 76, 4)
+    storage = create_storage(backend)
+    with counting_saves(storage) as counter:
+        if app_main is not None:
+            # 실제 복원 경로 (저장소 로드 + 카드 기록 + 인앱 알람 예약)
+            screen = make_restore_screen(app_main, storage, geometry)
+            started = time.perf_counter()
+            screen.load_saved_timetable()
+            timings['restore'] = (time.perf_counter() - started) * 1000
+            if screen._alarm_event is not None:
+                screen._alarm_event.cancel()
+            loaded = screen.classes_data
+            cards = screen.class_cards
+        else:
+            started = time.perf_counter()
+            loaded = storage.load_classes()
+            timings['storage_load'] = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            cards = layout_cards(geometry, loaded)
+            timings['card_layout'] = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            sync_in_app_alarms(RecurringAlarmQueue(), loaded)
+            timings['in_app_alarms'] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        manager = AlarmManager(platform=SimulatedPlatform(), store=AlarmStore(alarm_db, notify=False))
+        manager.reconcile({class_id: class_data for class_id, class_data in loaded.items()
+                           if class_id in manager.alarms})
+        timings['alarm_manager'] = (time.perf_counter() - started) * 1000
+        manager.store.close()
+
+    # 예약된 저장은 임시 디렉토리를 지우기 전에 기록
+    flush_pending()
+    if hasattr(storage, 'close'):
+        storage.close()
+
+    assert len(loaded) == count and len(cards) == count
+    return timings, counter['saves']
+
+
+def benchmark(count, backend, repeat, app_main=None):
+    """repeat번 실행한 ({단계: 중앙값 ms}, 최대 저장 횟수)"""
+    phases = APP_PHASES if app_main is not None else PHASES
+    samples = {phase: [] for phase in phases}
+    max_saves = 0
+    for _ in range(repeat):
+        work_dir = tempfile.mkdtemp(prefix="timetable_bench_")
+        try:
+            # 저장소/알람 계층의 진행 로그는 측정에서 제외
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings, saves = run_once(count, backend, work_dir, app_main)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        for phase in phases:
+            samples[phase].append(timings[phase])
+        max_saves = max(max_saves, saves)
+    return {phase: statistics.median(values) for phase, values in samples.items()}, max_saves
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간표 복원 경로 벤치마크")
+    parser.add_argument('--counts', type=int, nargs='+', default=[5, 50, 500])
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=None, help="가장 큰 과목 수의 전체 시간 예산(ms)")
+    parser.add_argument('--no-kivy', action='store_true', help="Kivy가 있어도 실제 복원 경로 대신 사본으로 측정")
+    args = parser.parse_args()
+
+    app_main = None if args.no_kivy else load_app()
+    phases = APP_PHASES if app_main is not None else PHASES
+    home = os.environ.get('HOME')
+    results = {}
+    try:
+        for count in args.counts:
+            results[count] = benchmark(count, args.backend, args.repeat, app_main)
+    finally:
+        if home is not None:
+            os.environ['HOME'] = home
+
+    path = "MainScreen" if app_main is not None else "사본"
+    print(f"📊 복원 벤치마크 ({args.backend}, {path}, 중앙값 {args.repeat}회)")
+    print("   과목 수 " + "".join(f"{phase:>15}" for phase in phases) + f"{'total':>10}{'과목당':>10}{'저장':>6}")
+    for count, (timings, saves) in results.items():
+        total_ms = sum(timings.values())
+        print(f"   {count:6d} " + "".join(f"{timings[phase]:13.2f}ms" for phase in phases)
+              + f"{total_ms:8.2f}ms{total_ms * 1000 / count:8.1f}us{saves:6d}")
+
+    failed = False
+    for count, (_, saves) in results.items():
+        if saves > MAX_RESTORE_SAVES:
+            print(f"❌ 복원 중 시간표 저장 {saves}회 ({count}개) - 최대 {MAX_RESTORE_SAVES}회")
+            failed = True
+    if args.budget_ms is not None:
+        largest = max(results)
+        total_ms = sum(results[largest][0].values())
+        if total_ms > args.budget_ms:
+            print(f"❌ 복원 시간 예산 초과 ({largest}개): {total_ms:.1f}ms > {args.budget_ms:.1f}ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
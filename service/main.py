@@ -1,19 +1,35 @@
 # service/main.py
 import os
+import select
+import socket
 import sys
 from time import sleep
 from datetime import datetime, timedelta
-import pickle
+
+# 메인 앱과 공유하는 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from alarm_store import AlarmStore, ALARM_SIGNAL_ADDR
+from alarm_schedule import RecurringAlarmQueue, to_millis
+from android_bridge import get_registry
+from platform_backend import get_platform
+
+# 메인 앱과 같은 알람 DB 사용 (프로세스당 연결 하나)
+_alarm_store = None
+
+def get_alarm_store():
+    """공유 알람 저장소 연결"""
+    global _alarm_store
+    if _alarm_store is None:
+        # 서비스 자신의 쓰기로는 스스로를 깨우지 않음
+        _alarm_store = AlarmStore(notify=False)
+    return _alarm_store
 
 def load_alarms():
     """저장된 알람 정보 로드"""
     try:
-        # 메인 앱과 동일한 경로에서 알람 파일 로드
-        alarm_file = os.path.join(os.path.dirname(__file__), '..', 'alarms.pkl')
-        with open(alarm_file, 'rb') as f:
-            alarms = pickle.load(f)
-            print(f"✅ 알람 {len(alarms)}개 로드 완료")
-            return alarms
+        alarms = get_alarm_store().load_all()
+        print(f"✅ 알람 {len(alarms)}개 로드 완료")
+        return alarms
     except Exception as e:
         print(f"알람 데이터 로드 실패: {e}")
         return {}
@@ -21,9 +37,7 @@ def load_alarms():
 def save_alarms(alarms):
     """알람 정보 저장"""
     try:
-        alarm_file = os.path.join(os.path.dirname(__file__), '..', 'alarms.pkl')
-        with open(alarm_file, 'wb') as f:
-            pickle.dump(alarms, f)
+        get_alarm_store().replace_all(alarms)
         print(f"✅ 알람 {len(alarms)}개 저장 완료")
         return True
     except Exception as e:
@@ -33,78 +47,22 @@ def save_alarms(alarms):
 def create_notification(class_name, class_room, class_time, class_professor):
     """백그라운드에서 알림 생성"""
     try:
-        from jnius import autoclass
-        PythonActivity = autoclass('org.kivy.android.PythonActivity')
-        Context = autoclass('android.content.Context')
-        
-        Notification = autoclass('android.app.Notification')
-        NotificationManager = autoclass('android.app.NotificationManager')
-        Builder = autoclass('android.app.Notification$Builder')
-        Intent = autoclass('android.content.Intent')
-        PendingIntent = autoclass('android.app.PendingIntent')
-        
-        # 🔥 중요: mActivity가 None일 수 있으므로 체크
-        if not hasattr(PythonActivity, 'mActivity') or PythonActivity.mActivity is None:
-            print("❌ PythonActivity.mActivity가 None - 서비스 환경")
-            return False
-        
-        context = PythonActivity.mActivity
-        channel_id = "timetable_alarm_channel"
-        
-        # 전자출결 앱 Intent
-        package_name = 'edu.skku.attend'
-        pm = context.getPackageManager()
-        attendance_intent = pm.getLaunchIntentForPackage(package_name)
-        
-        if not attendance_intent:
-            # 시간표 앱으로 폴백
-            attendance_intent = Intent(context, PythonActivity)
-            attendance_intent.setFlags(Intent.FLAG_ACTIVITY_NEW_TASK)
-        
-        # Android 12+ 호환 FLAG_IMMUTABLE
-        FLAG_IMMUTABLE = 67108864
-        FLAG_UPDATE_CURRENT = 134217728
-        
-        pending_intent = PendingIntent.getActivity(
-            context, 
-            hash(class_name) % 10000,  # 고유 request code
-            attendance_intent, 
-            FLAG_UPDATE_CURRENT | FLAG_IMMUTABLE
+        expanded_text = (
+            f"📚 과목: {class_name}\n"
+            f"🕐 시간: {class_time}\n"
+            f"🏛️ 강의실: {class_room}\n"
+            f"👨‍🏫 교수: {class_professor} 교수님\n\n"
+            f"📱 전자출결하려면 터치하세요"
         )
-        
-        # 알림 생성
-        builder = Builder(context, channel_id)
-        builder.setSmallIcon(context.getApplicationInfo().icon)
-        builder.setContentTitle(f"🔔 수업 알림: {class_name}")
-        builder.setContentText(f"{class_time} | {class_room} | {class_professor} 교수님")
-        
-        # 확장 텍스트
-        try:
-            BigTextStyle = autoclass('android.app.Notification$BigTextStyle')
-            big_text_style = BigTextStyle()
-            expanded_text = (
-                f"📚 과목: {class_name}\n"
-                f"🕐 시간: {class_time}\n"
-                f"🏛️ 강의실: {class_room}\n"
-                f"👨‍🏫 교수: {class_professor} 교수님\n\n"
-                f"📱 전자출결하려면 터치하세요"
-            )
-            big_text_style.bigText(expanded_text)
-            builder.setStyle(big_text_style)
-        except Exception as style_e:
-            print(f"BigTextStyle 설정 실패: {style_e}")
-        
-        builder.setPriority(Notification.PRIORITY_HIGH)
-        builder.setContentIntent(pending_intent)
-        builder.setAutoCancel(True)
-        builder.setVibrate([0, 250, 250, 250])
-        
-        # 알림 표시
-        notification_manager = context.getSystemService(Context.NOTIFICATION_SERVICE)
-        notification_manager.notify(hash(class_name) % 10000, builder.build())
-        
-        print(f"✅ 백그라운드 알림 생성: {class_name}")
-        return True
+        shown = get_platform().show_notification(
+            hash(class_name) % 10000,  # 고유 request code / 알림 ID
+            f"🔔 수업 알림: {class_name}",
+            f"{class_time} | {class_room} | {class_professor} 교수님",
+            expanded_text
+        )
+        if shown:
+            print(f"✅ 백그라운드 알림 생성: {class_name}")
+        return shown
         
     except Exception as e:
         print(f"❌ 백그라운드 알림 생성 실패: {e}")
@@ -112,60 +70,145 @@ def create_notification(class_name, class_room, class_time, class_professor):
         traceback.print_exc()
         return False
 
-def check_alarms():
-    """알람 시간 체크 및 알림 생성"""
-    alarms = load_alarms()
-    if not alarms:
-        print("📭 확인할 알람이 없습니다")
-        return
-    
-    now = datetime.now()
-    alarms_to_remove = []
-    
-    print(f"⏰ 현재 시간: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"📋 등록된 알람 {len(alarms)}개 확인 중...")
-    
-    for alarm_id, alarm_data in alarms.items():
+# 변경 신호를 못 받아도 이 간격마다 DB 변경 여부를 확인
+FALLBACK_CHECK_SECONDS = 60
+# 알림 생성 실패 시 재시도 간격 (초)
+RETRY_SECONDS = 60
+# 늦게 깨어났을 때 지난 알람을 그래도 울리는 한도 (수업 시작 후 분)
+MISSED_ALARM_GRACE_MINUTES = 10
+
+
+class AlarmScheduler:
+    """다음 알람 시간 기준 최소 힙 - 다음 알람까지 정확히 잠들고 변경 신호가 오면 바로 깨어남"""
+
+    def __init__(self, store):
+        self.store = store
+        self.queue = RecurringAlarmQueue()  # 앱/알람 매니저와 같은 다음 알람 계산 사용
+        self.data_version = None
+        self.signal_socket = self._open_signal_socket()
+        self.wakeups = 0
+        self.reload()
+
+    def _open_signal_socket(self):
+        """UI 프로세스의 변경 신호를 받을 UDP 소켓"""
         try:
-            # 알람 시간이 지났는지 체크
-            alarm_time = alarm_data.get('alarm_time')
-            if isinstance(alarm_time, str):
-                # 문자열이면 datetime으로 변환
-                alarm_time = datetime.fromisoformat(alarm_time)
-            
-            if alarm_time:
-                print(f"🔍 알람 ID {alarm_id}: {alarm_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                if now >= alarm_time:
-                    print(f"🔔 알람 시간 도달! ID: {alarm_id}")
-                    
-                    # 알림 생성
-                    success = create_notification(
-                        alarm_data.get('class_name', '수업'),
-                        alarm_data.get('class_room', '강의실'), 
-                        alarm_data.get('class_time', '시간'),
-                        alarm_data.get('class_professor', '교수님')
-                    )
-                    
-                    if success:
-                        # 알람 제거 목록에 추가 (한 번만 울림)
-                        alarms_to_remove.append(alarm_id)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.bind(ALARM_SIGNAL_ADDR)
+            sock.setblocking(False)
+            print(f"📡 알람 변경 신호 대기: {ALARM_SIGNAL_ADDR[0]}:{ALARM_SIGNAL_ADDR[1]}")
+            return sock
+        except OSError as e:
+            print(f"⚠️ 변경 신호 소켓 사용 불가 ({e}) - {FALLBACK_CHECK_SECONDS}초 간격 확인으로 대체")
+            return None
+
+    def reload(self):
+        """DB에서 힙 다시 만들기 (알람이 바뀌었을 때만 호출)"""
+        self.queue.clear()
+        now = datetime.now()
+        overdue_count = 0
+        for class_id, record in self.store.load_all().items():
+            class_data = record.get('class_data', {})
+            minutes_before = record.get('minutes_before', 5)
+            self.queue.add(class_id, class_data.get('day'), class_data.get('start_time'),
+                           minutes_before, payload=class_data, now=now)
+
+            # 저장된 알람 시각이 이미 지났으면 아직 울리지 않은 것 (서비스가 울리면 다음 주로 갱신함)
+            # 수업 시작 직후까지는 다음 주로 넘기지 않고 바로 울림 (도즈 등으로 늦게 깨어난 경우)
+            stored_ms = record.get('next_alarm_time')
+            if stored_ms:
+                stored_time = datetime.fromtimestamp(stored_ms / 1000)
+                late_limit = stored_time + timedelta(minutes=(minutes_before or 0) + MISSED_ALARM_GRACE_MINUTES)
+                if stored_time <= now < late_limit:
+                    self.queue.reschedule(class_id, retry_at=stored_time)
+                    overdue_count += 1
+        self.data_version = self.store.data_version()
+        print(f"📋 알람 {len(self.queue)}개 예약 상태 갱신 (지난 알람 {overdue_count}개 바로 처리)")
+
+    def seconds_until_next(self, now):
+        """다음 알람까지 남은 시간 (초) - 대기 상한 적용"""
+        timeout = FALLBACK_CHECK_SECONDS
+        next_due = self.queue.next_due()
+        if next_due:
+            timeout = min(timeout, max(0.0, (next_due[0] - now).total_seconds()))
+        return timeout
+
+    def fire_due(self, now):
+        """시간이 된 알람만 힙에서 꺼내 알림 생성"""
+        fired_count = 0
+        for class_id, fire_time, class_data in self.queue.pop_due(now):
+            print(f"🔔 알람 시간 도달! ID: {class_id}")
+            try:
+                success = create_notification(
+                    class_data.get('name') or '수업',
+                    class_data.get('room') or '강의실',
+                    class_data.get('start_time') or '시간',
+                    class_data.get('professor') or '교수님'
+                )
+            except Exception as e:
+                print(f"알람 처리 오류 (ID: {class_id}): {e}")
+                success = False
+
+            if success:
+                # 매주 반복 알람이므로 다음 주로 넘김
+                next_fire = self.queue.reschedule(class_id, now=now)
+                if next_fire is not None:
+                    self.store.set_next_fire(class_id, to_millis(next_fire))
+                fired_count += 1
+            else:
+                # 실패하면 잠시 후 다시 시도 (DB의 예약 시간은 그대로)
+                self.queue.reschedule(class_id, retry_at=now + timedelta(seconds=RETRY_SECONDS))
+
+        if fired_count:
+            print(f"✅ {fired_count}개 알람 처리 완료")
+        # 서비스 자신의 쓰기는 변경으로 보지 않음
+        self.data_version = self.store.data_version()
+        return fired_count
+
+    def wait(self, timeout):
+        """timeout 동안 대기 - 변경 신호가 오면 True"""
+        if self.signal_socket is None:
+            sleep(timeout)
+            return False
+        readable, _, _ = select.select([self.signal_socket], [], [], timeout)
+        if not readable:
+            return False
+        # 쌓인 신호 모두 비우기
+        try:
+            while True:
+                self.signal_socket.recvfrom(64)
+        except (BlockingIOError, OSError):
+            pass
+        return True
+
+    def changed_on_disk(self):
+        """다른 프로세스가 DB를 바꿨는지 확인 (신호를 놓친 경우 대비)"""
+        return self.store.data_version() != self.data_version
+
+    def run_forever(self):
+        while True:
+            try:
+                self.fire_due(datetime.now())
+
+                timeout = self.seconds_until_next(datetime.now())
+                next_due = self.queue.next_due()
+                if next_due:
+                    next_time = next_due[0]
+                    print(f"😴 {timeout:.0f}초 대기 (다음 알람: {next_time.strftime('%Y-%m-%d %H:%M')})")
                 else:
-                    time_diff = alarm_time - now
-                    print(f"⏳ 알람까지 {time_diff.total_seconds() / 60:.1f}분 남음")
-                
-        except Exception as e:
-            print(f"알람 체크 오류 (ID: {alarm_id}): {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # 사용된 알람 제거
-    if alarms_to_remove:
-        for alarm_id in alarms_to_remove:
-            if alarm_id in alarms:
-                del alarms[alarm_id]
-        save_alarms(alarms)
-        print(f"✅ {len(alarms_to_remove)}개 알람 처리 완료")
+                    print(f"😴 {timeout:.0f}초 대기 (예약된 알람 없음)")
+
+                signaled = self.wait(timeout)
+                self.wakeups += 1
+                if signaled or self.changed_on_disk():
+                    print("🔄 알람 변경 감지 - 다시 불러오기")
+                    # 대기 중에 시간이 된 알람은 다시 불러오기 전에 먼저 울림 (reload는 현재 시각 기준으로 다시 계산)
+                    self.fire_due(datetime.now())
+                    self.reload()
+            except Exception as e:
+                print(f"서비스 오류: {e}")
+                import traceback
+                traceback.print_exc()
+                sleep(60)  # 오류 시 1분 대기
 
 # 🔥 중요: 문법 수정 - **name** → __name__
 if __name__ == '__main__':
@@ -173,8 +216,7 @@ if __name__ == '__main__':
     
     # 포그라운드 서비스로 실행
     try:
-        from jnius import autoclass
-        PythonService = autoclass('org.kivy.android.PythonService')
+        PythonService = get_registry().PythonService
         
         if hasattr(PythonService, 'mService') and PythonService.mService:
             PythonService.mService.setAutoRestartService(True)
@@ -193,17 +235,5 @@ if __name__ == '__main__':
         import traceback
         traceback.print_exc()
     
-    # 메인 루프
-    check_count = 0
-    while True:
-        try:
-            check_count += 1
-            print(f"\n🔄 알람 체크 #{check_count}")
-            check_alarms()
-            print("😴 30초 대기 중...")
-            sleep(30)  # 30초마다 체크
-        except Exception as e:
-            print(f"서비스 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            sleep(60)  # 오류 시 1분 대기
+    # 메인 루프 - 다음 알람까지 대기하고 변경 신호가 오면 바로 깨어남
+    AlarmScheduler(get_alarm_store()).run_forever()
@@ -0,0 +1,125 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from persistence import atomic_write
+
+TRACE_FILE_NAME = "startup_trace.json"
+
+# 첫 화면에 필요 없어서 처음 사용할 때 import하는 모듈 (첫 프레임 전에 로드되면 회귀)
+DEFERRED_MODULES = (
+    'kivymd.uix.dialog',
+    'kivymd.uix.menu',
+    'kivymd.uix.textfield',
+    'kivymd.uix.spinner',
+    'countdown',
+    'plyer',
+)
+
+
+def get_trace_path():
+    """시작 타임라인 파일 경로 (앱 디렉토리)"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), TRACE_FILE_NAME)
+
+
+class StartupTimeline:
+    """앱 시작 단계 타임라인 + 준비 신호
+
+    span()/mark()로 단계를 기록하고, signal()로 준비 완료를 알리면 when()으로 등록한 콜백이 실행된다.
+    고정 대기(schedule_once(..., 2.0)) 대신 앞 단계가 끝나는 즉시 다음 단계를 시작하기 위한 것.
+    write()는 Chrome trace 형식(chrome://tracing, Perfetto에서 열 수 있음)으로 저장한다.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []  # (name, start_ms, duration_ms) - duration이 None이면 순간 이벤트
+        self._signals = set()
+        self._waiting = {}  # name → [callback]
+
+    def now_ms(self):
+        return (time.perf_counter() - self.origin) * 1000
+
+    def mark(self, name):
+        """순간 이벤트 기록 - 기록 시각(ms) 반환"""
+        at = self.now_ms()
+        self.events.append((name, at, None))
+        return at
+
+    @contextmanager
+    def span(self, name):
+        """with 블록 구간을 하나의 단계로 기록 (예외가 나도 기록)"""
+        started = self.now_ms()
+        try:
+            yield
+        finally:
+            self.events.append((name, started, self.now_ms() - started))
+
+    def is_set(self, name):
+        return name in self._signals
+
+    def signal(self, name):
+        """준비 완료 알림 - 처음 한 번만 기록하고 대기 중인 콜백 실행"""
+        if name in self._signals:
+            return False
+        self._signals.add(name)
+        self.mark(name)
+        for callback in self._waiting.pop(name, []):
+            try:
+                callback()
+            except Exception as e:
+                print(f"❌ 시작 단계 콜백 오류 ({name}): {e}")
+        return True
+
+    def when(self, name, callback):
+        """name이 준비되면 callback 실행 (이미 준비됐으면 바로 실행)"""
+        if name in self._signals:
+            callback()
+        else:
+            self._waiting.setdefault(name, []).append(callback)
+
+    def eager_imports(self, modules=DEFERRED_MODULES):
+        """지연 로딩 대상 중 이미 import된 모듈 목록"""
+        return [name for name in modules if name in sys.modules]
+
+    def get_stats(self):
+        """{단계 이름: 시작/종료 시각(ms)} - 같은 이름이 여러 번이면 처음 것"""
+        report = {}
+        for name, start_ms, duration_ms in self.events:
+            if name not in report:
+                report[name] = {
+                    'start_ms': start_ms,
+                    'end_ms': start_ms + (duration_ms or 0.0),
+                    'duration_ms': duration_ms
+                }
+        return report
+
+    def print_summary(self):
+        for name, start_ms, duration_ms in sorted(self.events, key=lambda event: event[1]):
+            if duration_ms is None:
+                print(f"🚦 {start_ms:8.1f}ms  {name}")
+            else:
+                print(f"⏱️ {start_ms:8.1f}ms  {name} ({duration_ms:.1f}ms)")
+
+    def write(self, path=None):
+        """타임라인을 trace 파일로 저장 - 저장한 경로 반환 (실패하면 None)"""
+        path = path or get_trace_path()
+        trace_events = []
+        for name, start_ms, duration_ms in self.events:
+            event = {'name': name, 'cat': 'startup', 'pid': os.getpid(), 'tid': 0, 'ts': int(start_ms * 1000)}
+            if duration_ms is None:
+                event.update(ph='i', s='g')
+            else:
+                event.update(ph='X', dur=int(duration_ms * 1000))
+            trace_events.append(event)
+        try:
+            atomic_write(path, json.dumps({'traceEvents': trace_events}, ensure_ascii=False), fsync=False)
+            return path
+        except Exception as e:
+            print(f"❌ 시작 타임라인 저장 실패: {e}")
+            return None
+
+
+# 프로세스 전체에서 하나 - main 모듈 import 시점이 기준(0ms)
+startup = StartupTimeline()
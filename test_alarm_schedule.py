@@ -0,0 +1,137 @@
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from alarm_schedule import RecurringAlarmQueue, next_alarm_time, next_class_time, to_millis
+
+# 2026-10-19는 월요일
+MONDAY = datetime(2026, 10, 19)
+
+
+def test_reference_date_is_monday():
+    assert MONDAY.weekday() == 0
+
+
+def test_alarm_exactly_now_is_returned():
+    now = MONDAY.replace(hour=8, minute=55)
+    assert next_alarm_time("Monday", "09:00", 5, now) == now
+
+
+def test_alarm_already_past_rolls_to_next_week():
+    now = MONDAY.replace(hour=8, minute=56)
+    assert next_alarm_time("Monday", "09:00", 5, now) == MONDAY.replace(hour=8, minute=55) + timedelta(days=7)
+
+
+def test_class_time_is_strictly_after_now():
+    now = MONDAY.replace(hour=9)
+    assert next_class_time("Monday", "09:00", now) == now + timedelta(days=7)
+    assert next_class_time("Monday", "09:01", now) == now.replace(minute=1)
+
+
+def test_sunday_to_monday_wrap():
+    now = MONDAY.replace(hour=23) - timedelta(days=1)  # 일요일 23:00
+    assert now.weekday() == 6
+    assert next_alarm_time("Monday", "09:00", 10, now) == MONDAY.replace(hour=8, minute=50)
+    assert next_class_time("월요일", "09:00", now) == MONDAY.replace(hour=9)
+
+
+def test_notify_window_crossing_midnight():
+    # 월요일 00:05 수업, 10분 전 알람 → 일요일 23:55
+    now = MONDAY - timedelta(days=1, hours=12)  # 일요일 12:00
+    alarm = next_alarm_time("Monday", "00:05", 10, now)
+    assert alarm == MONDAY - timedelta(minutes=5)
+    assert alarm.weekday() == 6
+
+    # 일요일 23:55가 지났으면 다음 주 일요일 23:55
+    later = MONDAY - timedelta(minutes=4)
+    assert next_alarm_time("Monday", "00:05", 10, later) == alarm + timedelta(days=7)
+
+
+def test_unknown_day_or_empty_time():
+    assert next_alarm_time("Someday", "09:00", 5, MONDAY) is None
+    assert next_alarm_time("Monday", "", 5, MONDAY) is None
+    assert next_class_time("Someday", "09:00", MONDAY) is None
+
+
+@pytest.fixture
+def new_york_tz():
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time.tzset 없음")
+    previous = os.environ.get('TZ')
+    os.environ['TZ'] = 'America/New_York'
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = previous
+    time.tzset()
+
+
+def test_dst_transition_keeps_wall_clock_time(new_york_tz):
+    # 2026-03-08(일) 02:00에 서머타임 시작 - 전후 주 모두 09:00 알람, 실제 간격은 7일 - 1시간
+    before = datetime(2026, 3, 1, 10, 0)  # 일요일, 이번 주 알람은 지남
+    alarm = next_alarm_time("Sunday", "09:05", 5, before)
+    assert alarm == datetime(2026, 3, 8, 9, 0)
+
+    previous_alarm = datetime(2026, 3, 1, 9, 0)
+    assert to_millis(alarm) - to_millis(previous_alarm) == (7 * 24 - 1) * 60 * 60 * 1000
+
+
+def test_queue_orders_by_next_fire_time():
+    queue = RecurringAlarmQueue()
+    now = MONDAY.replace(hour=8)
+    queue.add("b", "Tuesday", "09:00", 5, payload="B", now=now)
+    queue.add("a", "Monday", "10:00", 5, payload="A", now=now)
+    fire_time, alarm_id, payload = queue.next_due()
+    assert (fire_time, alarm_id, payload) == (MONDAY.replace(hour=9, minute=55), "a", "A")
+    assert len(queue) == 2
+
+
+def test_queue_remove_is_lazy_and_skipped():
+    queue = RecurringAlarmQueue()
+    now = MONDAY.replace(hour=8)
+    queue.add("a", "Monday", "10:00", 5, now=now)
+    queue.add("b", "Tuesday", "09:00", 5, now=now)
+    assert queue.remove("a")
+    assert not queue.remove("a")
+    assert "a" not in queue
+    assert queue.next_due()[1] == "b"
+    # 삭제된 항목은 힙에서 꺼낼 때 정리됨
+    assert len(queue._heap) == 1
+
+
+def test_queue_replacing_alarm_invalidates_old_entry():
+    queue = RecurringAlarmQueue()
+    now = MONDAY.replace(hour=8)
+    queue.add("a", "Monday", "10:00", 5, now=now)
+    queue.add("a", "Wednesday", "10:00", 5, now=now)
+    assert len(queue) == 1
+    assert queue.next_due()[0] == MONDAY.replace(hour=9, minute=55) + timedelta(days=2)
+
+
+def test_queue_pop_due_then_reschedule_moves_to_next_week():
+    queue = RecurringAlarmQueue()
+    now = MONDAY.replace(hour=8)
+    first = queue.add("a", "Monday", "09:00", 5, payload="A", now=now)
+
+    assert queue.pop_due(now) == []
+    due = queue.pop_due(first)
+    assert due == [("a", first, "A")]
+    # 꺼낸 알람은 등록 상태로 남고, 다시 예약할 때까지 큐에 없음
+    assert "a" in queue
+    assert queue.next_due() is None
+
+    # 울린 시각과 같은 now로 다시 예약해도 같은 시각으로 잡히지 않음
+    assert queue.reschedule("a", now=first) == first + timedelta(days=7)
+
+
+def test_queue_retry_at_overrides_weekly_time():
+    queue = RecurringAlarmQueue()
+    now = MONDAY.replace(hour=8)
+    queue.add("a", "Monday", "09:00", 5, now=now)
+    retry = now + timedelta(minutes=1)
+    assert queue.reschedule("a", retry_at=retry) == retry
+    assert queue.pop_due(retry) == [("a", retry, None)]
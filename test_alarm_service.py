@@ -0,0 +1,79 @@
+import importlib.util
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from alarm_schedule import to_millis
+from alarm_store import AlarmStore
+from grid_geometry import WEEK_DAYS
+from platform_backend import SimulatedPlatform, set_platform
+
+SERVICE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "service", "main.py")
+
+
+@pytest.fixture
+def service():
+    spec = importlib.util.spec_from_file_location("alarm_service", SERVICE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def platform():
+    simulated = SimulatedPlatform()
+    set_platform(simulated)
+    yield simulated
+    set_platform(None)
+
+
+def alarm_record(class_start, minutes_before, fire_time):
+    return {
+        'class_data': {
+            'name': "자료구조",
+            'day': WEEK_DAYS[class_start.weekday()],
+            'start_time': class_start.strftime("%H:%M"),
+            'end_time': (class_start + timedelta(hours=1)).strftime("%H:%M"),
+            'room': "61304A",
+            'professor': "김교수"
+        },
+        'minutes_before': minutes_before,
+        'next_alarm_time': to_millis(fire_time)
+    }
+
+
+def make_scheduler(service, tmp_path, record):
+    store = AlarmStore(str(tmp_path / "alarms.db"), notify=False)
+    store.put(1, record)
+    scheduler = service.AlarmScheduler(store)
+    if scheduler.signal_socket is not None:
+        scheduler.signal_socket.close()
+        scheduler.signal_socket = None
+    return scheduler
+
+
+def test_overdue_alarm_fires_after_reload(service, platform, tmp_path):
+    # 알람 시각(2분 전)이 지났지만 수업은 3분 뒤 - 늦게 깨어나도 다음 주로 넘기지 않고 울림
+    now = datetime.now().replace(second=0, microsecond=0)
+    class_start = now + timedelta(minutes=3)
+    fire_time = class_start - timedelta(minutes=5)
+    scheduler = make_scheduler(service, tmp_path, alarm_record(class_start, 5, fire_time))
+
+    assert scheduler.queue.next_due()[0] == fire_time
+    assert scheduler.fire_due(datetime.now()) == 1
+    assert len(platform.notifications) == 1
+    # 울린 뒤에는 다음 주로
+    assert scheduler.queue.next_due()[0] == fire_time + timedelta(days=7)
+    assert scheduler.store.get(1)['next_alarm_time'] == to_millis(fire_time + timedelta(days=7))
+
+
+def test_stale_alarm_is_not_fired(service, platform, tmp_path):
+    # 수업이 끝난 지 오래된 알람 시각은 다음 주로 넘김
+    class_start = datetime.now().replace(second=0, microsecond=0) - timedelta(hours=2)
+    fire_time = class_start - timedelta(minutes=5)
+    scheduler = make_scheduler(service, tmp_path, alarm_record(class_start, 5, fire_time))
+
+    assert scheduler.fire_due(datetime.now()) == 0
+    assert platform.notifications == []
+    assert scheduler.queue.next_due()[0] == fire_time + timedelta(days=7)
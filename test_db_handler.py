@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from db_handler import SQLiteTimeTableStorage, TimeTableStorage
+
+
+def make_class(class_id, day="Monday"):
+    return {
+        'id': class_id,
+        'name': f"과목 {class_id}",
+        'day': day,
+        'start_time': "09:00",
+        'end_time': "10:00",
+        'room': "",
+        'professor': "",
+        'color': (1.0, 0.0, 0.0, 1.0),
+        'notify_before': 5
+    }
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    # 저장소 경로(~/.timetable_app)를 임시 디렉토리로
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path
+
+
+def write_journal_only(classes):
+    """스냅샷 없이 저널에만 과목이 있는 상태 만들기"""
+    storage = TimeTableStorage(journal=True)
+    storage.load_classes()
+    storage.save_classes(classes)
+    if os.path.exists(storage.data_file):
+        os.remove(storage.data_file)
+    return storage
+
+
+def test_journal_only_timetable_is_migrated(home):
+    storage = write_journal_only({1: make_class(1), 2: make_class(2, "Friday")})
+    assert not os.path.exists(storage.data_file)
+    assert os.path.exists(storage.journal_file)
+
+    sqlite_storage = SQLiteTimeTableStorage()
+    try:
+        assert sorted(sqlite_storage.load_classes()) == [1, 2]
+        assert sqlite_storage._get_meta("json_imported") not in (None, "none")
+    finally:
+        sqlite_storage.close()
+
+
+def test_unreadable_json_is_not_marked_imported(home):
+    storage = TimeTableStorage()
+    with open(storage.data_file, 'w', encoding='utf-8') as f:
+        f.write("{broken")
+
+    sqlite_storage = SQLiteTimeTableStorage()
+    try:
+        assert sqlite_storage.load_classes() == {}
+        assert sqlite_storage._get_meta("json_imported") is None
+    finally:
+        sqlite_storage.close()
+
+
+def test_no_json_files_is_marked_none(home):
+    sqlite_storage = SQLiteTimeTableStorage()
+    try:
+        assert sqlite_storage._get_meta("json_imported") == "none"
+    finally:
+        sqlite_storage.close()
@@ -0,0 +1,41 @@
+import pytest
+
+import persistence
+from db_handler import TimeTableStorage
+from test_db_handler import make_class
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path
+
+
+def test_run_later_keeps_only_last_save():
+    writer = persistence.CoalescingWriter(window=60)
+    calls = []
+    writer.run_later("key", lambda: calls.append(1))
+    writer.run_later("key", lambda: calls.append(2))
+    assert calls == [] and writer.has_pending("key")
+    writer.flush()
+    assert calls == [2] and not writer.has_pending()
+
+
+def test_timetable_saves_are_coalesced_and_flushed(home, monkeypatch):
+    monkeypatch.setattr(persistence, 'default_writer', persistence.CoalescingWriter(window=60))
+    storage = TimeTableStorage(journal=True)
+    storage.load_classes()
+
+    saves = []
+    original_save = storage.save_classes
+    monkeypatch.setattr(storage, 'save_classes', lambda data: saves.append(sorted(data)) or original_save(data))
+
+    classes = {}
+    for class_id in (1, 2, 3):
+        classes[class_id] = make_class(class_id)
+        storage.save_classes_later(classes)
+    assert saves == []
+
+    # 불러오기 전에 대기 중인 저장을 먼저 기록
+    assert sorted(TimeTableStorage(journal=True).load_classes()) == [1, 2, 3]
+    assert saves == [[1, 2, 3]]
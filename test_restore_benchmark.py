@@ -0,0 +1,42 @@
+import pytest
+
+from db_handler import create_storage
+from persistence import flush_pending
+from restore_benchmark import MAX_RESTORE_SAVES, counting_saves, make_classes, run_once
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    # run_once가 HOME을 바꾸므로 테스트 뒤 원래대로
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize('backend', ['json', 'sqlite'])
+def test_restore_saves_at_most_once(home, backend):
+    _, saves = run_once(50, backend, str(home))
+    assert saves <= MAX_RESTORE_SAVES
+
+
+@pytest.mark.parametrize('backend', ['json', 'sqlite'])
+def test_deferred_saves_are_counted_per_request(home, backend):
+    # 과목마다 저장하는 회귀 - 지연 저장이 한 번으로 합쳐져도 요청 수만큼 셈
+    storage = create_storage(backend)
+    classes = make_classes(3)
+    with counting_saves(storage) as counter:
+        for _ in classes:
+            storage.save_classes_later(classes)
+        storage.save_classes(classes)
+    flush_pending()
+    assert counter['saves'] == 4
+    assert sorted(storage.load_classes()) == [1, 2, 3]
+    if hasattr(storage, 'close'):
+        storage.close()
+
+
+def test_real_restore_saves_at_most_once(home):
+    pytest.importorskip('kivy')
+    from restore_benchmark import load_app
+    app_main = load_app()
+    _, saves = run_once(50, 'json', str(home), app_main)
+    assert saves <= MAX_RESTORE_SAVES
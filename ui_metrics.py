@@ -0,0 +1,44 @@
+import time
+
+
+class OpenLatencyTracker:
+    """대화상자 열기 지연 시간 측정 - 처음 만들 때(build)와 재사용할 때(reuse)를 나눠서 기록
+
+    show 시작에서 start(), on_open에서 finish()를 호출한다.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.samples = {'build': [], 'reuse': []}
+        self._started = None
+        self._kind = None
+
+    def start(self, built):
+        self._started = time.perf_counter()
+        self._kind = 'build' if built else 'reuse'
+
+    def finish(self):
+        """측정 종료 - 지연 시간(ms) 반환, 진행 중인 측정이 없으면 None"""
+        if self._started is None:
+            return None
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
+        self.samples[self._kind].append(elapsed_ms)
+        self._started = None
+        print(f"⏱️ {self.label} 열기 ({self._kind}): {elapsed_ms:.1f}ms")
+        return elapsed_ms
+
+    def get_stats(self):
+        report = {}
+        for kind, samples in self.samples.items():
+            report[kind] = {
+                'count': len(samples),
+                'avg_ms': sum(samples) / len(samples) if samples else 0.0,
+                'max_ms': max(samples) if samples else 0.0
+            }
+        return report
+
+    def print_stats(self):
+        for kind, stats in self.get_stats().items():
+            if stats['count']:
+                print(f"📊 {self.label} 열기 {kind}: {stats['count']}회, "
+                      f"평균 {stats['avg_ms']:.1f}ms, 최대 {stats['max_ms']:.1f}ms")
@@ -0,0 +1,94 @@
+import math
+
+
+def rects_intersect(a, b):
+    """(left, bottom, right, top) 두 영역이 겹치는지"""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def expand_rect(rect, margin):
+    left, bottom, right, top = rect
+    return left - margin, bottom - margin, right + margin, top + margin
+
+
+def visible_content_rect(scroll_view, margin=0):
+    """ScrollView에서 지금 보이는 영역을 콘텐츠 좌표 (left, bottom, right, top)로 반환
+
+    ScrollView는 콘텐츠 위치를 옮기지 않고 변환 행렬로 스크롤하므로,
+    scroll_x/scroll_y와 크기만으로 계산한다. 콘텐츠가 없으면 None.
+    """
+    if not scroll_view.children:
+        return None
+    content = scroll_view.children[0]
+    scroll_w = max(content.width - scroll_view.width, 0)
+    scroll_h = max(content.height - scroll_view.height, 0)
+    left = content.x + scroll_view.scroll_x * scroll_w
+    bottom = content.y + scroll_view.scroll_y * scroll_h
+    rect = (left, bottom, left + scroll_view.width, bottom + scroll_view.height)
+    return expand_rect(rect, margin) if margin else rect
+
+
+class SpatialGrid:
+    """직사각형 항목을 고정 크기 셀에 나눠 담는 공간 인덱스
+
+    query는 전체 항목 수가 아니라 보이는 영역에 걸친 셀 수와 그 안의 항목 수에만 비례한다.
+    """
+
+    def __init__(self, cell_width, cell_height):
+        self.cell_width = max(float(cell_width), 1.0)
+        self.cell_height = max(float(cell_height), 1.0)
+        self._cells = {}  # (col, row) → {item_id}
+        self._rects = {}  # item_id → rect
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, item_id):
+        return item_id in self._rects
+
+    def _cell_range(self, rect):
+        left, bottom, right, top = rect
+        cols = range(math.floor(left / self.cell_width), math.floor(right / self.cell_width) + 1)
+        rows = range(math.floor(bottom / self.cell_height), math.floor(top / self.cell_height) + 1)
+        return cols, rows
+
+    def insert(self, item_id, rect):
+        """항목 등록 (이미 있으면 위치 갱신)"""
+        self.remove(item_id)
+        self._rects[item_id] = rect
+        cols, rows = self._cell_range(rect)
+        for col in cols:
+            for row in rows:
+                self._cells.setdefault((col, row), set()).add(item_id)
+
+    def remove(self, item_id):
+        rect = self._rects.pop(item_id, None)
+        if rect is None:
+            return False
+        cols, rows = self._cell_range(rect)
+        for col in cols:
+            for row in rows:
+                cell = self._cells.get((col, row))
+                if cell is not None:
+                    cell.discard(item_id)
+                    if not cell:
+                        del self._cells[(col, row)]
+        return True
+
+    def clear(self):
+        self._cells.clear()
+        self._rects.clear()
+
+    def get(self, item_id):
+        return self._rects.get(item_id)
+
+    def query(self, rect):
+        """rect와 겹치는 항목 ID 집합"""
+        found = set()
+        cols, rows = self._cell_range(rect)
+        for col in cols:
+            for row in rows:
+                cell = self._cells.get((col, row))
+                if cell:
+                    found.update(cell)
+        return {item_id for item_id in found if rects_intersect(self._rects[item_id], rect)}